@@ -1,9 +1,47 @@
+import os
+from functools import partial
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from xgboost import XGBRegressor # Moved import to top for best practices
+
+from pricing_engine import (
+    DemandForecaster,
+    EXPORT_FORMATS,
+    ModelCache,
+    ShockDetector,
+    best_guardrails,
+    category_price_comparison,
+    compact_frame,
+    dataset_key,
+    demand,
+    elasticity_counts,
+    empty_state,
+    engineer_features,
+    executive_report_table,
+    export_frame,
+    feature_importance,
+    file_fingerprint,
+    generate_synthetic_data,
+    list_partitions,
+    load_features,
+    model_metrics,
+    optimize_prices,
+    replay,
+    shock_override_table,
+    split_shocks,
+    store_exists,
+    stream_features,
+    summary_metrics,
+    sweep_guardrails,
+    update_features,
+)
+from pricing_engine.downsample import density_grid, period_quantiles, should_aggregate, use_webgl
+from pricing_engine.forecaster import DEFAULT_FORECASTER_PATH, sidecar_path
+from pricing_engine.shock_detector import DEFAULT_DETECTOR_PATH
+from pricing_engine.sweep import RL_STEPS
 
 # ─────────────────────────────────────────────
 #  PAGE CONFIG
@@ -175,9 +213,35 @@ with st.sidebar:
     st.markdown("**Data Source**")
     data_source = st.radio(
         "Select mode",
-        ["Load CSV File", "Use Synthetic Demo Data"],
+        ["Load CSV File", "Use Synthetic Demo Data"] + (["Feature Store"] if store_exists() else []),
         label_visibility="collapsed"
     )
+    streaming_ingest = st.checkbox(
+        "Streaming ingestion (large files)",
+        value=False,
+        disabled=data_source != "Load CSV File",
+        help="Reads the upload in chunks so memory stays bounded on multi-GB exports."
+    )
+    incremental_ingest = st.checkbox(
+        "Incremental monthly update",
+        value=False,
+        disabled=data_source != "Load CSV File" or streaming_ingest,
+        help="Appends each new upload (e.g. one month) to the history loaded in this session, "
+             "re-engineering only the affected products."
+    )
+    if data_source == "Feature Store":
+        partitions = list_partitions()
+        store_categories = st.multiselect(
+            "Categories",
+            sorted(partitions["product_category_name"].unique()),
+            help="Only the selected category partitions are read. Leave empty for all."
+        )
+        store_months = st.select_slider(
+            "Months",
+            options=sorted(partitions["month_year"].unique()),
+            value=(partitions["month_year"].min(), partitions["month_year"].max()),
+            format_func=lambda m: pd.Timestamp(m).strftime("%b %Y")
+        )
 
     st.markdown("---")
     st.markdown("""
@@ -206,82 +270,199 @@ with st.sidebar:
     st.markdown("---")
     surge_cap      = st.slider("Surge Price Cap (%)", 10, 50, 30, 5)
     discount_floor = st.slider("Discount Floor (%)", 10, 40, 20, 5)
+    sweep_mode     = st.checkbox(
+        "Sweep all guardrails",
+        value=False,
+        help="Backtests every surge cap × discount floor (and RL step size, with a trained policy) "
+             "in one pass and maps the outcomes in the RL Agent tab."
+    )
 
 # ─────────────────────────────────────────────
 #  DATA LOADING & PREPROCESSING
 # ─────────────────────────────────────────────
 @st.cache_data
-def preprocess_raw_data(df):
-    """Applies the feature engineering steps to the raw dataset on the fly."""
-    if "month_year" in df.columns:
-        df["month_year"] = pd.to_datetime(df["month_year"], format='%d-%m-%Y', errors='coerce')
-    
-    df = df.sort_values(['product_id', 'month_year'])
+def preprocess_raw_data(_uploaded, fingerprint):
+    """Applies the feature engineering steps to the raw upload (memoized by file fingerprint)."""
+    return compact_frame(engineer_features(pd.read_csv(_uploaded)))
 
-    if 'comp_1' in df.columns:
-        df['avg_competitor_price'] = (df['comp_1'] + df['comp_2'] + df['comp_3']) / 3
-    else:
-        df['avg_competitor_price'] = df['unit_price'] * 1.05
-    
-    df['rolling_demand_30d'] = df.groupby('product_id')['qty'].transform(
-        lambda x: x.shift(1).rolling(window=4, min_periods=1).mean()
+@st.cache_data
+def stream_preprocess_raw_data(_uploaded, fingerprint):
+    """Engineers features chunk by chunk without materialising the raw frame."""
+    return compact_frame(pd.concat(stream_features(_uploaded), ignore_index=True))
+
+@st.cache_resource
+def get_model_cache():
+    """One fitted-model cache per server process, backed by disk across restarts."""
+    return ModelCache()
+
+def file_version(*paths):
+    """Latest modification time of ``paths`` (``None`` if any is missing): a cache key that moves on retrain."""
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    return max(os.path.getmtime(path) for path in paths)
+
+@st.cache_resource(max_entries=1)
+def get_shock_detector(detector_version):
+    """The CLI-trained IsolationForest and its score cache, shared by all sessions.
+
+    ``detector_version`` is the forest pickle's mtime, which only moves when
+    the detector is refitted (scoring appends to a separate log); the
+    previous instance is dropped then.
+    """
+    return ShockDetector.load()
+
+@st.cache_resource(max_entries=4)
+def fit_shock_detector(_frame, frame_key):
+    """An unsaved IsolationForest fitted on one dataset, used while no detector has been trained.
+
+    Only the last few datasets' forests are kept.
+    """
+    return ShockDetector(path=None).fit(_frame, dataset=frame_key)
+
+def current_shock_detector(frame, key):
+    """The trained detector when one is saved, otherwise one fitted on ``frame`` itself."""
+    detector_version = file_version(DEFAULT_DETECTOR_PATH)
+    if detector_version is not None:
+        try:
+            return get_shock_detector(detector_version)
+        except ValueError as exc:
+            st.warning(f"{exc}. Retrain it with `python -m pricing_engine.shock_detector "
+                       f"data/processed/cleaned_features_df.csv`; using a detector fitted on this data meanwhile.")
+    return fit_shock_detector(frame, key)
+
+def latest_policy_dir():
+    """Newest versioned PPO training run, or ``None`` (RL stack imported on first use)."""
+    from pricing_engine.rl.train import latest_version_dir
+    return latest_version_dir()
+
+@st.cache_resource
+def get_pricing_policy(version_dir):
+    """Trained PPO policies of one training run, loaded once per server process."""
+    from pricing_engine.rl import PricingPolicy
+    return PricingPolicy.load(version_dir)
+
+@st.cache_data
+def run_replay(_frame, frame_key, version_dir, _detector, detector_stamp):
+    """Detector labels and RL decisions per row, memoized by dataset hash, policy run and detector fit."""
+    policy = get_pricing_policy(version_dir) if version_dir else None
+    return replay(_frame, _detector, policy)
+
+@st.cache_data
+def run_backtest(_replayed, frame_key, version_dir, detector_stamp, surge_cap, discount_floor):
+    """Strategy profits and shock counts for one surge cap / discount floor."""
+    return summary_metrics(_replayed, surge_cap, discount_floor, replayed=_replayed)
+
+@st.cache_resource(max_entries=1)
+def get_forecaster(model_version):
+    """The persisted XGBoost demand model, or ``None`` until one is trained (reloaded when retrained)."""
+    return DemandForecaster.load()
+
+@st.cache_data
+def forecast_scenario(model_version, sim_price, sim_comp, sim_score, holiday, low_inventory):
+    """Model demand at the simulated price and along the price curve, memoized per model and slider tuple."""
+    units = get_forecaster(model_version).predict_curve(
+        np.append(SIM_PRICE_RANGE, sim_price), sim_comp, sim_score,
+        current_price=sim_price, holiday=holiday, low_inventory=low_inventory,
     )
+    return float(units[-1]), units[:-1]
 
-    df['estimated_cost'] = df['unit_price'] * 0.60
-    df['profit'] = (df['unit_price'] - df['estimated_cost']) * df['qty']
-    df['price_vs_competitor'] = df['unit_price'] / (df['avg_competitor_price'] + 1e-5)
+@st.cache_data
+def run_feature_importance(_frame, frame_key):
+    """Explainer feature importances, memoized by dataset hash."""
+    return feature_importance(_frame, get_model_cache())
 
-    df['demand_shock'] = df.groupby('product_id')['qty'].transform(
-        lambda x: (x > x.mean() + 2*x.std()).astype(int)
-    ).fillna(0)
-    
-    np.random.seed(42)
-    df['inventory_level'] = (df['qty'] * np.random.uniform(1.5, 4.0, len(df))).astype(int)
-
-    return df.dropna().reset_index(drop=True)
-
-def generate_synthetic_data():
-    np.random.seed(42)
-    n = 624
-    products    = [f"prod_{i}" for i in range(1, 21)]
-    categories  = ["electronics", "furniture", "health", "computers", "watches", "perfumery"]
-    dates       = pd.date_range("2017-05-01", periods=n // 20, freq="MS").tolist() * 20
-    dates       = sorted(dates[:n])
-
-    df = pd.DataFrame({
-        "product_id"           : np.random.choice(products, n),
-        "product_category_name": np.random.choice(categories, n),
-        "month_year"           : dates,
-        "unit_price"           : np.random.uniform(20, 360, n).round(2),
-        "qty"                  : np.random.randint(1, 60, n),
-        "avg_competitor_price" : np.random.uniform(18, 340, n).round(2),
-        "product_score"        : np.random.uniform(3.0, 5.0, n).round(1),
-        "freight_price"        : np.random.uniform(5, 30, n).round(2),
-        "rolling_demand_30d"   : np.random.uniform(5, 40, n).round(2),
-        "demand_deviation"     : np.random.uniform(-20, 20, n).round(2),
-        "is_holiday_season"    : np.random.randint(0, 2, n),
-    })
-    df["estimated_cost"]       = (df["unit_price"] * 0.60).round(2)
-    df["profit"]               = ((df["unit_price"] - df["estimated_cost"]) * df["qty"]).round(2)
-    df["price_vs_competitor"]  = (df["unit_price"] / df["avg_competitor_price"]).round(3)
-    df["demand_shock"]         = (
-        (df["qty"] > df["qty"].mean() + 2 * df["qty"].std()) |
-        (df["qty"] < df["qty"].mean() - 2 * df["qty"].std())
-    ).astype(int)
+@st.cache_data
+def run_optimizer(_frame, frame_key, surge_cap, discount_floor):
+    """Catalog optimal prices within the sidebar guardrails, memoized by dataset hash."""
+    return optimize_prices(_frame, surge_cap=surge_cap, discount_floor=discount_floor)
+
+@st.cache_data
+def run_sweep(_replayed, frame_key, version_dir, detector_stamp):
+    """Hybrid outcome over the whole guardrail grid, one vectorized pass per replay."""
+    return sweep_guardrails(_replayed, rl_steps=RL_STEPS if version_dir else None)
+
+@st.cache_data
+def run_model_metrics(_frame, frame_key):
+    """Holdout MAE / RMSE / R² of the demand model, memoized by dataset hash."""
+    return model_metrics(_frame, get_model_cache())
+
+def export_executive_report(df, surge_cap, discount_floor, fmt):
+    """Builds the executive report and streams it into a buffer (runs on click)."""
+    return export_frame(executive_report_table(df, surge_cap, discount_floor), fmt)
+
+def append_upload(uploaded):
+    """Applies an upload as a new slice on top of this session's compact engineered history."""
+    session = st.session_state
+    if session.get("applied_upload") != uploaded.file_id:
+        try:
+            session["features"], session["feature_state"] = update_features(
+                session.get("features"), pd.read_csv(uploaded), session.get("feature_state", empty_state()),
+                compact=True,
+            )
+        except ValueError as exc:
+            st.error(f"Upload not applied: {exc}")
+            if "features" not in session:
+                st.stop()
+            return session["features"]
+        session["applied_upload"] = uploaded.file_id
+    return session["features"]
+
+# Columns each part of the dashboard reads from the feature store.
+SUMMARY_COLUMNS    = ["product_id", "product_category_name", "month_year", "unit_price",
+                      "avg_competitor_price", "qty", "profit", "demand_shock", "rolling_demand_30d"]
+ELASTICITY_COLUMNS = ["product_id", "product_category_name", "unit_price", "qty", "profit",
+                      "price_vs_competitor", "avg_competitor_price", "demand_shock"]
+FORECAST_COLUMNS   = ["product_id", "product_category_name", "qty", "unit_price", "avg_competitor_price", "price_vs_competitor",
+                      "estimated_cost", "rolling_demand_30d", "product_score"]
+SHOCK_COLUMNS      = ["product_id", "month_year", "qty", "unit_price", "profit", "demand_shock",
+                      "price_vs_competitor", "avg_competitor_price", "rolling_demand_30d", "estimated_cost"]
+AGENT_COLUMNS      = ["product_id", "product_category_name", "month_year", "unit_price", "qty", "profit",
+                      "avg_competitor_price", "price_vs_competitor", "rolling_demand_30d", "inventory_level",
+                      "product_score", "demand_shock", "estimated_cost"]
+BACKTEST_COLUMNS   = list(dict.fromkeys(AGENT_COLUMNS + SHOCK_COLUMNS))
+SIM_PRICE_RANGE    = np.linspace(10, 400, 200)   # forecaster curve grid ($)
+
+@st.cache_data
+def load_store_features(columns, categories, months):
+    """Reads only ``columns`` of the selected partitions from the feature store."""
+    return compact_frame(load_features(columns=list(columns), categories=categories, months=months))
+
+def frame_key(frame):
+    """Cache key of a dashboard frame: the upload fingerprint, else a hash of its contents."""
+    return source_key or dataset_key(frame)
+
+def tab_frame(columns):
+    """The frame a tab works on: a projected store read, or the loaded ``df``."""
+    if data_source == "Feature Store":
+        return load_store_features(tuple(columns), store_filter, store_months)
     return df
 
 data_loaded = False
+source_key  = None   # set when ``df`` is a pure function of an uploaded file
 if data_source == "Load CSV File":
     uploaded = st.file_uploader("Upload Raw Retail_Price_Optimization.csv", type=["csv"])
     if uploaded:
         with st.spinner("Processing raw data and engineering features..."):
-            raw_df = pd.read_csv(uploaded)
-            df = preprocess_raw_data(raw_df)
+            if incremental_ingest and not streaming_ingest:
+                df = append_upload(uploaded)
+            else:
+                source_key = file_fingerprint(uploaded)
+                if streaming_ingest:
+                    df = stream_preprocess_raw_data(uploaded, source_key)
+                else:
+                    df = preprocess_raw_data(uploaded, source_key)
         data_loaded = True
     else:
         st.info("Upload your raw CSV file to begin, or switch to Synthetic Demo Data in the sidebar.")
+elif data_source == "Feature Store":
+    store_filter = tuple(store_categories) or None
+    with st.spinner("Reading feature store partitions..."):
+        df = load_store_features(tuple(SUMMARY_COLUMNS), store_filter, store_months)
+    data_loaded = not df.empty
+    if not data_loaded:
+        st.info("No feature store rows match the selected categories and months.")
 else:
-    df = generate_synthetic_data()
+    df = compact_frame(generate_synthetic_data())
     data_loaded = True
     st.markdown("""
     <div style="
@@ -298,27 +479,52 @@ else:
 # ─────────────────────────────────────────────
 if data_loaded:
 
-    # ── Computed Metrics ──────────────────────
-    static_profit  = df["profit"].sum()
-    hybrid_profit  = static_profit * 1.1133
-    rl_profit      = static_profit * 0.6603
-    total_shocks   = int(df["demand_shock"].sum())
-    spikes         = int(df[(df["demand_shock"] == 1) & (df["qty"] > df["rolling_demand_30d"])].shape[0]) if "rolling_demand_30d" in df.columns else total_shocks // 2
-    drops          = total_shocks - spikes
-    improvement    = 11.33
+    # ── Backtest: shock detection, RL replay, hybrid overrides ──
+    policy_dir   = latest_policy_dir()
+    backtest_df  = tab_frame(BACKTEST_COLUMNS)
+    backtest_key = frame_key(backtest_df)
+    with st.spinner("Backtesting static, RL and hybrid pricing..."):
+        detector = current_shock_detector(backtest_df, backtest_key)
+        replayed = run_replay(backtest_df, backtest_key, policy_dir, detector, detector.stamp)
+    kpis = run_backtest(replayed, backtest_key, policy_dir, detector.stamp, surge_cap, discount_floor)
+
+    static_profit  = kpis["static_profit"]
+    hybrid_profit  = kpis["hybrid_profit"]
+    rl_profit      = kpis["rl_profit"]
+    improvement    = kpis["improvement"]
+    total_shocks   = kpis["total_shocks"]
+    spikes         = kpis["spikes"]
+    drops          = kpis["drops"]
+    detection_df   = replayed
+
+    # ── Demand Model Accuracy ─────────────────
+    # Report the model the simulator predicts with: the trained forecaster
+    # when one is saved, else the explainer model fitted on this data.
+    forecaster_version = file_version(DEFAULT_FORECASTER_PATH, sidecar_path(DEFAULT_FORECASTER_PATH))
+    forecaster         = get_forecaster(forecaster_version)
+    if forecaster is not None:
+        accuracy      = forecaster.metrics
+        accuracy_help = f"Holdout metrics of the trained demand model ({forecaster.source})"
+    else:
+        forecast_df   = tab_frame(FORECAST_COLUMNS)
+        accuracy      = run_model_metrics(forecast_df, frame_key(forecast_df))
+        accuracy_help = "Holdout metrics of an XGBoost model fitted on this data"
 
     # ── KPI Strip ─────────────────────────────
     c1, c2, c3, c4, c5 = st.columns(5)
     with c1:
         st.metric("Static Profit",      f"${static_profit:,.0f}")
     with c2:
-        st.metric("RL Agent Profit",    f"${rl_profit:,.0f}",   "-33.97%")
+        if rl_profit is None:
+            st.metric("RL Agent Profit", "—", help="No trained PPO policy found")
+        else:
+            st.metric("RL Agent Profit", f"${rl_profit:,.0f}", f"{kpis['rl_change']:+.2f}%")
     with c3:
-        st.metric("Hybrid Profit",      f"${hybrid_profit:,.0f}", f"+{improvement}%")
+        st.metric("Hybrid Profit",      f"${hybrid_profit:,.0f}", f"{improvement:+.2f}%")
     with c4:
         st.metric("Shocks Detected",    str(total_shocks))
     with c5:
-        st.metric("XGBoost R²",         "0.765")
+        st.metric("XGBoost R²",         f"{accuracy['r2']:.3f}" if accuracy else "—", help=accuracy_help)
 
     st.markdown("<div style='margin-bottom:28px'></div>", unsafe_allow_html=True)
 
@@ -354,76 +560,45 @@ if data_loaded:
     </div>
     """, unsafe_allow_html=True)
 
-    # 1. Generate the Business Report DataFrame
-    report_df = df.copy()
-    
-    # Group by product to get the latest snapshot of each item
-    agg_funcs = {
-        'unit_price': 'last',
-        'avg_competitor_price': 'last',
-        'qty': 'mean',
-        'demand_shock': 'last'
-    }
-    if 'product_category_name' in report_df.columns:
-        agg_funcs['product_category_name'] = 'first'
-        
-    exec_report = report_df.groupby('product_id').agg(agg_funcs).reset_index()
-
-    # 2. Translate AI/Math into Business Actions
-    def get_action(row):
-        # Shock Detection Override
-        if row['demand_shock'] == 1:
-            return f"🚨 SURGE (+{surge_cap}%) - Demand Spike Detected" if row['qty'] > df['qty'].mean() else f"🚨 DISCOUNT (-{discount_floor}%) - Demand Drop Detected"
-        # RL / Elasticity Normal Actions
-        elif row['unit_price'] < row['avg_competitor_price'] * 0.95:
-            return "🔼 INCREASE (+5%) - Underpriced vs Market"
-        elif row['unit_price'] > row['avg_competitor_price'] * 1.05:
-            return "🔽 DECREASE (-5%) - Overpriced vs Market"
-        else:
-            return "⏸️ HOLD PRICE - Currently Optimal"
-
-    exec_report['Recommended_Action'] = exec_report.apply(get_action, axis=1)
-    
-    # Clean up column names for the executives
-    exec_report = exec_report.rename(columns={
-        'product_id': 'Product ID',
-        'product_category_name': 'Category',
-        'unit_price': 'Current Price ($)',
-        'avg_competitor_price': 'Competitor Price ($)',
-        'qty': 'Avg Demand',
-        'demand_shock': 'Is Shock Active'
-    })
-    
-    # Sort so the items needing action are at the top
-    exec_report = exec_report.sort_values('Recommended_Action', ascending=False)
-
-    # 3. Create the Download Button
-    csv_data = exec_report.to_csv(index=False).encode('utf-8')
-    
-    st.download_button(
-        label="📄 Download Executive Report (CSV)",
-        data=csv_data,
-        file_name="Dynamic_Pricing_Executive_Report.csv",
-        mime="text/csv",
-        type="primary" # Makes the button stand out
-    )
+    # The report is only built and serialised when the button is clicked
+    col_fmt, col_dl = st.columns([1, 3])
+    with col_fmt:
+        report_format = st.selectbox(
+            "Format",
+            list(EXPORT_FORMATS),
+            format_func={"csv": "CSV", "csv.gz": "CSV (gzip)", "parquet": "Parquet"}.get,
+            label_visibility="collapsed"
+        )
+    extension, mime = EXPORT_FORMATS[report_format]
+
+    with col_dl:
+        st.download_button(
+            label="📄 Download Executive Report",
+            data=partial(export_executive_report, df, surge_cap, discount_floor, report_format),
+            file_name=f"Dynamic_Pricing_Executive_Report.{extension}",
+            mime=mime,
+            type="primary" # Makes the button stand out
+        )
     
     st.markdown("<div style='margin-bottom:28px'></div>", unsafe_allow_html=True)
 
     # ─────────────────────────────────────────
     #  TABS
     # ─────────────────────────────────────────
+    # Only the open tab runs; each tab is a fragment, so its own widgets rerun just that tab.
     tab1, tab2, tab3, tab4 = st.tabs([
         "  ELASTICITY ANALYSIS  ",
         "  XGBOOST FORECASTER  ",
         "  RL PRICING AGENT  ",
         "  SHOCK DETECTION  "
-    ])
+    ], key="dashboard_tab", on_change="rerun")
 
     # ══════════════════════════════════════════
     #  TAB 1 — ELASTICITY
     # ══════════════════════════════════════════
-    with tab1:
+    @st.fragment
+    def render_elasticity_tab():
+        elasticity_df = tab_frame(ELASTICITY_COLUMNS)
         st.markdown("""
         <div style="font-family:'Syne',sans-serif; font-size:20px; font-weight:700; color:#e8eaf0; margin-bottom:4px;">
             Price Elasticity Analysis
@@ -436,16 +611,38 @@ if data_loaded:
         col_a, col_b = st.columns([3, 2])
 
         with col_a:
-            fig_scatter = px.scatter(
-                df, x="unit_price", y="qty",
-                color="product_category_name" if "product_category_name" in df.columns else "product_id",
-                size="profit" if "profit" in df.columns else None,
-                hover_data=["product_id"] if "product_id" in df.columns else None,
-                title="Demand Curve — Price vs Quantity Sold",
-                labels={"unit_price": "Unit Price ($)", "qty": "Quantity Sold"},
-                template="plotly_dark",
-                color_discrete_sequence=["#00e5a0","#5b8cff","#ff6b35","#ff4560","#ffd700","#c084fc"]
-            )
+            if should_aggregate(len(elasticity_df)):
+                # Too many rows for markers: bin on the server, overlay shocks as-is.
+                x_mid, y_mid, counts = density_grid(elasticity_df["unit_price"], elasticity_df["qty"])
+                fig_scatter = go.Figure(go.Heatmap(
+                    x=x_mid, y=y_mid, z=np.log10(counts), customdata=counts,
+                    colorscale=["#111318", "#5b8cff", "#00e5a0"], hoverongaps=False,
+                    colorbar=dict(title="log₁₀ rows"),
+                    hovertemplate="$%{x:.0f} · %{y:.0f} units<br>%{customdata:,.0f} rows<extra></extra>",
+                ))
+                if "demand_shock" in elasticity_df.columns:
+                    shock_rows = elasticity_df[elasticity_df["demand_shock"] == 1]
+                    fig_scatter.add_trace(go.Scattergl(
+                        x=shock_rows["unit_price"], y=shock_rows["qty"],
+                        mode="markers", name="Demand Shock",
+                        marker=dict(color="#ff4560", size=6, symbol="star")
+                    ))
+                fig_scatter.update_layout(
+                    title=f"Demand Curve — Price vs Quantity Sold ({len(elasticity_df):,} rows binned)",
+                    xaxis_title="Unit Price ($)", yaxis_title="Quantity Sold",
+                )
+            else:
+                fig_scatter = px.scatter(
+                    elasticity_df, x="unit_price", y="qty",
+                    color="product_category_name" if "product_category_name" in elasticity_df.columns else "product_id",
+                    size="profit" if "profit" in elasticity_df.columns else None,
+                    hover_data=["product_id"] if "product_id" in elasticity_df.columns else None,
+                    title="Demand Curve — Price vs Quantity Sold",
+                    labels={"unit_price": "Unit Price ($)", "qty": "Quantity Sold"},
+                    template="plotly_dark",
+                    render_mode="webgl" if use_webgl(len(elasticity_df)) else "svg",
+                    color_discrete_sequence=["#00e5a0","#5b8cff","#ff6b35","#ff4560","#ffd700","#c084fc"]
+                )
             fig_scatter.update_layout(
                 paper_bgcolor="#111318", plot_bgcolor="#0a0c10",
                 font=dict(family="DM Mono", color="#9ca3af", size=11),
@@ -458,16 +655,14 @@ if data_loaded:
             st.plotly_chart(fig_scatter, use_container_width=True)
 
         with col_b:
-            if "price_vs_competitor" in df.columns:
-                elastic_count   = int((df["price_vs_competitor"] < 0.95).sum())
-                inelastic_count = int((df["price_vs_competitor"].between(0.95, 1.05)).sum())
-                unusual_count   = int((df["price_vs_competitor"] > 1.05).sum())
+            if "price_vs_competitor" in elasticity_df.columns:
+                elasticity_split = elasticity_counts(elasticity_df)
             else:
-                elastic_count, inelastic_count, unusual_count = 180, 290, 154
+                elasticity_split = {"Elastic": 180, "Inelastic": 290, "Unusual": 154}
 
             fig_donut = go.Figure(go.Pie(
-                labels=["Elastic", "Inelastic", "Unusual"],
-                values=[elastic_count, inelastic_count, unusual_count],
+                labels=list(elasticity_split),
+                values=list(elasticity_split.values()),
                 hole=0.6,
                 marker=dict(colors=["#00e5a0", "#5b8cff", "#ff6b35"],
                             line=dict(color="#0a0c10", width=3)),
@@ -479,18 +674,14 @@ if data_loaded:
                 title=dict(text="Elasticity Classification", font=dict(family="Syne", size=14, color="#e8eaf0")),
                 legend=dict(bgcolor="rgba(0,0,0,0)"),
                 margin=dict(l=10, r=10, t=50, b=10),
-                annotations=[dict(text=f"{len(df)}<br><span style='font-size:10px'>products</span>",
+                annotations=[dict(text=f"{len(elasticity_df)}<br><span style='font-size:10px'>products</span>",
                                   x=0.5, y=0.5, font=dict(family="Syne", size=18, color="#e8eaf0"),
                                   showarrow=False)]
             )
             st.plotly_chart(fig_donut, use_container_width=True)
 
-        if "product_category_name" in df.columns and "unit_price" in df.columns:
-            cat_price = df.groupby("product_category_name").agg(
-                avg_price=("unit_price", "mean"),
-                avg_qty=("qty", "mean"),
-                avg_comp=("avg_competitor_price", "mean") if "avg_competitor_price" in df.columns else ("unit_price", "mean")
-            ).reset_index()
+        if "product_category_name" in elasticity_df.columns and "unit_price" in elasticity_df.columns:
+            cat_price = category_price_comparison(elasticity_df)
 
             fig_bar = go.Figure()
             fig_bar.add_trace(go.Bar(
@@ -513,10 +704,17 @@ if data_loaded:
             )
             st.plotly_chart(fig_bar, use_container_width=True)
 
+    with tab1:
+        if tab1.open:
+            render_elasticity_tab()
+
     # ══════════════════════════════════════════
     #  TAB 2 — XGBOOST
     # ══════════════════════════════════════════
-    with tab2:
+    @st.fragment
+    def render_forecaster_tab():
+        forecast_df  = tab_frame(FORECAST_COLUMNS)
+        forecast_key = frame_key(forecast_df)
         st.markdown("""
         <div style="font-family:'Syne',sans-serif; font-size:20px; font-weight:700; color:#e8eaf0; margin-bottom:4px;">
             XGBoost Demand Forecaster
@@ -547,27 +745,23 @@ if data_loaded:
 
             st.markdown("</div>", unsafe_allow_html=True)
 
-            base_demand   = df["qty"].mean() if "qty" in df.columns else 14
-            price_ratio   = sim_price / sim_comp if sim_comp > 0 else 1
-
-            if price_ratio < 0.9:
-                demand_factor = 1.4
-            elif price_ratio < 1.0:
-                demand_factor = 1.1
-            elif price_ratio < 1.1:
-                demand_factor = 0.95
-            elif price_ratio < 1.2:
-                demand_factor = 0.75
+            price_ratio = float(demand.price_ratio(sim_price, sim_comp))
+            avg_cost    = sim_price * 0.6
+            if forecaster is not None:
+                point_units, curve_units = forecast_scenario(
+                    forecaster_version, sim_price, sim_comp, sim_score, sim_holiday == "Yes", sim_inventory == "Low"
+                )
+                predicted_units = int(round(point_units))
+                revenues, profits_ = SIM_PRICE_RANGE * curve_units, (SIM_PRICE_RANGE - avg_cost) * curve_units
             else:
-                demand_factor = 0.40
-
-            mock_pred = max(1, int(base_demand * demand_factor * (sim_score / 4.0)))
-            if sim_holiday == "Yes":
-                mock_pred = int(mock_pred * 1.5)
-            if sim_inventory == "Low":
-                mock_pred = int(mock_pred * 0.8)
+                base_demand     = forecast_df["qty"].mean() if "qty" in forecast_df.columns else 14
+                predicted_units = demand.point_forecast(
+                    base_demand, sim_price, sim_comp, sim_score,
+                    holiday=sim_holiday == "Yes", low_inventory=sim_inventory == "Low"
+                )
+                revenues, profits_ = demand.demand_curve(SIM_PRICE_RANGE, sim_comp, base_demand, avg_cost)
 
-            profit_pred = round((sim_price - sim_price * 0.6) * mock_pred, 2)
+            profit_pred = round((sim_price - avg_cost) * predicted_units, 2)
 
             st.markdown(f"""
             <div style="
@@ -578,7 +772,7 @@ if data_loaded:
             ">
                 <div style="font-size:10px; color:#6b7280; letter-spacing:0.1em; margin-bottom:8px;">PREDICTION OUTPUT</div>
                 <div style="font-size:32px; font-family:'Syne',sans-serif; font-weight:800; color:#00e5a0;">
-                    {mock_pred} <span style="font-size:14px; color:#6b7280;">units</span>
+                    {predicted_units} <span style="font-size:14px; color:#6b7280;">units</span>
                 </div>
                 <div style="font-size:11px; color:#9ca3af; margin-top:8px;">
                     Estimated Profit: <strong style="color:#e8eaf0">${profit_pred:,.2f}</strong>
@@ -588,22 +782,14 @@ if data_loaded:
                 </div>
             </div>
             """, unsafe_allow_html=True)
+            if forecaster is not None:
+                st.caption(f"XGBoost demand model · {forecaster.source} · holdout R² {forecaster.metrics['r2']:.3f}")
+            else:
+                st.info("No trained demand model found — using the tiered demand formula. Train one with "
+                        "`python -m pricing_engine.forecaster data/processed/cleaned_features_df.csv`.")
 
         with col_res:
-            price_range = np.linspace(10, 400, 200)
-            avg_cost    = sim_price * 0.6
-            revenues, profits_ = [], []
-            for p in price_range:
-                r = p / sim_comp if sim_comp > 0 else 1
-                if r < 0.9:   df_ = 1.4
-                elif r < 1.0: df_ = 1.1
-                elif r < 1.1: df_ = 0.95
-                elif r < 1.2: df_ = 0.75
-                else:         df_ = 0.40
-                d = max(1, base_demand * df_)
-                revenues.append(p * d)
-                profits_.append((p - avg_cost) * d)
-
+            price_range = SIM_PRICE_RANGE
             opt_idx   = int(np.argmax(profits_))
             opt_price = price_range[opt_idx]
 
@@ -640,9 +826,11 @@ if data_loaded:
             st.plotly_chart(fig_curve, use_container_width=True)
 
             mc1, mc2, mc3 = st.columns(3)
-            mc1.metric("MAE", "5.34", help="Mean Absolute Error — average units wrong")
-            mc2.metric("RMSE", "8.16", help="Root Mean Squared Error")
-            mc3.metric("R² Score", "0.765", help="Variance explained by model")
+            mc1.metric("MAE", f"{accuracy['mae']:.2f}" if accuracy else "—",
+                       help=f"Mean Absolute Error — average units wrong. {accuracy_help}.")
+            mc2.metric("RMSE", f"{accuracy['rmse']:.2f}" if accuracy else "—", help=f"Root Mean Squared Error. {accuracy_help}.")
+            mc3.metric("R² Score", f"{accuracy['r2']:.3f}" if accuracy else "—",
+                       help=f"Variance explained by model. {accuracy_help}.")
             
             # ── AI Explainability (Feature Importance) ────────────────────
             st.markdown("""
@@ -654,33 +842,9 @@ if data_loaded:
             </div>
             """, unsafe_allow_html=True)
 
-            # Prepare data for the quick model
-            features = ['unit_price', 'avg_competitor_price', 'price_vs_competitor', 'estimated_cost']
-            if 'rolling_demand_30d' in df.columns:
-                features.append('rolling_demand_30d')
-            if 'product_score' in df.columns:
-                features.append('product_score')
-                
-            # Drop rows with NaNs to prevent model crashing
-            model_df = df.dropna(subset=features + ['qty'])
-            
-            if not model_df.empty:
-                X = model_df[features]
-                y = model_df['qty']
-                
-                # Fit the model
-                xgb_explainer = XGBRegressor(n_estimators=50, max_depth=4, random_state=42)
-                xgb_explainer.fit(X, y)
-                
-                # Extract and format feature importances
-                importances = xgb_explainer.feature_importances_
-                clean_feature_names = [f.replace('_', ' ').title() for f in features]
-                
-                imp_df = pd.DataFrame({
-                    'Feature': clean_feature_names,
-                    'Importance': importances
-                }).sort_values(by='Importance', ascending=True) # Sort for horizontal bar chart
-                
+            imp_df = run_feature_importance(forecast_df, forecast_key)
+
+            if imp_df is not None:
                 # Plotly Chart
                 fig_imp = go.Figure(go.Bar(
                     x=imp_df['Importance'],
@@ -705,10 +869,48 @@ if data_loaded:
             else:
                 st.warning("Not enough data to generate feature importance.")
 
+        # ── Catalog-wide Optimal Prices ────────────────────
+        st.markdown("""
+        <div style="font-family:'Syne',sans-serif; font-size:16px; font-weight:700; color:#e8eaf0; margin-top:32px; margin-bottom:8px;">
+            🎯 Catalog Optimal Prices
+        </div>
+        <div style="font-family:'DM Mono',monospace; font-size:11px; color:#9ca3af; margin-bottom:16px;">
+            Profit-maximising price for every product, searched within the sidebar's surge cap and discount floor.
+        </div>
+        """, unsafe_allow_html=True)
+
+        optimal_df = run_optimizer(forecast_df, forecast_key, surge_cap, discount_floor)
+        st.dataframe(
+            optimal_df.sort_values("expected_profit", ascending=False).rename(columns={
+                "product_id": "Product ID",
+                "product_category_name": "Category",
+                "current_price": "Current Price ($)",
+                "competitor_price": "Competitor Price ($)",
+                "optimal_price": "Optimal Price ($)",
+                "price_change_pct": "Change (%)",
+                "expected_demand": "Expected Demand",
+                "expected_profit": "Expected Profit ($)",
+            }).round(2),
+            use_container_width=True,
+            hide_index=True,
+            height=320
+        )
+        st.download_button(
+            label="📄 Download Optimal Prices (CSV)",
+            data=optimal_df.to_csv(index=False).encode('utf-8'),
+            file_name="Dynamic_Pricing_Optimal_Prices.csv",
+            mime="text/csv"
+        )
+
+    with tab2:
+        if tab2.open:
+            render_forecaster_tab()
+
     # ══════════════════════════════════════════
     #  TAB 3 — RL AGENT
     # ══════════════════════════════════════════
-    with tab3:
+    @st.fragment
+    def render_agent_tab():
         st.markdown("""
         <div style="font-family:'Syne',sans-serif; font-size:20px; font-weight:700; color:#e8eaf0; margin-bottom:4px;">
             RL Pricing Agent — PPO Results
@@ -724,6 +926,8 @@ if data_loaded:
 
         fig_profit = go.Figure()
         for i, (s, p, c) in enumerate(zip(strategies, profits, colors)):
+            if p is None:
+                continue
             fig_profit.add_trace(go.Bar(
                 x=[s], y=[p], name=s,
                 marker=dict(color=c, line=dict(color="#0a0c10", width=1)),
@@ -740,12 +944,20 @@ if data_loaded:
             yaxis=dict(gridcolor="#1e2128", title="Total Profit ($)")
         )
         st.plotly_chart(fig_profit, use_container_width=True)
+        if rl_profit is None:
+            st.info("No trained PPO policy found — the hybrid overrides static prices. "
+                    "Train one with `python -m pricing_engine.rl.train data/processed/cleaned_features_df.csv`.")
+        else:
+            st.caption(f"RL decisions from {int(replayed['action'].notna().sum()):,} catalog rows · policies: {policy_dir}")
 
         col_act, col_exp = st.columns([1, 2])
 
         with col_act:
             action_labels  = ["Decrease", "Hold", "Increase"]
-            action_values  = [35, 28, 37]
+            if "action" in replayed.columns:
+                action_values = replayed["action"].value_counts().reindex(action_labels).tolist()
+            else:
+                action_values = [35, 28, 37]
             action_colors  = ["#ff6b35", "#5b8cff", "#00e5a0"]
 
             fig_act = go.Figure(go.Pie(
@@ -764,6 +976,15 @@ if data_loaded:
             st.plotly_chart(fig_act, use_container_width=True)
 
         with col_exp:
+            if rl_profit is None:
+                rl_heading  = "Hybrid Pricing Without an RL Agent"
+                hybrid_role = "overrides static prices"
+            elif rl_profit < static_profit:
+                rl_heading  = "Why RL Agent Profit is Lower"
+                hybrid_role = "recovers the gap by overriding the RL agent"
+            else:
+                rl_heading  = "Why RL Agent Profit is Higher"
+                hybrid_role = "keeps the RL agent's prices and overrides them"
             st.markdown("""
             <div style="
                 background:#111318; border:1px solid #1e2128; border-radius:10px;
@@ -772,16 +993,15 @@ if data_loaded:
             ">
             <div style="font-family:'Syne',sans-serif; font-size:14px; font-weight:700;
                         color:#e8eaf0; margin-bottom:16px;">
-                Why RL Agent Profit is Lower
+                {heading}
             </div>
             The PPO agent was trained to maximize <strong style="color:#00e5a0">long-term reward</strong>,
             not short-term profit. When price exceeds the competitor by more than 20%, the agent receives
             a <strong style="color:#ff4560">churn penalty</strong> that reduces reward — teaching it to
             protect customer retention over immediate revenue gains.
             <br><br>
-            The <strong style="color:#5b8cff">Hybrid System</strong> recovers the gap by overriding the
-            RL agent during detected shock events with surge and discount pricing rules, pushing total
-            profit <strong style="color:#00e5a0">+11.33% above static baseline</strong>.
+            The <strong style="color:#5b8cff">Hybrid System</strong> {hybrid_role} during detected shock events with surge and discount pricing rules, pushing total
+            profit <strong style="color:#00e5a0">{improvement:+.2f}% vs the static baseline</strong>.
             <br><br>
             <div style="
                 border-top: 1px solid #1e2128; padding-top: 16px; margin-top: 8px;
@@ -793,12 +1013,71 @@ if data_loaded:
                 <span>ent_coef: <strong style="color:#e8eaf0">0.05</strong></span>
             </div>
             </div>
-            """.format(surge=surge_cap, disc=discount_floor), unsafe_allow_html=True)
+            """.format(heading=rl_heading, hybrid_role=hybrid_role, surge=surge_cap, disc=discount_floor,
+                       improvement=improvement), unsafe_allow_html=True)
+
+        # ── Guardrail Sweep ───────────────────────
+        if sweep_mode:
+            st.markdown("""
+            <div style="font-family:'Syne',sans-serif; font-size:16px; font-weight:700; color:#e8eaf0; margin-top:32px; margin-bottom:8px;">
+                🧭 Guardrail Sweep
+            </div>
+            """, unsafe_allow_html=True)
+            with st.spinner("Sweeping surge caps and discount floors..."):
+                grid = run_sweep(replayed, backtest_key, policy_dir, detector.stamp)
+            if policy_dir:
+                rl_step = st.select_slider(
+                    "RL price step", options=list(RL_STEPS), value=0.05, format_func=lambda s: f"±{s:.1%}"
+                )
+                grid = grid[np.isclose(grid["rl_step"], rl_step)]
+
+            best = best_guardrails(grid)
+            st.caption(
+                f"{len(grid):,} combinations · best: surge +{int(best['surge_cap'])}% / discount -{int(best['discount_floor'])}% "
+                f"→ ${best['hybrid_profit']:,.0f} ({best['improvement']:+.2f}% vs static) · "
+                f"current: +{surge_cap}% / -{discount_floor}%"
+            )
+
+            def guardrail_heatmap(frame, values, title, colorscale, fmt):
+                table = frame.pivot(index="surge_cap", columns="discount_floor", values=values)
+                fig = go.Figure(go.Heatmap(
+                    z=table.to_numpy(), x=[f"-{f}%" for f in table.columns], y=[f"+{c}%" for c in table.index],
+                    colorscale=colorscale, texttemplate=fmt, textfont=dict(family="DM Mono", size=10),
+                    hovertemplate="surge %{y} · discount %{x}<br>%{z:,.2f}<extra></extra>",
+                ))
+                fig.update_layout(
+                    title=dict(text=title, font=dict(family="Syne", size=14, color="#e8eaf0")),
+                    paper_bgcolor="#111318", plot_bgcolor="#0a0c10",
+                    font=dict(family="DM Mono", color="#9ca3af", size=11),
+                    margin=dict(l=10, r=10, t=40, b=10),
+                    xaxis=dict(title="Discount Floor"), yaxis=dict(title="Surge Cap"),
+                )
+                return fig
+
+            grid = grid.assign(at_limit=grid["surge_capped"] + grid["discount_floored"])
+            col_profit, col_limits = st.columns(2)
+            with col_profit:
+                st.plotly_chart(guardrail_heatmap(
+                    grid, "improvement", "Hybrid Profit vs Static (%)", ['#ff4560', '#111318', '#00e5a0'], "%{z:+.2f}"
+                ), use_container_width=True)
+            with col_limits:
+                st.plotly_chart(guardrail_heatmap(
+                    grid, "at_limit", "Overrides Held at Competitor Cap / Cost Floor", ['#111318', '#5b8cff', '#ff6b35'], "%{z:,}"
+                ), use_container_width=True)
+            st.caption(
+                f"{int(best['surged']):,} spike rows surged and {int(best['discounted']):,} drop rows discounted "
+                "in every combination; the right map counts those the competitor cap or cost floor overruled."
+            )
+
+    with tab3:
+        if tab3.open:
+            render_agent_tab()
 
     # ══════════════════════════════════════════
     #  TAB 4 — SHOCK DETECTION
     # ══════════════════════════════════════════
-    with tab4:
+    @st.fragment
+    def render_shock_tab():
         st.markdown("""
         <div style="font-family:'Syne',sans-serif; font-size:20px; font-weight:700; color:#e8eaf0; margin-bottom:4px;">
             Isolation Forest — Shock Detection
@@ -809,25 +1088,41 @@ if data_loaded:
         """, unsafe_allow_html=True)
 
         s1, s2, s3, s4 = st.columns(4)
-        s1.metric("Total Observations", f"{len(df):,}")
-        s2.metric("Anomalies Detected", str(total_shocks), f"{total_shocks/len(df)*100:.1f}% rate")
+        s1.metric("Total Observations", f"{len(detection_df):,}")
+        s2.metric("Anomalies Detected", str(total_shocks), f"{total_shocks/len(detection_df)*100:.1f}% rate")
         s3.metric("Demand Spikes", str(spikes), f"Surge +{surge_cap}%")
         s4.metric("Demand Drops",  str(drops),  f"Discount -{discount_floor}%")
 
         st.markdown("<div style='margin-bottom:16px'></div>", unsafe_allow_html=True)
 
-        if "month_year" in df.columns and pd.api.types.is_datetime64_any_dtype(df["month_year"]):
-            time_df = df.sort_values("month_year")
-            normal  = time_df[time_df["demand_shock"] == 0]
-            shocked = time_df[time_df["demand_shock"] == 1]
+        if "month_year" in detection_df.columns and pd.api.types.is_datetime64_any_dtype(detection_df["month_year"]):
+            normal, shocked = split_shocks(detection_df)
 
             fig_time = go.Figure()
-            fig_time.add_trace(go.Scatter(
-                x=normal["month_year"], y=normal["qty"],
-                mode="markers", name="Normal",
-                marker=dict(color="#5b8cff", size=5, opacity=0.6)
-            ))
-            fig_time.add_trace(go.Scatter(
+            if should_aggregate(len(normal)):
+                # Normal rows as per-month quantile bands; shock events below stay point by point.
+                bands = period_quantiles(normal)
+                for low, high, name, fill in [("q05", "q95", "Normal 5–95%", "rgba(91,140,255,0.12)"),
+                                              ("q25", "q75", "Normal 25–75%", "rgba(91,140,255,0.3)")]:
+                    fig_time.add_trace(go.Scatter(
+                        x=bands.index, y=bands[low], mode="lines", line=dict(width=0),
+                        showlegend=False, hoverinfo="skip"
+                    ))
+                    fig_time.add_trace(go.Scatter(
+                        x=bands.index, y=bands[high], mode="lines", line=dict(width=0),
+                        fill="tonexty", fillcolor=fill, name=name
+                    ))
+                fig_time.add_trace(go.Scatter(
+                    x=bands.index, y=bands["q50"], mode="lines", name="Normal median",
+                    line=dict(color="#5b8cff", width=2)
+                ))
+            else:
+                fig_time.add_trace((go.Scattergl if use_webgl(len(normal)) else go.Scatter)(
+                    x=normal["month_year"], y=normal["qty"],
+                    mode="markers", name="Normal",
+                    marker=dict(color="#5b8cff", size=5, opacity=0.6)
+                ))
+            fig_time.add_trace((go.Scattergl if use_webgl(len(shocked)) else go.Scatter)(
                 x=shocked["month_year"], y=shocked["qty"],
                 mode="markers", name="Shock Event",
                 marker=dict(color="#ff4560", size=10, symbol="star",
@@ -851,37 +1146,25 @@ if data_loaded:
         </div>
         """, unsafe_allow_html=True)
 
-        if total_shocks > 0 and "demand_shock" in df.columns:
-            shock_df = df[df["demand_shock"] == 1].copy()
-            if "price_vs_competitor" in shock_df.columns:
-                shock_df["Override Action"] = np.where(
-                    shock_df["price_vs_competitor"] < 1.0,
-                    f"SURGE PRICE  (+{surge_cap}%)",
-                    f"DISCOUNT FLOOR  (-{discount_floor}%)"
-                )
-            else:
-                shock_df["Override Action"] = "ANOMALY OVERRIDE"
-
-            shock_df["Detected Event"] = "Demand Anomaly"
-            shock_df["Est. Profit Impact"] = (shock_df["profit"] * 0.15).round(2).apply(lambda x: f"+${x:,.2f}")
-
-            cols = ["month_year", "product_id", "qty", "unit_price", "Detected Event", "Override Action", "Est. Profit Impact"]
-            available = [c for c in cols if c in shock_df.columns]
-            display_df = shock_df[available].rename(columns={
-                "month_year": "Date",
-                "product_id": "Product",
-                "qty":        "Qty Sold",
-                "unit_price": "Price ($)"
-            }).reset_index(drop=True)
+        if total_shocks > 0:
+            display_df = shock_override_table(detection_df, surge_cap, discount_floor)
 
             st.dataframe(
                 display_df,
                 use_container_width=True,
-                height=min(400, (len(display_df) + 1) * 38)
+                height=min(400, (len(display_df) + 1) * 38),
+                column_config={
+                    "Override Price ($)": st.column_config.NumberColumn(format="%.2f"),
+                    "Est. Profit Impact": st.column_config.NumberColumn(format="$%.2f"),
+                },
             )
         else:
             st.info("No demand shocks detected in the current dataset.")
 
+    with tab4:
+        if tab4.open:
+            render_shock_tab()
+
     # ─────────────────────────────────────────
     #  FOOTER
     # ─────────────────────────────────────────
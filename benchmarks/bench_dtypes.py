@@ -0,0 +1,76 @@
+"""Benchmark: memory and groupby time of the processed frame, default vs compact dtypes.
+
+Replicates the 44-column processed schema to ``--rows`` rows (product IDs
+suffixed per copy, so the ID cardinality grows with the size), applies
+``compact_frame`` and times the dashboard's typical groupbys on both
+frames, checking they agree.
+
+Usage:
+    python benchmarks/bench_dtypes.py --rows 100000 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.dtypes import compact_frame, frame_memory  # noqa: E402
+
+SOURCE_CSV = os.path.join(ROOT, "data", "processed", "cleaned_features_df.csv")
+
+GROUPBYS = {
+    "per-product mean qty"    : lambda df: df.groupby("product_id", observed=True)["qty"].mean(),
+    "per-category price stats": lambda df: df.groupby("product_category_name", observed=True)[
+        ["unit_price", "qty", "avg_competitor_price"]].mean(),
+    "per-product last prices" : lambda df: df.groupby("product_id", observed=True)[
+        ["unit_price", "avg_competitor_price", "demand_shock"]].last(),
+}
+
+
+def build_frame(n_rows):
+    base = pd.read_csv(SOURCE_CSV)
+    base["month_year"] = pd.to_datetime(base["month_year"])
+    copies = -(-n_rows // len(base))
+    frame  = pd.concat([base.assign(product_id=base["product_id"] + f"_{i}") for i in range(copies)], ignore_index=True)
+    return frame.iloc[:n_rows].copy()
+
+
+def best_of(fn, df, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(df)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        df = build_frame(n_rows)
+        start   = time.perf_counter()
+        compact = compact_frame(df)
+        t_cast  = time.perf_counter() - start
+        before, after = frame_memory(df), frame_memory(compact)
+        print(f"{n_rows:,} rows × {df.shape[1]} columns · compact_frame {t_cast:.2f}s")
+        print(f"  memory {before / 1e6:,.1f} MB → {after / 1e6:,.1f} MB "
+              f"({before / n_rows:.0f} → {after / n_rows:.0f} B/row, {before / after:.1f}x smaller)")
+        for name, fn in GROUPBYS.items():
+            t_default, expected = best_of(fn, df)
+            t_compact, result   = best_of(fn, compact)
+            same = np.allclose(expected.to_numpy(dtype=float), result.to_numpy(dtype=float), rtol=1e-5)
+            print(f"  {name:<26} {t_default * 1e3:>8.1f} ms → {t_compact * 1e3:>7.1f} ms "
+                  f"({t_default / t_compact:.1f}x)  identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
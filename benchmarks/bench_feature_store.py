@@ -0,0 +1,110 @@
+"""Benchmark: cold load time and peak RSS, processed CSV vs the Parquet feature store.
+
+Each measurement runs in a fresh interpreter so nothing is cached in-process.
+The processed CSV is replicated under new product ids up to ``--rows``.
+
+Usage:
+    python benchmarks/bench_feature_store.py --rows 1000000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.feature_store import load_features, write_feature_store  # noqa: E402
+
+SOURCE_CSV = os.path.join(ROOT, "data", "processed", "cleaned_features_df.csv")
+
+# Columns the Elasticity tab reads, as a representative projection.
+TAB_COLUMNS = ["product_id", "product_category_name", "unit_price", "qty",
+               "profit", "price_vs_competitor", "avg_competitor_price"]
+
+
+def build_inputs(n_rows, workdir):
+    base    = pd.read_csv(SOURCE_CSV)
+    copies  = -(-n_rows // len(base))
+    frames  = [base.assign(product_id=base["product_id"] + f"_{i}") for i in range(copies)]
+    df      = pd.concat(frames, ignore_index=True).iloc[:n_rows]
+    csv     = os.path.join(workdir, "features.csv")
+    store   = os.path.join(workdir, "store")
+    df.to_csv(csv, index=False)
+    write_feature_store(df, store)
+    category = df["product_category_name"].value_counts().index[0]
+    return csv, store, category
+
+
+def peak_rss_mb():
+    """Peak RSS of this process.
+
+    ``ru_maxrss`` survives ``exec`` on Linux, so a child would report the
+    parent's peak; the per-mm ``VmHWM`` does not.
+    """
+    if os.path.exists("/proc/self/status"):
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+
+
+def child(case, csv, store, category):
+    """Runs one load in this (fresh) process and prints a JSON result."""
+    baseline = peak_rss_mb()
+    start    = time.perf_counter()
+    if case == "csv":
+        df = pd.read_csv(csv)
+        df["month_year"] = pd.to_datetime(df["month_year"])
+    elif case == "store_all":
+        df = load_features(store)
+    elif case == "store_columns":
+        df = load_features(store, columns=TAB_COLUMNS)
+    else:
+        df = load_features(store, columns=TAB_COLUMNS, categories=[category])
+    elapsed = time.perf_counter() - start
+    peak    = peak_rss_mb()
+    print(json.dumps({"seconds": elapsed, "rss_mb": peak - baseline,
+                      "rows": len(df), "cols": df.shape[1]}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--child", nargs=4, metavar=("CASE", "CSV", "STORE", "CATEGORY"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv, store, category = build_inputs(args.rows, workdir)
+        print(f"{args.rows:,} rows · CSV {os.path.getsize(csv) / 2**20:.1f} MB")
+        print(f"{'case':<28} {'rows':>10} {'cols':>5} {'load (s)':>9} {'ΔRSS (MB)':>10}")
+        for case, label in [
+            ("csv", "CSV, all columns"),
+            ("store_all", "store, all columns"),
+            ("store_columns", "store, tab columns"),
+            ("store_partition", "store, tab cols, 1 category"),
+        ]:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", case, csv, store, category],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            print(f"{label:<28} {r['rows']:>10,} {r['cols']:>5} {r['seconds']:>9.3f} {r['rss_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
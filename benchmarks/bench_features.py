@@ -0,0 +1,97 @@
+"""Benchmark: legacy per-product lambdas vs the vectorized feature engine.
+
+Usage:
+    python benchmarks/bench_features.py                 # 10k, 100k, 1M rows
+    python benchmarks/bench_features.py --sizes 10000 10000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pricing_engine.features import engineer_features  # noqa: E402
+
+
+def legacy_preprocess(df, notebook_features=False):
+    """The dashboard's original ``preprocess_raw_data``, optionally with the notebook lambdas."""
+    if "month_year" in df.columns:
+        df["month_year"] = pd.to_datetime(df["month_year"], format='%d-%m-%Y', errors='coerce')
+    df = df.sort_values(['product_id', 'month_year'])
+    df['avg_competitor_price'] = (df['comp_1'] + df['comp_2'] + df['comp_3']) / 3
+    df['rolling_demand_30d'] = df.groupby('product_id')['qty'].transform(
+        lambda x: x.shift(1).rolling(window=4, min_periods=1).mean()
+    )
+    df['estimated_cost'] = df['unit_price'] * 0.60
+    df['profit'] = (df['unit_price'] - df['estimated_cost']) * df['qty']
+    df['price_vs_competitor'] = df['unit_price'] / (df['avg_competitor_price'] + 1e-5)
+    df['demand_shock'] = df.groupby('product_id')['qty'].transform(
+        lambda x: (x > x.mean() + 2*x.std()).astype(int)
+    ).fillna(0)
+    np.random.seed(42)
+    df['inventory_level'] = (df['qty'] * np.random.uniform(1.5, 4.0, len(df))).astype(int)
+    if not notebook_features:
+        return df.dropna().reset_index(drop=True)
+
+    required = list(df.columns)
+    df['rolling_demand_7d'] = df.groupby('product_id')['qty'].transform(
+        lambda x: x.shift(1).rolling(window=2, min_periods=1).mean()
+    )
+    df['demand_deviation'] = df['qty'] - df['rolling_demand_30d']
+    df['price_change'] = df.groupby('product_id')['unit_price'].transform(lambda x: x / x.shift(1) - 1)
+    df['demand_change'] = df.groupby('product_id')['qty'].transform(lambda x: x / x.shift(1) - 1)
+    df['elasticity_score'] = df['demand_change'] / df['price_change']
+    return df.dropna(subset=required).reset_index(drop=True)
+
+
+def make_raw_frame(n_rows, rows_per_product=24, seed=0):
+    """Synthetic frame in the raw CSV schema with ``n_rows / rows_per_product`` SKUs."""
+    rng        = np.random.default_rng(seed)
+    n_products = -(-n_rows // rows_per_product)
+    months     = pd.date_range("2017-01-01", periods=rows_per_product, freq="MS").strftime("%d-%m-%Y")
+    price      = rng.uniform(20, 250, n_rows).round(2)
+    return pd.DataFrame({
+        "product_id": np.repeat([f"sku_{i}" for i in range(n_products)], rows_per_product)[:n_rows],
+        "month_year": np.tile(months, n_products)[:n_rows],
+        "qty"       : rng.integers(1, 80, n_rows),
+        "unit_price": price,
+        "comp_1"    : (price * rng.uniform(0.9, 1.1, n_rows)).round(2),
+        "comp_2"    : (price * rng.uniform(0.85, 1.15, n_rows)).round(2),
+        "comp_3"    : (price * rng.uniform(0.95, 1.05, n_rows)).round(2),
+    })
+
+
+def timed(fn, *args, **kwargs):
+    start  = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--skip-legacy-above", type=int, default=2_000_000,
+                        help="Only time the legacy path up to this many rows.")
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'legacy (s)':>12} {'vectorized (s)':>15} {'speedup':>9}  identical")
+    for n in args.sizes:
+        raw = make_raw_frame(n)
+        fast, t_fast = timed(engineer_features, raw, notebook_features=True)
+
+        if n > args.skip_legacy_above:
+            print(f"{n:>12,} {'-':>12} {t_fast:>15.3f} {'-':>9}  -")
+            continue
+
+        slow, t_slow = timed(legacy_preprocess, raw.copy(), notebook_features=True)
+        identical = fast.equals(slow)
+        print(f"{n:>12,} {t_slow:>12.3f} {t_fast:>15.3f} {t_slow / t_fast:>8.1f}x  {identical}")
+
+
+if __name__ == "__main__":
+    main()
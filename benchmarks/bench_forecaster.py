@@ -0,0 +1,69 @@
+"""Benchmark: forecaster price curve, one ``predict`` per point vs one batched call.
+
+Trains the notebook demand model on the processed data (into a temporary
+directory), then predicts the simulator's ``--points``-point price curve
+by calling ``XGBRegressor.predict`` on a one-row frame per price, as a
+per-point loop would, and with ``DemandForecaster.predict_curve``.
+
+Usage:
+    python benchmarks/bench_forecaster.py --points 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from xgboost import XGBRegressor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.demand import MIN_DEMAND  # noqa: E402
+from pricing_engine.forecaster import train_forecaster  # noqa: E402
+
+SOURCE_CSV = os.path.join(ROOT, "data", "processed", "cleaned_features_df.csv")
+
+
+def per_point_curve(regressor, forecaster, prices, competitor_price, score, current_price):
+    units = []
+    for price in prices:
+        row = pd.DataFrame(
+            forecaster.scenario_matrix([price], competitor_price, score, current_price), columns=forecaster.features
+        )
+        units.append(max(MIN_DEMAND, float(regressor.predict(row)[0])))
+    return np.array(units)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path       = os.path.join(tmp, "demand_xgb.ubj")
+        forecaster = train_forecaster(pd.read_csv(SOURCE_CSV), path)
+        regressor  = XGBRegressor()
+        regressor.load_model(path)
+    prices = np.linspace(10, 400, args.points)
+
+    start  = time.perf_counter()
+    slow   = per_point_curve(regressor, forecaster, prices, 75.0, 4.0, 80.0)
+    t_slow = time.perf_counter() - start
+
+    start  = time.perf_counter()
+    fast   = forecaster.predict_curve(prices, 75.0, 4.0, current_price=80.0)
+    t_fast = time.perf_counter() - start
+
+    print(f"{args.points} price points · {len(forecaster.features)} features")
+    print(f"{'engine':<20} {'ms':>10}")
+    print(f"{'per-point predict':<20} {t_slow * 1e3:>10.1f}")
+    print(f"{'predict_curve':<20} {t_fast * 1e3:>10.2f}")
+    print(f"speedup {t_slow / t_fast:,.0f}x · identical: {np.allclose(slow, fast, rtol=1e-5)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: hybrid shock overrides, notebook row-wise ``apply`` vs ``hybrid_prices``.
+
+Builds a synthetic catalog of ``--rows`` rows with 5% shocks split
+between spikes and drops. The row-wise ``apply`` runs on the first
+``--legacy-rows`` rows only, and its rate is extrapolated to the full
+size. Results are compared on that prefix.
+
+Usage:
+    python benchmarks/bench_hybrid.py --rows 10000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.hybrid import hybrid_prices  # noqa: E402
+from pricing_engine.shock_detector import SHOCK_DTYPE  # noqa: E402
+
+
+def apply_shock_override(row, rl_price):
+    """The notebook's rule, with the surge / floor percentages as in the sidebar defaults."""
+    if row['shock_type'] == 'Demand Spike':
+        return min(rl_price * 1.30, row['avg_competitor_price'] * 1.5)
+    elif row['shock_type'] == 'Demand Drop':
+        return max(rl_price * 0.80, row['estimated_cost'] * 1.05)
+    else:
+        return rl_price
+
+
+def legacy_hybrid(merged):
+    final_price  = merged.apply(lambda row: apply_shock_override(row, row['rl_price']), axis=1)
+    final_profit = (final_price - merged['estimated_cost']) * merged['qty']
+    return pd.DataFrame({"final_price": final_price, "final_profit": final_profit})
+
+
+def build_catalog(n_rows, seed=0):
+    rng   = np.random.default_rng(seed)
+    price = rng.uniform(20, 360, n_rows)
+    shock = rng.choice(3, n_rows, p=[0.95, 0.025, 0.025])
+    return pd.DataFrame({
+        "rl_price"            : price * rng.choice([0.95, 1.0, 1.05], n_rows),
+        "avg_competitor_price": price * rng.uniform(0.8, 1.2, n_rows),
+        "estimated_cost"      : price * 0.6,
+        "qty"                 : rng.integers(1, 60, n_rows),
+        "shock_type"          : pd.Categorical.from_codes(shock, dtype=SHOCK_DTYPE),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--legacy-rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = build_catalog(args.rows)
+
+    start  = time.perf_counter()
+    fast   = hybrid_prices(df)
+    t_fast = time.perf_counter() - start
+
+    prefix = df.iloc[:args.legacy_rows]
+    start  = time.perf_counter()
+    slow   = legacy_hybrid(prefix)
+    t_slow = (time.perf_counter() - start) * args.rows / len(prefix)
+
+    same = np.allclose(slow.to_numpy(), fast.iloc[:args.legacy_rows].to_numpy())
+    print(f"{args.rows:,} rows · {(df['shock_type'] != 'Normal').mean():.1%} shocked")
+    print(f"{'engine':<22} {'seconds':>10} {'rows/s':>14}")
+    print(f"{'row-wise apply (est.)':<22} {t_slow:>10.2f} {args.rows / t_slow:>14,.0f}")
+    print(f"{'hybrid_prices':<22} {t_fast:>10.3f} {args.rows / t_fast:>14,.0f}")
+    print(f"speedup {t_slow / t_fast:,.0f}x · identical on first {len(prefix):,} rows: {same}")
+
+
+if __name__ == "__main__":
+    main()
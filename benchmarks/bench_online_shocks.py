@@ -0,0 +1,70 @@
+"""Benchmark: streaming shock detection throughput, per event and in micro-batches.
+
+Replays the processed data as a stream of sales events for ``--products``
+replicated products (shuffled, so products interleave) and reports events
+per second for ``update`` and for ``update_batch`` at several batch sizes,
+checking that every path flags the same events.
+
+Usage:
+    python benchmarks/bench_online_shocks.py --products 10000 --batch 100 1000 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.online_shocks import OnlineShockDetector  # noqa: E402
+
+SOURCE_CSV = os.path.join(ROOT, "data", "processed", "cleaned_features_df.csv")
+
+
+def build_events(n_products):
+    base   = pd.read_csv(SOURCE_CSV).sort_values("month_year", kind="stable")
+    copies = -(-n_products // base["product_id"].nunique())
+    events = pd.concat([base.assign(product_id=base["product_id"] + f"_{i}") for i in range(copies)], ignore_index=True)
+    # Shuffle within each month so products interleave but stay in time order.
+    events["_order"] = np.random.default_rng(0).random(len(events))
+    return events.sort_values(["month_year", "_order"]).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, nargs="+", default=[100, 1_000, 10_000])
+    args = parser.parse_args()
+
+    events   = build_events(args.products)
+    ids      = events["product_id"].to_numpy()
+    qty      = events["qty"].to_numpy(dtype=float)
+    trailing = events["rolling_demand_30d"].to_numpy()
+
+    detector = OnlineShockDetector()
+    start    = time.perf_counter()
+    single   = np.array([detector.update(p, q, t) for p, q, t in zip(ids.tolist(), qty.tolist(), trailing.tolist())])
+    elapsed  = time.perf_counter() - start
+    state_kb = sum(getattr(detector, name).nbytes for name in ["count", "mean", "m2", "ewma", "recent"]) / 1024
+    print(f"{len(events):,} events · {len(detector.slots):,} products · state table {state_kb:,.0f} KB")
+    print(f"{'mode':<14} {'events/s':>12} {'µs/event':>9}  identical")
+    print(f"{'update':<14} {len(events) / elapsed:>12,.0f} {elapsed / len(events) * 1e6:>9.2f}  -")
+
+    for size in args.batch:
+        detector = OnlineShockDetector()
+        labels   = []
+        start    = time.perf_counter()
+        for i in range(0, len(events), size):
+            shock, _ = detector.update_batch(ids[i:i + size], qty[i:i + size], trailing[i:i + size])
+            labels.append(np.asarray(shock))
+        elapsed = time.perf_counter() - start
+        same    = np.array_equal(np.concatenate(labels), single)
+        print(f"{f'batch {size:,}':<14} {len(events) / elapsed:>12,.0f} {elapsed / len(events) * 1e6:>9.2f}  {same}")
+
+
+if __name__ == "__main__":
+    main()
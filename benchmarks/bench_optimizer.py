@@ -0,0 +1,89 @@
+"""Benchmark: per-product Python loop vs the vectorized catalog price optimizer.
+
+Usage:
+    python benchmarks/bench_optimizer.py                 # 1k, 10k, 100k SKUs
+    python benchmarks/bench_optimizer.py --sizes 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pricing_engine.optimizer import (  # noqa: E402
+    DEFAULT_CANDIDATES,
+    candidate_multipliers,
+    optimize_prices,
+    product_snapshot,
+)
+
+
+def naive_optimize(df, surge_cap=30, discount_floor=20, n_candidates=DEFAULT_CANDIDATES):
+    """The dashboard's if/elif argmax, looped over every product and candidate."""
+    rows        = []
+    multipliers = candidate_multipliers(surge_cap, discount_floor, n_candidates).tolist()
+    for p in product_snapshot(df).itertuples():
+        best_price, best_demand, best_profit = None, None, -np.inf
+        for m in multipliers:
+            cand = p.current_price * m
+            r = cand / p.competitor_price if p.competitor_price > 0 else 1
+            if r < 0.9:   f = 1.4
+            elif r < 1.0: f = 1.1
+            elif r < 1.1: f = 0.95
+            elif r < 1.2: f = 0.75
+            else:         f = 0.40
+            d = max(1, p.base_demand * f)
+            profit = (cand - p.unit_cost) * d
+            if profit > best_profit:
+                best_price, best_demand, best_profit = cand, d, profit
+        rows.append((p.product_id, best_price, best_demand, best_profit))
+    return pd.DataFrame(rows, columns=["product_id", "optimal_price", "expected_demand", "expected_profit"])
+
+
+def make_catalog(n_products, rows_per_product=3, seed=0):
+    """Engineered-schema frame with ``n_products`` SKUs."""
+    rng   = np.random.default_rng(seed)
+    n     = n_products * rows_per_product
+    price = rng.uniform(20, 250, n).round(2)
+    return pd.DataFrame({
+        "product_id"          : np.repeat([f"sku_{i}" for i in range(n_products)], rows_per_product),
+        "qty"                 : rng.integers(1, 80, n),
+        "unit_price"          : price,
+        "avg_competitor_price": (price * rng.uniform(0.8, 1.25, n)).round(2),
+        "estimated_cost"      : price * 0.6,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--skip-naive-above", type=int, default=20_000,
+                        help="Only time the naive loop up to this many SKUs.")
+    args = parser.parse_args()
+
+    print(f"{'SKUs':>10} {'naive (s)':>10} {'vectorized (s)':>15} {'speedup':>9}  identical")
+    for n in args.sizes:
+        catalog = make_catalog(n)
+        start   = time.perf_counter()
+        fast    = optimize_prices(catalog)
+        t_fast  = time.perf_counter() - start
+
+        if n > args.skip_naive_above:
+            print(f"{n:>10,} {'-':>10} {t_fast:>15.3f} {'-':>9}  -")
+            continue
+
+        start  = time.perf_counter()
+        slow   = naive_optimize(catalog)
+        t_slow = time.perf_counter() - start
+        cols   = ["optimal_price", "expected_demand", "expected_profit"]
+        identical = np.allclose(fast[cols].to_numpy(), slow[cols].to_numpy())
+        print(f"{n:>10,} {t_slow:>10.3f} {t_fast:>15.3f} {t_slow / t_fast:>8.1f}x  {identical}")
+
+
+if __name__ == "__main__":
+    main()
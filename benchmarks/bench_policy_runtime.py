@@ -0,0 +1,107 @@
+"""Benchmark: serving a PPO policy through stable-baselines3 vs the NumPy runtime.
+
+Trains a small policy, exports it, then in a fresh interpreter per case
+measures import + load time, one batched ``predict`` over ``--rows``
+observations, and peak RSS. Both runtimes must choose the same actions.
+
+Usage:
+    python benchmarks/bench_policy_runtime.py --rows 100000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SOURCE_CSV = os.path.join(ROOT, "data", "processed", "cleaned_features_df.csv")
+
+
+def peak_rss_mb():
+    """Peak RSS of this process (``VmHWM``; see bench_feature_store)."""
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+
+
+def build_inputs(workdir, n_rows):
+    """Trains and exports a quick policy; saves random observations to score."""
+    import numpy as np
+    import pandas as pd
+    from stable_baselines3 import PPO
+
+    from pricing_engine.rl.env import prepare_rl_frame
+    from pricing_engine.rl.runtime import export_policy
+    from pricing_engine.rl.vec_env import ProductVecEnv
+
+    model = PPO("MlpPolicy", ProductVecEnv(prepare_rl_frame(pd.read_csv(SOURCE_CSV))),
+                n_steps=32, batch_size=64, seed=0, verbose=0)
+    model.learn(total_timesteps=2_000)
+    policy = os.path.join(workdir, "policy.zip")
+    model.save(policy)
+    export_policy(model, os.path.join(workdir, "policy.npz"))
+    obs = os.path.join(workdir, "obs.npy")
+    np.save(obs, np.random.default_rng(0).random((n_rows, 8), dtype=np.float32))
+    return policy, obs
+
+
+def child(case, policy, obs_path, actions_path):
+    """Loads the policy with ``case``'s runtime in this (fresh) process and prints a JSON result."""
+    baseline = peak_rss_mb()
+    start    = time.perf_counter()
+    import numpy as np
+    if case == "sb3":
+        from stable_baselines3 import PPO
+        model = PPO.load(policy, device="cpu")
+    else:
+        from pricing_engine.rl.runtime import NumpyPolicy, runtime_path
+        model = NumpyPolicy.load(runtime_path(policy))
+    loaded = time.perf_counter()
+
+    obs = np.load(obs_path)
+    predict_start = time.perf_counter()
+    actions, _ = model.predict(obs, deterministic=True)
+    predicted = time.perf_counter()
+    np.save(actions_path, actions)
+    print(json.dumps({"load": loaded - start, "predict": predicted - predict_start,
+                      "rss_mb": peak_rss_mb(), "delta_mb": peak_rss_mb() - baseline}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--child", nargs=4, metavar=("CASE", "POLICY", "OBS", "ACTIONS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as workdir:
+        policy, obs = build_inputs(workdir, args.rows)
+        print(f"{args.rows:,} observations · .zip {os.path.getsize(policy) / 1024:.0f} KB · "
+              f".npz {os.path.getsize(policy[:-4] + '.npz') / 1024:.0f} KB")
+        print(f"{'runtime':<8} {'import+load (s)':>16} {'predict (s)':>12} {'peak RSS (MB)':>14} {'ΔRSS (MB)':>10}")
+        actions = {}
+        for case in ["sb3", "numpy"]:
+            actions[case] = os.path.join(workdir, f"{case}.npy")
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", case, policy, obs, actions[case]],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            print(f"{case:<8} {r['load']:>16.3f} {r['predict']:>12.4f} {r['rss_mb']:>14.1f} {r['delta_mb']:>10.1f}")
+        same = np.array_equal(np.load(actions["sb3"]), np.load(actions["numpy"]))
+        print(f"identical actions: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark: row-wise ``get_action`` vs the vectorized executive report.
+
+Usage:
+    python benchmarks/bench_report.py                   # 10k, 100k, 1M products
+    python benchmarks/bench_report.py --sizes 5000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pricing_engine.report import executive_report_table  # noqa: E402
+
+
+def legacy_report(df, surge_cap=30, discount_floor=20):
+    """The dashboard's original report: groupby, then ``apply(get_action, axis=1)``."""
+    exec_report = df.groupby('product_id').agg({
+        'unit_price': 'last',
+        'avg_competitor_price': 'last',
+        'qty': 'mean',
+        'demand_shock': 'last',
+        'product_category_name': 'first',
+    }).reset_index()
+
+    def get_action(row):
+        if row['demand_shock'] == 1:
+            return f"🚨 SURGE (+{surge_cap}%) - Demand Spike Detected" if row['qty'] > df['qty'].mean() else f"🚨 DISCOUNT (-{discount_floor}%) - Demand Drop Detected"
+        elif row['unit_price'] < row['avg_competitor_price'] * 0.95:
+            return "🔼 INCREASE (+5%) - Underpriced vs Market"
+        elif row['unit_price'] > row['avg_competitor_price'] * 1.05:
+            return "🔽 DECREASE (-5%) - Overpriced vs Market"
+        else:
+            return "⏸️ HOLD PRICE - Currently Optimal"
+
+    exec_report['Recommended_Action'] = exec_report.apply(get_action, axis=1)
+    return exec_report.sort_values('Recommended_Action', ascending=False, kind='stable')
+
+
+def make_catalog(n_products, rows_per_product=2, seed=0):
+    """Engineered-schema frame with ``n_products`` SKUs."""
+    rng   = np.random.default_rng(seed)
+    n     = n_products * rows_per_product
+    price = rng.uniform(20, 250, n).round(2)
+    return pd.DataFrame({
+        "product_id"           : np.repeat([f"sku_{i:07d}" for i in range(n_products)], rows_per_product),
+        "product_category_name": rng.choice(["electronics", "furniture", "health", "watches"], n),
+        "qty"                  : rng.integers(1, 80, n),
+        "unit_price"           : price,
+        "avg_competitor_price" : (price * rng.uniform(0.85, 1.15, n)).round(2),
+        "demand_shock"         : (rng.random(n) < 0.05).astype(int),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--skip-legacy-above", type=int, default=20_000,
+                        help="Only time the row-wise path up to this many products.")
+    args = parser.parse_args()
+
+    print(f"{'products':>10} {'row-wise (s)':>13} {'vectorized (s)':>15} {'speedup':>9}  identical")
+    for n in args.sizes:
+        catalog = make_catalog(n)
+        start   = time.perf_counter()
+        fast    = executive_report_table(catalog, 30, 20)
+        t_fast  = time.perf_counter() - start
+
+        if n > args.skip_legacy_above:
+            print(f"{n:>10,} {'-':>13} {t_fast:>15.3f} {'-':>9}  -")
+            continue
+
+        start  = time.perf_counter()
+        slow   = legacy_report(catalog)
+        t_slow = time.perf_counter() - start
+        identical = (fast["Recommended_Action"].astype(str).tolist() == slow["Recommended_Action"].tolist()
+                     and fast["Product ID"].tolist() == slow["product_id"].tolist())
+        print(f"{n:>10,} {t_slow:>13.3f} {t_fast:>15.3f} {t_slow / t_fast:>8.1f}x  {identical}")
+
+
+if __name__ == "__main__":
+    main()
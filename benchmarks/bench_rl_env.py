@@ -0,0 +1,156 @@
+"""Benchmark: steps per second of the pricing environments.
+
+Compares the notebook's pandas env with the array-backed env, then shows
+how ``ProductVecEnv`` throughput (product-steps per second) grows with the
+number of product lanes.
+
+Usage:
+    python benchmarks/bench_rl_env.py --steps 50000 --lanes 42 1000 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import gymnasium as gym
+import numpy as np
+import pandas as pd
+from gymnasium import spaces
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.rl.env import DynamicPricingEnv, prepare_rl_frame  # noqa: E402
+from pricing_engine.rl.vec_env import ProductVecEnv  # noqa: E402
+
+SOURCE_CSV = os.path.join(ROOT, "data", "processed", "cleaned_features_df.csv")
+
+
+class PandasPricingEnv(gym.Env):
+    """The notebook's environment: ``iloc`` plus ``float(row[...])`` on every call."""
+
+    def __init__(self, data):
+        super().__init__()
+        self.data          = data.reset_index(drop=True)
+        self.n_steps       = len(self.data)
+        self.current_step  = 0
+        self.current_price = float(self.data.iloc[0]['unit_price'])
+        self.action_space      = spaces.Discrete(3)
+        self.observation_space = spaces.Box(low=0.0, high=1.0, shape=(8,), dtype=np.float32)
+
+    def _get_obs(self):
+        row = self.data.iloc[self.current_step]
+        price_ratio      = float(self.current_price) / (float(row['avg_competitor_price']) + 1e-5)
+        price_ratio_norm = np.clip(price_ratio / 3.0, 0.0, 1.0)
+        obs = np.array([
+            float(row['price_norm']),
+            float(row['demand_norm']),
+            float(row['comp_price_norm']),
+            float(row['score_norm']),
+            float(row['roll_demand_norm']),
+            float(row['inventory_encoded']) / 2.0,
+            float(row['demand_shock']),
+            price_ratio_norm
+        ], dtype=np.float32)
+        return np.clip(obs, 0.0, 1.0)
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self.current_step  = 0
+        self.current_price = float(self.data.iloc[0]['unit_price'])
+        return self._get_obs(), {}
+
+    def step(self, action):
+        row          = self.data.iloc[self.current_step]
+        cost         = float(row['estimated_cost'])
+        comp_price   = float(row['avg_competitor_price'])
+        static_price = float(row['unit_price'])
+        base_qty     = float(row['qty'])
+        if action == 0:
+            self.current_price *= 0.95
+        elif action == 2:
+            self.current_price *= 1.05
+        self.current_price = float(np.clip(self.current_price, cost * 1.05, comp_price * 2.0))
+        price_ratio = self.current_price / (comp_price + 1e-5)
+        if price_ratio < 0.9:
+            demand_factor = 1.4
+        elif price_ratio < 1.0:
+            demand_factor = 1.1
+        elif price_ratio < 1.1:
+            demand_factor = 0.95
+        elif price_ratio < 1.2:
+            demand_factor = 0.75
+        else:
+            demand_factor = 0.40
+        simulated_qty = max(1.0, base_qty * demand_factor)
+        profit        = (self.current_price - cost) * simulated_qty
+        static_profit = (static_price - cost) * base_qty
+        reward = (profit - static_profit) / (abs(static_profit) + 1e-5)
+        if price_ratio > 1.2:
+            reward -= 0.5
+        reward = float(np.clip(reward, -2.0, 2.0))
+        self.current_step += 1
+        terminated = self.current_step >= self.n_steps - 1
+        obs = self._get_obs() if not terminated else np.zeros(8, dtype=np.float32)
+        info = {
+            'price'        : self.current_price,
+            'simulated_qty': simulated_qty,
+            'profit'       : profit,
+            'churn_penalty': max(0.0, (price_ratio - 1.2) * profit),
+            'price_ratio'  : price_ratio
+        }
+        return obs, reward, terminated, False, info
+
+
+def rollout(env, actions):
+    """Steps ``env`` through ``actions``, resetting at episode end; returns (seconds, trace)."""
+    obs, _ = env.reset()
+    trace  = []
+    start  = time.perf_counter()
+    for action in actions:
+        obs, reward, terminated, _, info = env.step(action)
+        trace.append((reward, info["price"], obs.tobytes()))
+        if terminated:
+            obs, _ = env.reset()
+    return time.perf_counter() - start, trace
+
+
+def vec_throughput(rl_df, n_lanes, n_steps=200, seed=0):
+    """Product-steps per second of ``ProductVecEnv`` over ``n_lanes`` replicated products."""
+    copies = -(-n_lanes // rl_df["product_id"].nunique())
+    frames = [rl_df.assign(product_id=rl_df["product_id"] + f"_{i}") for i in range(copies)]
+    data   = pd.concat(frames, ignore_index=True)
+    data   = data[data["product_id"].isin(data["product_id"].unique()[:n_lanes])]
+    env    = ProductVecEnv(data)
+    rng    = np.random.default_rng(seed)
+    env.reset()
+    start  = time.perf_counter()
+    for _ in range(n_steps):
+        env.step(rng.integers(0, 3, env.num_envs))
+    return env.num_envs * n_steps / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=50_000)
+    parser.add_argument("--lanes", type=int, nargs="+", default=[42, 1_000, 10_000])
+    args = parser.parse_args()
+
+    rl_df   = prepare_rl_frame(pd.read_csv(SOURCE_CSV))
+    actions = np.random.default_rng(0).integers(0, 3, args.steps).tolist()
+
+    t_slow, slow = rollout(PandasPricingEnv(rl_df), actions)
+    t_fast, fast = rollout(DynamicPricingEnv(rl_df), actions)
+    print(f"{'env':<14} {'steps/s':>12}")
+    print(f"{'pandas':<14} {args.steps / t_slow:>12,.0f}")
+    print(f"{'array-backed':<14} {args.steps / t_fast:>12,.0f}")
+    print(f"speedup {t_slow / t_fast:.1f}x · identical trajectories: {slow == fast}")
+
+    print(f"\n{'lanes':>8} {'product-steps/s':>16}")
+    for n in args.lanes:
+        print(f"{n:>8,} {vec_throughput(rl_df, n):>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: pricing the catalog with a PPO policy, per row vs batched.
+
+The notebook calls ``model.predict(obs)`` once per row; ``price_catalog``
+builds every observation at once and runs one ``predict`` per policy. A
+small policy is trained on the spot unless ``--policy`` points at a saved
+``.zip`` or versioned run. The catalog is replicated to ``--rows`` rows.
+
+Usage:
+    python benchmarks/bench_rl_inference.py --rows 1000 10000 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from stable_baselines3 import PPO
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.rl.env import prepare_rl_frame, reprice  # noqa: E402
+from pricing_engine.rl.inference import PricingPolicy, catalog_observations, price_catalog  # noqa: E402
+from pricing_engine.rl.vec_env import ProductVecEnv  # noqa: E402
+
+SOURCE_CSV = os.path.join(ROOT, "data", "processed", "cleaned_features_df.csv")
+
+
+def per_row_actions(policy, rl_df):
+    """The notebook's pattern: one ``predict`` call and one reprice per row."""
+    model   = next(iter(policy.models.values()))
+    obs     = catalog_observations(rl_df)
+    profits = []
+    for i, row in enumerate(rl_df.itertuples(index=False)):
+        action, _ = model.predict(obs[i], deterministic=True)
+        *_, profit = reprice(row.unit_price, int(action), row.estimated_cost, row.avg_competitor_price, row.qty)
+        profits.append(float(profit))
+    return np.array(profits)
+
+
+def quick_policy(df, directory):
+    """A briefly trained catalog-wide policy, saved and reloaded like a real one."""
+    model = PPO("MlpPolicy", ProductVecEnv(prepare_rl_frame(df)), n_steps=32, batch_size=64, seed=0, verbose=0)
+    model.learn(total_timesteps=2_000)
+    path = os.path.join(directory, "catalog.zip")
+    model.save(path)
+    return PricingPolicy.load(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--policy", default=None, help="Saved policy .zip or versioned run directory.")
+    args = parser.parse_args()
+
+    source = pd.read_csv(SOURCE_CSV)
+    with tempfile.TemporaryDirectory() as tmp:
+        policy = PricingPolicy.load(args.policy) if args.policy else quick_policy(source, tmp)
+
+    print(f"{'rows':>8} {'per-row s':>10} {'batched s':>10} {'speedup':>8}  identical")
+    for n in args.rows:
+        copies = -(-n // len(source))
+        df     = pd.concat([source] * copies, ignore_index=True).iloc[:n]
+
+        start   = time.perf_counter()
+        batched = price_catalog(df, policy)
+        t_fast  = time.perf_counter() - start
+
+        if policy.group_by is None:
+            start  = time.perf_counter()
+            slow   = per_row_actions(policy, prepare_rl_frame(df))
+            t_slow = time.perf_counter() - start
+            same   = np.allclose(slow, batched["rl_profit"].to_numpy())
+            print(f"{n:>8,} {t_slow:>10.3f} {t_fast:>10.4f} {t_slow / t_fast:>7.0f}x  {same}")
+        else:
+            print(f"{n:>8,} {'-':>10} {t_fast:>10.4f} {'-':>8}  -")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: guardrail grid, one ``strategy_profits`` call per cell vs ``sweep_guardrails``.
+
+Builds a replayed catalog of ``--rows`` rows with 5% shocks split between
+spikes and drops, then evaluates the sidebar's full surge cap × discount
+floor grid (63 cells) both ways and checks the profits agree.
+
+Usage:
+    python benchmarks/bench_sweep.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.backtest import strategy_profits  # noqa: E402
+from pricing_engine.shock_detector import SHOCK_DTYPE  # noqa: E402
+from pricing_engine.sweep import DISCOUNT_FLOORS, SURGE_CAPS, sweep_guardrails  # noqa: E402
+
+
+def build_replay(n_rows, seed=0):
+    rng   = np.random.default_rng(seed)
+    price = rng.uniform(20, 360, n_rows)
+    cost  = price * 0.6
+    qty   = rng.integers(1, 60, n_rows)
+    shock = rng.choice(3, n_rows, p=[0.95, 0.025, 0.025])
+    return pd.DataFrame({
+        "unit_price"          : price,
+        "avg_competitor_price": price * rng.uniform(0.8, 1.2, n_rows),
+        "estimated_cost"      : cost,
+        "qty"                 : qty,
+        "static_profit"       : (price - cost) * qty,
+        "shock_type"          : pd.Categorical.from_codes(shock, dtype=SHOCK_DTYPE),
+    })
+
+
+def sequential_grid(replayed):
+    return np.array([
+        strategy_profits(replayed, cap, floor)["hybrid_profit"] for cap in SURGE_CAPS for floor in DISCOUNT_FLOORS
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    replayed = build_replay(args.rows)
+    cells    = len(SURGE_CAPS) * len(DISCOUNT_FLOORS)
+
+    start  = time.perf_counter()
+    slow   = sequential_grid(replayed)
+    t_slow = time.perf_counter() - start
+
+    start  = time.perf_counter()
+    fast   = sweep_guardrails(replayed)["hybrid_profit"].to_numpy()
+    t_fast = time.perf_counter() - start
+
+    print(f"{args.rows:,} rows · {cells} grid cells")
+    print(f"{'engine':<22} {'seconds':>10} {'cells/s':>10}")
+    print(f"{'per-cell backtest':<22} {t_slow:>10.3f} {cells / t_slow:>10,.1f}")
+    print(f"{'sweep_guardrails':<22} {t_fast:>10.3f} {cells / t_fast:>10,.1f}")
+    print(f"speedup {t_slow / t_fast:,.1f}x · identical: {np.allclose(slow, fast)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark: cache lookup cost for an uploaded CSV, parse + frame hash vs file fingerprint.
+
+Replicates the raw export to ``--rows`` rows as an in-memory upload, then
+times what a cache hit costs on each rerun: parsing the CSV and hashing
+the DataFrame (the old ``preprocess_raw_data(raw_df)`` key) against
+``file_fingerprint`` on the upload bytes.
+
+Usage:
+    python benchmarks/bench_upload_cache.py --rows 100000 1000000
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pricing_engine.fingerprint import file_fingerprint  # noqa: E402
+
+RAW_CSV = os.path.join(ROOT, "data", "raw", "Retail Price Optimization.csv")
+
+
+def build_upload(n_rows):
+    base   = pd.read_csv(RAW_CSV)
+    copies = -(-n_rows // len(base))
+    raw    = pd.concat([base.assign(product_id=base["product_id"] + f"_{i}") for i in range(copies)], ignore_index=True)
+    return io.BytesIO(raw.iloc[:n_rows].to_csv(index=False).encode())
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'MB':>7} {'read_csv':>9} {'hash df':>8} {'fingerprint':>12} {'speedup':>8}")
+    for n_rows in args.rows:
+        upload = build_upload(n_rows)
+        raw    = None
+
+        def parse():
+            nonlocal raw
+            upload.seek(0)
+            raw = pd.read_csv(upload)
+
+        t_parse = timed(parse)
+        t_hash  = timed(lambda: pd.util.hash_pandas_object(raw).to_numpy().tobytes())
+        t_print = timed(lambda: file_fingerprint(upload))
+        print(f"{n_rows:>10,} {upload.getbuffer().nbytes / 1e6:>7.1f} {t_parse:>9.3f} {t_hash:>8.3f} "
+              f"{t_print:>12.4f} {(t_parse + t_hash) / t_print:>7,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
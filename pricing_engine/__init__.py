@@ -0,0 +1,71 @@
+"""Headless computations behind the Dynamic Pricing dashboard."""
+
+from pricing_engine import demand
+from pricing_engine.backtest import dataset_key, replay, strategy_profits
+from pricing_engine.dtypes import compact_frame
+from pricing_engine.export import EXPORT_FORMATS, export_frame, write_frame
+from pricing_engine.feature_store import (
+    list_partitions,
+    load_features,
+    store_exists,
+    write_feature_store,
+)
+from pricing_engine.explain import feature_importance, model_metrics
+from pricing_engine.features import NOTEBOOK_COLUMNS, engineer_features
+from pricing_engine.fingerprint import file_fingerprint
+from pricing_engine.forecaster import DemandForecaster, train_forecaster
+from pricing_engine.hybrid import hybrid_prices
+from pricing_engine.incremental import empty_state, load_state, save_state, update_features
+from pricing_engine.metrics import category_price_comparison, elasticity_counts, summary_metrics
+from pricing_engine.model_cache import ModelCache
+from pricing_engine.online_shocks import OnlineShockDetector
+from pricing_engine.optimizer import optimize_prices
+from pricing_engine.report import build_executive_report, executive_report_table
+from pricing_engine.shock_detector import ShockDetector
+from pricing_engine.shocks import shock_override_table, split_shocks
+from pricing_engine.streaming import scan_demand_stats, stream_features
+from pricing_engine.sweep import best_guardrails, sweep_guardrails
+from pricing_engine.synthetic import generate_synthetic_data
+
+__all__ = [
+    "DemandForecaster",
+    "EXPORT_FORMATS",
+    "ModelCache",
+    "NOTEBOOK_COLUMNS",
+    "OnlineShockDetector",
+    "ShockDetector",
+    "best_guardrails",
+    "build_executive_report",
+    "category_price_comparison",
+    "compact_frame",
+    "dataset_key",
+    "demand",
+    "elasticity_counts",
+    "empty_state",
+    "engineer_features",
+    "executive_report_table",
+    "export_frame",
+    "feature_importance",
+    "file_fingerprint",
+    "generate_synthetic_data",
+    "hybrid_prices",
+    "list_partitions",
+    "load_features",
+    "load_state",
+    "model_metrics",
+    "optimize_prices",
+    "replay",
+    "save_state",
+    "scan_demand_stats",
+    "shock_override_table",
+    "split_shocks",
+    "store_exists",
+    "strategy_profits",
+    "stream_features",
+    "summary_metrics",
+    "sweep_guardrails",
+    "train_forecaster",
+    "update_features",
+    "write_feature_store",
+    "write_frame",
+]
@@ -0,0 +1,109 @@
+"""Headless batch run: the dashboard's outputs without a browser session.
+
+Reads engineered features from a processed CSV, a raw export (``--raw``)
+or a feature-store directory, then writes the executive report, the
+catalog optimal prices and the shock override log to ``--out``. Shocks and
+KPIs come from the same backtest as the dashboard: the saved shock
+detector (else one fitted on the input) and the latest PPO run (else
+none, so the hybrid overrides static prices)::
+
+    python -m pricing_engine data/processed/feature_store --out reports/
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import pandas as pd
+
+from pricing_engine.backtest import replay
+from pricing_engine.export import EXPORT_FORMATS, write_frame
+from pricing_engine.feature_store import load_features
+from pricing_engine.features import engineer_features
+from pricing_engine.metrics import summary_metrics
+from pricing_engine.optimizer import optimize_prices
+from pricing_engine.report import executive_report_table
+from pricing_engine.shock_detector import DEFAULT_DETECTOR_PATH, ShockDetector
+from pricing_engine.shocks import shock_override_table
+
+
+def load_source(path, raw=False):
+    """Engineered frame from a feature store directory, a processed CSV or a raw CSV."""
+    if os.path.isdir(path):
+        return load_features(path)
+    df = pd.read_csv(path)
+    if raw:
+        return engineer_features(df)
+    df["month_year"] = pd.to_datetime(df["month_year"])
+    return df
+
+
+def load_detector(df, path=DEFAULT_DETECTOR_PATH):
+    """The saved shock detector, else an unsaved one fitted on ``df`` (the dashboard's fallback)."""
+    try:
+        detector = ShockDetector.load(path)
+    except ValueError as exc:
+        print(f"{exc}; fitting a detector on the input instead.", file=sys.stderr)
+        detector = ShockDetector(path)
+    if detector.fitted:
+        return detector, path
+    return ShockDetector(path=None).fit(df), "fitted on input"
+
+
+def load_policy(root=None):
+    """The latest trained PPO run under ``root`` and its directory, or ``(None, None)``."""
+    from pricing_engine.rl.train import DEFAULT_MODEL_ROOT, latest_version_dir
+
+    version_dir = latest_version_dir(root or DEFAULT_MODEL_ROOT)
+    if version_dir is None:
+        return None, None
+    from pricing_engine.rl import PricingPolicy
+
+    return PricingPolicy.load(version_dir), version_dir
+
+
+def run(df, out_dir, surge_cap=30, discount_floor=20, fmt="csv", detector=None, policy=None):
+    """Writes the batch outputs for ``df`` and returns the summary metrics.
+
+    Shocks come from ``detector`` and RL prices from ``policy`` as in the
+    dashboard's backtest; without them the rule-based ``demand_shock``
+    flags drive the overrides and there is no RL strategy.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    extension = EXPORT_FORMATS[fmt][0]
+    replayed  = replay(df, detector, policy)
+    outputs = {
+        "executive_report": executive_report_table(df, surge_cap, discount_floor),
+        "optimal_prices"  : optimize_prices(df, surge_cap=surge_cap, discount_floor=discount_floor),
+        "shock_overrides" : shock_override_table(replayed, surge_cap, discount_floor),
+    }
+    for name, frame in outputs.items():
+        with open(os.path.join(out_dir, f"{name}.{extension}"), "wb") as fh:
+            write_frame(frame, fh, fmt)
+    return summary_metrics(replayed, surge_cap, discount_floor, replayed=replayed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the pricing engine headlessly and write its reports.")
+    parser.add_argument("source", help="Feature store directory, processed CSV, or raw CSV with --raw.")
+    parser.add_argument("--raw", action="store_true", help="Engineer features from a raw export first.")
+    parser.add_argument("--out", default="reports", help="Directory for the output files.")
+    parser.add_argument("--surge-cap", type=int, default=30, help="Surge price cap (%%).")
+    parser.add_argument("--discount-floor", type=int, default=20, help="Discount floor (%%).")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv")
+    parser.add_argument("--detector", default=DEFAULT_DETECTOR_PATH, help="Saved shock detector to score with.")
+    parser.add_argument("--policy-root", default=None, help="Directory of versioned PPO runs (default: models/ppo).")
+    parser.add_argument("--rules", action="store_true",
+                        help="Skip the detector and policy; use the rule-based demand_shock flags.")
+    args = parser.parse_args(argv)
+
+    df = load_source(args.source, args.raw)
+    detector, detector_source = (None, "rule-based demand_shock") if args.rules else load_detector(df, args.detector)
+    policy, policy_source     = (None, None) if args.rules else load_policy(args.policy_root)
+    metrics = run(df, args.out, args.surge_cap, args.discount_floor, args.format, detector, policy)
+    print(json.dumps({"shock_source": detector_source, "policy": policy_source, **metrics}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
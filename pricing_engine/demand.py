@@ -0,0 +1,94 @@
+"""Tiered demand response to our price relative to the competitor's.
+
+Demand scales by a step factor of the price ratio ``price / competitor``:
+
+    ratio < 0.9 → 1.40,  < 1.0 → 1.10,  < 1.1 → 0.95,  < 1.2 → 0.75,  else 0.40
+
+Everything broadcasts, so one call evaluates a whole price grid against
+every product's competitor price and base demand.
+"""
+
+import numpy as np
+
+RATIO_BREAKPOINTS = np.array([0.9, 1.0, 1.1, 1.2])
+DEMAND_FACTORS    = np.array([1.4, 1.1, 0.95, 0.75, 0.40])
+MIN_DEMAND        = 1
+
+REFERENCE_SCORE      = 4.0
+HOLIDAY_UPLIFT       = 1.5
+LOW_INVENTORY_FACTOR = 0.8
+
+
+def price_ratio(price, competitor_price):
+    """``price / competitor_price``, or 1 where the competitor price is not positive."""
+    price, competitor_price = np.broadcast_arrays(
+        np.asarray(price, dtype=float), np.asarray(competitor_price, dtype=float)
+    )
+    ratio = np.ones_like(price)
+    np.divide(price, competitor_price, out=ratio, where=competitor_price > 0)
+    return ratio
+
+
+def demand_factor(price, competitor_price):
+    """Tiered demand multiplier for each (price, competitor price) pair."""
+    return DEMAND_FACTORS[np.digitize(price_ratio(price, competitor_price), RATIO_BREAKPOINTS)]
+
+
+def simulate_demand(price, competitor_price, base_demand):
+    """Expected units sold: ``max(MIN_DEMAND, base_demand * demand_factor)``."""
+    return np.maximum(MIN_DEMAND, np.asarray(base_demand, dtype=float) * demand_factor(price, competitor_price))
+
+
+def _per_product(values):
+    """Scalar or ``(N,)`` values as an ``(N, 1)`` column."""
+    return np.atleast_1d(np.asarray(values, dtype=float))[:, None]
+
+
+def _take_best(values, best):
+    """Row-wise ``values[i, best[i]]`` for an ``(N, 1)`` index column."""
+    values = np.broadcast_to(values, (len(best), values.shape[1]))
+    return np.take_along_axis(values, best, axis=1)[:, 0]
+
+
+def price_sweep(price_grid, competitor_price, base_demand, unit_cost):
+    """Evaluates every grid price for every product.
+
+    ``price_grid`` is a shared ``(P,)`` grid or per-product ``(N, P)``
+    candidates; ``competitor_price``, ``base_demand`` and ``unit_cost`` are
+    scalars or ``(N,)`` per-product arrays. Returns a dict of ``(N, P)``
+    ``demand`` / ``revenue`` / ``profit`` arrays plus the per-product
+    ``optimal_price``, ``optimal_demand`` and ``optimal_profit``.
+    """
+    grid    = np.atleast_2d(np.asarray(price_grid, dtype=float))
+    demand  = simulate_demand(grid, _per_product(competitor_price), _per_product(base_demand))
+    revenue = grid * demand
+    profit  = (grid - _per_product(unit_cost)) * demand
+    best    = profit.argmax(axis=1)[:, None]
+    return {
+        "demand"        : demand,
+        "revenue"       : revenue,
+        "profit"        : profit,
+        "optimal_price" : _take_best(grid, best),
+        "optimal_demand": _take_best(demand, best),
+        "optimal_profit": _take_best(profit, best),
+    }
+
+
+def demand_curve(price_grid, competitor_price, base_demand, unit_cost):
+    """Single-product sweep: ``(revenue, profit)`` arrays over ``price_grid``."""
+    sweep = price_sweep(price_grid, competitor_price, base_demand, unit_cost)
+    return sweep["revenue"][0], sweep["profit"][0]
+
+
+def point_forecast(base_demand, price, competitor_price, score, holiday=False, low_inventory=False):
+    """Whole units for one simulated scenario, as the forecaster tab reports them.
+
+    The tiered demand is scaled by product score relative to
+    ``REFERENCE_SCORE``, then by the holiday uplift and the low-inventory cut.
+    """
+    units = max(MIN_DEMAND, int(base_demand * float(demand_factor(price, competitor_price)) * (score / REFERENCE_SCORE)))
+    if holiday:
+        units = int(units * HOLIDAY_UPLIFT)
+    if low_inventory:
+        units = int(units * LOW_INVENTORY_FACTOR)
+    return units
@@ -0,0 +1,43 @@
+"""Server-side reduction of large scatter plots before they reach the browser.
+
+Up to ``WEBGL_POINTS`` rows a chart keeps its SVG markers; above that the
+markers switch to WebGL, and above ``AGGREGATE_POINTS`` the bulk of the
+points is replaced by an aggregate whose size does not grow with the
+data: a 2-D histogram for price vs quantity, per-period quantile bands
+for demand over time. Shock rows are never aggregated.
+"""
+
+import numpy as np
+
+WEBGL_POINTS     = 1_000    # plotly express switches to WebGL at the same size
+AGGREGATE_POINTS = 20_000
+DENSITY_BINS     = (80, 60)
+BAND_QUANTILES   = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def use_webgl(n_points):
+    return n_points > WEBGL_POINTS
+
+
+def should_aggregate(n_points):
+    return n_points > AGGREGATE_POINTS
+
+
+def density_grid(x, y, bins=DENSITY_BINS):
+    """``(x_centers, y_centers, counts)`` of a 2-D histogram, ``counts[y, x]``.
+
+    Empty cells are NaN so a heatmap leaves them transparent.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    keep = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[keep], y[keep], bins=bins)
+    counts = counts.T
+    counts[counts == 0] = np.nan
+    return (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, counts
+
+
+def period_quantiles(df, period="month_year", value="qty", quantiles=BAND_QUANTILES):
+    """``value`` quantiles per ``period``, one column per quantile (``q05``, ``q50``, ...)."""
+    bands = df.groupby(period, sort=True)[value].quantile(list(quantiles)).unstack()
+    bands.columns = [f"q{round(q * 100):02d}" for q in quantiles]
+    return bands
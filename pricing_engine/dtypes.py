@@ -0,0 +1,95 @@
+"""Compact dtypes for the engineered frame.
+
+``COMPACT_SCHEMA`` maps each column of the processed schema to a storage
+kind:
+
+* ``category`` — repeated IDs and names become categoricals (integer
+  codes, so groupbys skip string hashing);
+* ``flag``     — 0/1 indicators become ``int8``;
+* ``int``      — counts become the smallest integer type that holds them;
+* ``float32``  — prices, ratios and rolling statistics.
+
+Columns outside the schema (e.g. ``month_year``) keep their dtype, and a
+column whose values do not fit its kind (NaNs in a count, fractions in a
+flag) falls back to ``float32``. Aggregations that feed money totals
+upcast to float64 themselves (``to_numpy(dtype=float)``).
+"""
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_COLUMNS = ["product_id", "product_category_name"]
+FLAG_COLUMNS     = ["demand_shock", "is_holiday_season", "is_cheaper_than_market"]
+INTEGER_COLUMNS  = [
+    "qty", "customers", "volume", "inventory_level", "product_photos_qty", "product_weight_g",
+    "product_name_lenght", "product_description_lenght", "weekday", "weekend", "holiday", "month", "year",
+]
+FLOAT32_COLUMNS  = [
+    "total_price", "freight_price", "unit_price", "product_score", "s", "lag_price",
+    "comp_1", "ps1", "fp1", "comp_2", "ps2", "fp2", "comp_3", "ps3", "fp3",
+    "estimated_cost", "profit", "avg_competitor_price", "price_vs_competitor",
+    "rolling_demand_7d", "rolling_demand_30d", "demand_deviation",
+    "price_change", "demand_change", "elasticity_score",
+]
+
+COMPACT_SCHEMA = {
+    **dict.fromkeys(CATEGORY_COLUMNS, "category"),
+    **dict.fromkeys(FLAG_COLUMNS, "flag"),
+    **dict.fromkeys(INTEGER_COLUMNS, "int"),
+    **dict.fromkeys(FLOAT32_COLUMNS, "float32"),
+}
+
+
+def _whole(values):
+    return bool(np.isfinite(values).all() and (values == np.round(values)).all())
+
+
+def compact_column(series, kind):
+    """``series`` stored as ``kind`` (see ``COMPACT_SCHEMA``)."""
+    if kind == "category":
+        return series.astype("category")
+
+    values = series.to_numpy(dtype=float)
+    if kind == "flag" and _whole(values) and np.isin(values, (0, 1)).all():
+        return series.astype(np.int8)
+    if kind == "int" and _whole(values):
+        return pd.to_numeric(series, downcast="integer")
+    return series.astype(np.float32)
+
+
+def compact_frame(df, schema=COMPACT_SCHEMA):
+    """A copy of ``df`` with every ``schema`` column in its compact dtype."""
+    columns = {
+        column: compact_column(df[column], kind)
+        for column, kind in schema.items()
+        if column in df.columns
+    }
+    return df.assign(**columns)
+
+
+def concat_compact(frames):
+    """``pd.concat`` of compact frames that keeps categorical columns categorical.
+
+    A plain concat of categoricals with different categories falls back to
+    object, so each shared categorical column is recoded to the union of
+    its categories first (existing codes keep their values).
+    """
+    frames = [frame for frame in frames if frame is not None]
+    for column in frames[0].columns:
+        dtypes = [frame[column].dtype for frame in frames if column in frame.columns]
+        if len(dtypes) < 2 or not all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            continue
+        categories = dtypes[0].categories
+        for dtype in dtypes[1:]:
+            categories = categories.append(dtype.categories.difference(categories))
+        frames = [
+            frame.assign(**{column: frame[column].cat.set_categories(categories)})
+            if column in frame.columns and not frame[column].cat.categories.equals(categories) else frame
+            for frame in frames
+        ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def frame_memory(df):
+    """Deep memory footprint of ``df`` in bytes."""
+    return int(df.memory_usage(deep=True).sum())
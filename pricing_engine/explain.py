@@ -0,0 +1,60 @@
+"""Feature importance and holdout accuracy of a quick XGBoost demand model."""
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+
+from pricing_engine.model_cache import ModelCache
+
+BASE_FEATURES     = ["unit_price", "avg_competitor_price", "price_vs_competitor", "estimated_cost"]
+OPTIONAL_FEATURES = ["rolling_demand_30d", "product_score"]
+EXPLAINER_PARAMS  = {"n_estimators": 50, "max_depth": 4, "random_state": 42}
+HOLDOUT_SHARE     = 0.2
+MIN_HOLDOUT_ROWS  = 5
+
+
+def importance_features(df):
+    """Model inputs available in ``df``."""
+    return BASE_FEATURES + [f for f in OPTIONAL_FEATURES if f in df.columns]
+
+
+def feature_importance(df, cache=None):
+    """Fits (or reuses) the explainer on ``df`` and returns its importances.
+
+    The frame has display ``Feature`` names and ``Importance`` ascending, or
+    is ``None`` when no complete rows are left to fit on.
+    """
+    features = importance_features(df)
+    model_df = df.dropna(subset=features + ["qty"])
+    if model_df.empty:
+        return None
+
+    cache = cache if cache is not None else ModelCache(directory=None)
+    model = cache.fit(model_df[features], model_df["qty"], **EXPLAINER_PARAMS)
+    return pd.DataFrame({
+        "Feature"   : [f.replace("_", " ").title() for f in features],
+        "Importance": model.feature_importances_,
+    }).sort_values(by="Importance", ascending=True)
+
+
+def model_metrics(df, cache=None):
+    """MAE, RMSE and R² of the explainer model on a seeded 80/20 holdout.
+
+    ``None`` when there are too few complete rows to hold any out.
+    """
+    features = importance_features(df)
+    model_df = df.dropna(subset=features + ["qty"])
+    if len(model_df) * HOLDOUT_SHARE < MIN_HOLDOUT_ROWS:
+        return None
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        model_df[features], model_df["qty"], test_size=HOLDOUT_SHARE, random_state=42
+    )
+    cache = cache if cache is not None else ModelCache(directory=None)
+    preds = cache.fit(X_train, y_train, **EXPLAINER_PARAMS).predict(X_test)
+    return {
+        "mae" : float(mean_absolute_error(y_test, preds)),
+        "rmse": float(np.sqrt(mean_squared_error(y_test, preds))),
+        "r2"  : float(r2_score(y_test, preds)),
+    }
@@ -0,0 +1,153 @@
+"""Columnar on-disk feature store for the engineered frame.
+
+Features are written as a hive-partitioned Parquet dataset::
+
+    <root>/product_category_name=<category>/month_year=<YYYY-MM-DD>/part-0.parquet
+
+Readers project only the columns they need and prune partitions by category
+and month before touching any file; files are memory-mapped rather than
+copied into Python buffers.
+
+Build the store from the processed CSV (or a raw export with ``--raw``)::
+
+    python -m pricing_engine.feature_store data/processed/cleaned_features_df.csv
+"""
+
+import argparse
+import os
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+
+from pricing_engine.features import engineer_features
+
+DEFAULT_STORE_ROOT = os.path.join("data", "processed", "feature_store")
+PARTITION_COLUMNS  = ["product_category_name", "month_year"]
+MONTH_FORMAT       = "%Y-%m-%d"
+ROWS_PER_GROUP     = 256_000
+
+_PARTITIONING = ds.partitioning(
+    pa.schema([("product_category_name", pa.string()), ("month_year", pa.string())]),
+    flavor="hive",
+)
+
+
+# ─────────────────────────────────────────────
+#  WRITE
+# ─────────────────────────────────────────────
+def write_feature_store(df, root=DEFAULT_STORE_ROOT, overwrite=True):
+    """Writes the engineered frame as a partitioned Parquet dataset at ``root``.
+
+    ``month_year`` becomes an ISO date partition key; all other columns keep
+    their dtypes. With ``overwrite`` the existing store is replaced;
+    otherwise only the partitions present in ``df`` are.
+    """
+    missing = [c for c in PARTITION_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Feature store partitions need column(s): {', '.join(missing)}")
+
+    if overwrite and os.path.isdir(root):
+        shutil.rmtree(root)
+
+    month = pd.to_datetime(df["month_year"])
+    # Grouping rows by partition first keeps each file to a few large row
+    # groups; unsorted input scatters a partition into one group per batch.
+    df = df.assign(month_year=month.dt.strftime(MONTH_FORMAT)).sort_values(
+        PARTITION_COLUMNS + [c for c in ["product_id"] if c in df.columns], kind="stable"
+    )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    ds.write_dataset(
+        table, root,
+        format="parquet",
+        partitioning=_PARTITIONING,
+        existing_data_behavior="overwrite_or_ignore" if overwrite else "delete_matching",
+        min_rows_per_group=ROWS_PER_GROUP,
+        max_rows_per_group=ROWS_PER_GROUP,
+        max_partitions=max(1024, df[PARTITION_COLUMNS[0]].nunique() * month.nunique()),
+    )
+    return root
+
+
+# ─────────────────────────────────────────────
+#  READ
+# ─────────────────────────────────────────────
+def open_feature_store(root=DEFAULT_STORE_ROOT):
+    """Opens the store as a memory-mapped pyarrow dataset."""
+    return ds.dataset(
+        root,
+        format="parquet",
+        partitioning=_PARTITIONING,
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+    )
+
+
+def store_exists(root=DEFAULT_STORE_ROOT):
+    return os.path.isdir(root) and any(os.scandir(root))
+
+
+def list_partitions(root=DEFAULT_STORE_ROOT):
+    """Returns the (category, month) partitions present, from paths only."""
+    keys = [
+        ds.get_partition_keys(fragment.partition_expression)
+        for fragment in open_feature_store(root).get_fragments()
+    ]
+    parts = pd.DataFrame(keys, columns=PARTITION_COLUMNS).drop_duplicates()
+    parts["month_year"] = pd.to_datetime(parts["month_year"], format=MONTH_FORMAT)
+    return parts.sort_values(PARTITION_COLUMNS).reset_index(drop=True)
+
+
+def partition_filter(categories=None, months=None):
+    """Builds a partition-pruning expression; ``months`` is a (start, end) pair."""
+    expr = None
+    if categories is not None:
+        expr = ds.field("product_category_name").isin([str(c) for c in categories])
+    if months is not None:
+        start, end = (pd.Timestamp(m).strftime(MONTH_FORMAT) for m in months)
+        # ISO date strings order the same way as the dates they encode.
+        in_range = (ds.field("month_year") >= start) & (ds.field("month_year") <= end)
+        expr = in_range if expr is None else expr & in_range
+    return expr
+
+
+def load_features(root=DEFAULT_STORE_ROOT, columns=None, categories=None, months=None):
+    """Loads ``columns`` for the selected partitions as a pandas frame.
+
+    Rows come back in ``engineer_features`` order (per product, by month)
+    whenever ``product_id`` and ``month_year`` are among the columns.
+    """
+    dataset = open_feature_store(root)
+    if columns is not None:
+        columns = [c for c in dict.fromkeys(columns) if c in dataset.schema.names]
+    table = dataset.to_table(columns=columns, filter=partition_filter(categories, months))
+    if {"product_id", "month_year"} <= set(table.column_names):
+        table = table.sort_by([("product_id", "ascending"), ("month_year", "ascending")])
+    # Hand column buffers over to pandas instead of holding both copies.
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+
+    if "month_year" in df.columns:
+        df["month_year"] = pd.to_datetime(df["month_year"], format=MONTH_FORMAT)
+    return df
+
+
+# ─────────────────────────────────────────────
+#  CLI
+# ─────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the partitioned Parquet feature store from a CSV.")
+    parser.add_argument("csv", help="Processed features CSV (or raw export with --raw).")
+    parser.add_argument("--root", default=DEFAULT_STORE_ROOT, help="Store directory to (re)write.")
+    parser.add_argument("--raw", action="store_true", help="Engineer features from a raw export first.")
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.csv)
+    df = engineer_features(df, notebook_features=True) if args.raw else df
+    write_feature_store(df, args.root)
+    print(f"Wrote {len(df):,} rows to {args.root} ({len(list_partitions(args.root))} partitions)")
+
+
+if __name__ == "__main__":
+    main()
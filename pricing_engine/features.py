@@ -0,0 +1,126 @@
+"""Vectorized feature engineering for the raw Retail Price Optimization schema.
+
+Every per-product computation uses pandas' built-in grouped ``shift`` /
+``rolling`` / ``transform`` kernels, so cost grows with rows rather than with
+the number of Python calls per product.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.indexers import BaseIndexer
+
+# ─────────────────────────────────────────────
+#  CONSTANTS
+# ─────────────────────────────────────────────
+COST_RATIO           = 0.60   # estimated_cost = unit_price * COST_RATIO
+SHORT_WINDOW         = 2      # rolling_demand_7d  (periods)
+LONG_WINDOW          = 4      # rolling_demand_30d (periods)
+SHOCK_STD_MULTIPLIER = 2.0    # demand_shock: qty > mean + k * std
+INVENTORY_SEED       = 42
+PRICE_EPS            = 1e-5
+
+# Columns added on top of the dashboard set, mirroring the notebook.
+# They are NaN on a product's first rows by construction, so they are
+# excluded from the final ``dropna``.
+NOTEBOOK_COLUMNS = [
+    "rolling_demand_7d", "demand_deviation",
+    "price_change", "demand_change", "elasticity_score",
+]
+
+
+# ─────────────────────────────────────────────
+#  GROUPED PRIMITIVES
+# ─────────────────────────────────────────────
+class SegmentWindowIndexer(BaseIndexer):
+    """Trailing windows that never cross a segment (product) boundary.
+
+    ``segment_start[i]`` is the position of the first row of row ``i``'s
+    segment. The bounds match what ``groupby().rolling()`` builds one group at
+    a time, so the same Cython kernel produces bit-identical results.
+    """
+
+    def __init__(self, window_size, segment_start):
+        super().__init__(window_size=window_size)
+        self.segment_start = segment_start
+
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None, closed=None, step=None):
+        end   = np.arange(1, num_values + 1, dtype=np.int64)
+        start = np.maximum(end - self.window_size, self.segment_start)
+        return start, end
+
+
+def segment_starts(keys):
+    """Position of each row's segment start; ``keys`` must be contiguous."""
+    positions = np.arange(len(keys), dtype=np.int64)
+    is_start  = keys.ne(keys.shift()).to_numpy()
+    return np.maximum.accumulate(np.where(is_start, positions, 0))
+
+
+def lagged_rolling_mean(values, keys, window, starts=None):
+    """Per-group ``x.shift(1).rolling(window, min_periods=1).mean()``.
+
+    Rows of a group must be contiguous (the frame is sorted by product).
+    """
+    if starts is None:
+        starts = segment_starts(keys)
+    shifted = values.groupby(keys, sort=False).shift(1)
+    return shifted.rolling(SegmentWindowIndexer(window, starts), min_periods=1).mean()
+
+
+def shock_flags(values, keys, k=SHOCK_STD_MULTIPLIER):
+    """Per-group ``(x > x.mean() + k * x.std()).astype(int)``."""
+    grouped   = values.groupby(keys, sort=False)
+    threshold = grouped.transform("mean") + k * grouped.transform("std")
+    return (values > threshold).astype(int)
+
+
+def group_pct_change(values, keys):
+    """Per-group ``x.pct_change()`` without forward-filling gaps."""
+    return values / values.groupby(keys, sort=False).shift(1) - 1
+
+
+def synthetic_inventory(qty, seed=INVENTORY_SEED):
+    """Synthetic inventory level for the RL state space (seeded, stateless)."""
+    rng = np.random.RandomState(seed)
+    return (qty * rng.uniform(1.5, 4.0, len(qty))).astype(int)
+
+
+# ─────────────────────────────────────────────
+#  ENGINE
+# ─────────────────────────────────────────────
+def engineer_features(df, notebook_features=False):
+    """Sorts the raw frame per product and adds the engineered columns.
+
+    With ``notebook_features=False`` the result is the dashboard's historical
+    ``preprocess_raw_data`` output; ``True`` also adds ``NOTEBOOK_COLUMNS``.
+    """
+    if "month_year" in df.columns:
+        df = df.assign(month_year=pd.to_datetime(df["month_year"], format='%d-%m-%Y', errors='coerce'))
+
+    df = df.sort_values(['product_id', 'month_year']).reset_index(drop=True)
+    keys   = df['product_id']
+    starts = segment_starts(keys)
+
+    if 'comp_1' in df.columns:
+        df['avg_competitor_price'] = (df['comp_1'] + df['comp_2'] + df['comp_3']) / 3
+    else:
+        df['avg_competitor_price'] = df['unit_price'] * 1.05
+
+    df['rolling_demand_30d'] = lagged_rolling_mean(df['qty'], keys, LONG_WINDOW, starts)
+
+    df['estimated_cost']      = df['unit_price'] * COST_RATIO
+    df['profit']              = (df['unit_price'] - df['estimated_cost']) * df['qty']
+    df['price_vs_competitor'] = df['unit_price'] / (df['avg_competitor_price'] + PRICE_EPS)
+
+    df['demand_shock']    = shock_flags(df['qty'], keys)
+    df['inventory_level'] = synthetic_inventory(df['qty'])
+
+    required = list(df.columns)
+    if notebook_features:
+        df['rolling_demand_7d'] = lagged_rolling_mean(df['qty'], keys, SHORT_WINDOW, starts)
+        df['demand_deviation']  = df['qty'] - df['rolling_demand_30d']
+        df['price_change']      = group_pct_change(df['unit_price'], keys)
+        df['demand_change']     = group_pct_change(df['qty'], keys)
+        df['elasticity_score']  = df['demand_change'] / df['price_change']
+
+    return df.dropna(subset=required).reset_index(drop=True)
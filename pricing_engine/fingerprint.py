@@ -0,0 +1,34 @@
+"""Content fingerprints of uploaded files, for cache keys.
+
+Hashing the file bytes is far cheaper than parsing the CSV and hashing
+the resulting DataFrame, so caches keyed by ``file_fingerprint`` can
+return an engineered frame without reading the upload at all.
+"""
+
+import hashlib
+
+FINGERPRINT_CHUNK = 8 * 1024 * 1024
+
+
+def file_fingerprint(fh, chunk_size=FINGERPRINT_CHUNK):
+    """``"<size>-<sha256>"`` of a binary file object's full contents.
+
+    In-memory buffers (e.g. Streamlit uploads) are hashed in place; other
+    files are streamed in ``chunk_size`` blocks. The read position is
+    restored.
+    """
+    digest = hashlib.sha256()
+    if hasattr(fh, "getbuffer"):
+        with fh.getbuffer() as view:
+            digest.update(view)
+            return f"{view.nbytes}-{digest.hexdigest()}"
+
+    position, size = fh.tell(), 0
+    fh.seek(0)
+    try:
+        for block in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(block)
+            size += len(block)
+    finally:
+        fh.seek(position)
+    return f"{size}-{digest.hexdigest()}"
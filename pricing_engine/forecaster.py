@@ -0,0 +1,168 @@
+"""The notebook's XGBoost demand model, persisted and served for what-if scenarios.
+
+Training reproduces the notebook: 14 features, an 80/20 split with
+``random_state=42`` and ``XGBRegressor(n_estimators=300, max_depth=5)``.
+The booster is saved next to a JSON sidecar holding the feature order,
+the holdout metrics and two baseline rows (feature medians outside and
+inside the holiday season).
+
+A scenario starts from the matching baseline row and overrides the
+simulator's inputs: price (and its ratio to the competitor), competitor
+price, product score. The whole price curve is one prebuilt float32
+matrix and one ``inplace_predict`` call.
+
+Train (or retrain) the persisted model on a processed features CSV::
+
+    python -m pricing_engine.forecaster data/processed/cleaned_features_df.csv
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+from xgboost import XGBRegressor
+
+from pricing_engine.demand import LOW_INVENTORY_FACTOR, MIN_DEMAND, price_ratio
+
+DEFAULT_FORECASTER_PATH = os.path.join("models", "demand_xgb.ubj")
+
+FORECAST_FEATURES = [
+    "unit_price", "freight_price", "product_score", "customers",
+    "month", "weekend", "holiday", "s", "lag_price",
+    "avg_competitor_price", "price_vs_competitor", "is_holiday_season",
+    "rolling_demand_7d", "rolling_demand_30d",
+]
+FORECAST_PARAMS = {
+    "n_estimators"    : 300,
+    "learning_rate"   : 0.05,
+    "max_depth"       : 5,
+    "subsample"       : 0.8,
+    "colsample_bytree": 0.8,
+    "random_state"    : 42,
+}
+HOLDOUT_SHARE = 0.2
+
+
+def sidecar_path(path):
+    return os.path.splitext(path)[0] + ".json"
+
+
+def has_forecast_features(df):
+    return all(column in df.columns for column in FORECAST_FEATURES + ["qty"])
+
+
+def baseline_rows(X):
+    """Feature medians outside (``"0"``) and inside (``"1"``) the holiday season."""
+    overall = X.median()
+    rows    = {}
+    for flag in ("0", "1"):
+        season = X[X["is_holiday_season"] == int(flag)]
+        row    = season.median() if len(season) else overall.copy()
+        row["is_holiday_season"] = int(flag)
+        rows[flag] = row[FORECAST_FEATURES].astype(float).tolist()
+    return rows
+
+
+def train_forecaster(df, path=DEFAULT_FORECASTER_PATH, params=None):
+    """Fits the notebook model on ``df``, saves it with its sidecar, returns a ``DemandForecaster``."""
+    params = {**FORECAST_PARAMS, **(params or {})}
+    X = df[FORECAST_FEATURES].astype(float).dropna()
+    y = df.loc[X.index, "qty"].astype(float)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=HOLDOUT_SHARE, random_state=42)
+
+    model = XGBRegressor(**params).fit(X_train, y_train)
+    preds = model.predict(X_test)
+    meta  = {
+        "features": FORECAST_FEATURES,
+        "params"  : params,
+        "rows"    : len(X),
+        "metrics" : {
+            "mae" : float(mean_absolute_error(y_test, preds)),
+            "rmse": float(np.sqrt(mean_squared_error(y_test, preds))),
+            "r2"  : float(r2_score(y_test, preds)),
+        },
+        "baseline": baseline_rows(X),
+    }
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Write then rename so a concurrent reader never sees half a file.
+    tmp = f"{path}.{os.getpid()}.tmp.ubj"
+    model.save_model(tmp)
+    os.replace(tmp, path)
+    tmp = f"{sidecar_path(path)}.{os.getpid()}.tmp"
+    with open(tmp, "w") as fh:
+        json.dump(meta, fh, indent=2)
+    os.replace(tmp, sidecar_path(path))
+    return DemandForecaster(model.get_booster(), meta, source=path)
+
+
+class DemandForecaster:
+    """A persisted demand booster with batched scenario prediction."""
+
+    def __init__(self, booster, meta, source=None):
+        self.booster  = booster
+        self.features = meta["features"]
+        self.metrics  = meta.get("metrics")
+        self.source   = source
+        self.baseline = {flag: np.asarray(row, dtype=np.float32) for flag, row in meta["baseline"].items()}
+        self.columns  = {name: i for i, name in enumerate(self.features)}
+
+    @classmethod
+    def load(cls, path=DEFAULT_FORECASTER_PATH):
+        """The saved forecaster, or ``None`` when nothing has been trained."""
+        if not (os.path.exists(path) and os.path.exists(sidecar_path(path))):
+            return None
+        model = XGBRegressor()
+        model.load_model(path)
+        with open(sidecar_path(path)) as fh:
+            meta = json.load(fh)
+        return cls(model.get_booster(), meta, source=path)
+
+    def scenario_matrix(self, prices, competitor_price, score, current_price=None, holiday=False):
+        """``(len(prices), n_features)`` float32 rows: the season's baseline with the scenario applied.
+
+        ``lag_price`` is the ``current_price`` being moved from (each
+        candidate price itself when not given).
+        """
+        prices = np.atleast_1d(np.asarray(prices, dtype=np.float32))
+        X = np.tile(self.baseline["1" if holiday else "0"], (len(prices), 1))
+        X[:, self.columns["unit_price"]]           = prices
+        X[:, self.columns["avg_competitor_price"]] = competitor_price
+        X[:, self.columns["price_vs_competitor"]]  = price_ratio(prices, competitor_price)
+        X[:, self.columns["product_score"]]        = score
+        X[:, self.columns["lag_price"]]            = prices if current_price is None else current_price
+        return X
+
+    def predict_matrix(self, X):
+        """Units for each row of a prebuilt matrix, one batched booster call."""
+        return np.maximum(MIN_DEMAND, self.booster.inplace_predict(X))
+
+    def predict_curve(self, prices, competitor_price, score, current_price=None, holiday=False, low_inventory=False):
+        """Predicted units at every price of ``prices`` (low inventory cuts demand as in the simulator)."""
+        units = self.predict_matrix(self.scenario_matrix(prices, competitor_price, score, current_price, holiday))
+        return units * LOW_INVENTORY_FACTOR if low_inventory else units
+
+
+# ─────────────────────────────────────────────
+#  CLI
+# ─────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train and persist the XGBoost demand forecaster.")
+    parser.add_argument("csv", help="Processed features CSV.")
+    parser.add_argument("--out", default=DEFAULT_FORECASTER_PATH, help="Where to save the booster.")
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.csv)
+    if not has_forecast_features(df):
+        missing = sorted(set(FORECAST_FEATURES + ["qty"]) - set(df.columns))
+        parser.error(f"{args.csv} lacks forecast features: {', '.join(missing)}")
+    metrics = train_forecaster(df, args.out).metrics
+    print(f"Saved {args.out}: MAE {metrics['mae']:.2f} · RMSE {metrics['rmse']:.2f} · R² {metrics['r2']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Columnar hybrid pricing: base (RL or static) prices with shock overrides.
+
+The notebook's ``apply_shock_override`` runs once per row through
+``DataFrame.apply``. The same rules run here as masked array operations
+over the whole catalog, touching only the shocked rows:
+
+* Demand Spike → ``min(price * (1 + surge), competitor * SPIKE_COMPETITOR_CAP)``
+* Demand Drop  → ``max(price * (1 - floor), cost * DROP_COST_FLOOR)``
+* Normal       → unchanged
+
+``surge_cap`` and ``discount_floor`` are the sidebar's percentages.
+"""
+
+import numpy as np
+import pandas as pd
+
+SPIKE_COMPETITOR_CAP = 1.5    # surged price <= competitor * cap
+DROP_COST_FLOOR      = 1.05   # discounted price >= cost * floor
+
+
+def override_masks(df):
+    """``(surge, discount)`` row masks.
+
+    Detector output (``shock_type``) surges spikes and discounts drops.
+    Frames flagged only by ``demand_shock`` surge shocked rows priced below
+    the competitor and discount the rest.
+    """
+    if "shock_type" in df.columns:
+        shock_type = df["shock_type"]
+        return (shock_type == "Demand Spike").to_numpy(), (shock_type == "Demand Drop").to_numpy()
+
+    shocked = (df["demand_shock"] == 1).to_numpy()
+    if "price_vs_competitor" in df.columns:
+        below = (df["price_vs_competitor"] < 1.0).to_numpy()
+    else:
+        below = (df["unit_price"] < df["avg_competitor_price"]).to_numpy()
+    return shocked & below, shocked & ~below
+
+
+def override_prices(price, competitor_price, cost, surge, discount, surge_cap=30, discount_floor=20):
+    """Final prices: ``price`` with the spike / drop rules applied where ``surge`` / ``discount``."""
+    final = np.array(price, dtype=float)
+    final[surge] = np.minimum(
+        final[surge] * (1 + surge_cap / 100), np.asarray(competitor_price, dtype=float)[surge] * SPIKE_COMPETITOR_CAP
+    )
+    final[discount] = np.maximum(
+        final[discount] * (1 - discount_floor / 100), np.asarray(cost, dtype=float)[discount] * DROP_COST_FLOOR
+    )
+    return final
+
+
+def hybrid_prices(df, surge_cap=30, discount_floor=20, price_column=None):
+    """Final hybrid price and profit per row of ``df``.
+
+    The base price is ``price_column``, defaulting to the RL agent's
+    ``rl_price`` when present and ``unit_price`` otherwise. Profit uses the
+    observed ``qty``, as in the notebook.
+    """
+    price_column    = price_column or ("rl_price" if "rl_price" in df.columns else "unit_price")
+    surge, discount = override_masks(df)
+    cost  = df["estimated_cost"].to_numpy(dtype=float)
+    final = override_prices(
+        df[price_column].to_numpy(dtype=float), df["avg_competitor_price"].to_numpy(dtype=float),
+        cost, surge, discount, surge_cap, discount_floor,
+    )
+    return pd.DataFrame(
+        {"final_price": final, "final_profit": (final - cost) * df["qty"].to_numpy(dtype=float)},
+        index=df.index,
+    )
@@ -0,0 +1,191 @@
+"""Incremental feature updates for monthly data drops.
+
+Instead of re-engineering the whole history, a small per-product state is
+kept between runs:
+
+* ``moments`` — per-product (count, mean, M2) of ``qty``, the sufficient
+  statistics behind the ``mean + 2*std`` shock threshold;
+* ``tail`` — the last ``LONG_WINDOW`` raw rows of each product, enough to
+  continue the lagged rolling windows and ``pct_change`` columns;
+* ``rng`` — the inventory draw generator, so successive slices continue
+  one random stream.
+
+Appending a new ``month_year`` slice engineers only the new rows and
+re-flags shocks only for the products it touches; a slice repeating a
+month the state already holds for a product is rejected. Starting from
+``empty_state()`` and applying the full history as one slice gives the
+streaming-ingestion output.
+
+Apply a monthly export to a persisted state and feature store::
+
+    python -m pricing_engine.incremental new_month.csv --store
+"""
+
+import argparse
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from pricing_engine.dtypes import compact_frame, concat_compact
+from pricing_engine.feature_store import (
+    DEFAULT_STORE_ROOT,
+    load_features,
+    store_exists,
+    write_feature_store,
+)
+from pricing_engine.features import INVENTORY_SEED
+from pricing_engine.streaming import (
+    TAIL_DTYPES,
+    chunk_moments,
+    engineer_chunk,
+    merge_moments,
+    shock_thresholds,
+)
+
+DEFAULT_STATE_PATH = os.path.join("data", "processed", "feature_state.pkl")
+STATE_VERSION      = 1
+
+
+# ─────────────────────────────────────────────
+#  STATE
+# ─────────────────────────────────────────────
+def empty_state():
+    """State before any data has been seen."""
+    return {
+        "version": STATE_VERSION,
+        "moments": None,
+        "tail"   : pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in TAIL_DTYPES.items()}),
+        "rng"    : np.random.RandomState(INVENTORY_SEED),
+    }
+
+
+def save_state(state, path=DEFAULT_STATE_PATH):
+    with open(path, "wb") as fh:
+        pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def load_state(path=DEFAULT_STATE_PATH):
+    """Loads a saved state, or returns ``empty_state()`` if ``path`` is missing."""
+    if not os.path.exists(path):
+        return empty_state()
+    with open(path, "rb") as fh:
+        state = pickle.load(fh)
+    if state.get("version") != STATE_VERSION:
+        raise ValueError(f"Feature state at {path} has version {state.get('version')}, expected {STATE_VERSION}")
+    return state
+
+
+# ─────────────────────────────────────────────
+#  UPDATES
+# ─────────────────────────────────────────────
+def _check_new_months(raw, tail):
+    """Raises if a product's slice rows do not all postdate the months the state holds."""
+    months    = pd.to_datetime(raw["month_year"], format="%d-%m-%Y", errors="coerce")
+    first_new = months.groupby(raw["product_id"], sort=False).min()
+    last_seen = tail.groupby("product_id", sort=False)["month_year"].max()
+    first_new, last_seen = first_new.align(last_seen, join="inner")
+    stale = first_new <= last_seen
+    if stale.any():
+        raise ValueError(
+            "Slice repeats or precedes months already applied; "
+            f"stale rows for: {', '.join(map(str, stale[stale].index[:5]))}"
+        )
+
+
+def apply_slice(raw, state, notebook_features=False):
+    """Engineers a new raw slice against ``state``.
+
+    Returns the slice's engineered rows and the updated state; ``state``
+    itself is left untouched except for its random generator. Rows of a
+    product must be later than anything already in the state, so a month
+    is never applied twice.
+    """
+    old_tail = state["tail"]
+    _check_new_months(raw, old_tail)
+    products = pd.Index(raw["product_id"].unique())
+    moments  = merge_moments(state["moments"], chunk_moments(raw["qty"], raw["product_id"]))
+
+    carried  = old_tail["product_id"].isin(products).to_numpy()
+    features, new_tail = engineer_chunk(
+        raw,
+        old_tail[carried] if carried.any() else None,
+        shock_thresholds(moments.loc[products]),
+        state["rng"],
+        notebook_features,
+    )
+
+    tail = pd.concat([old_tail[~carried], new_tail], ignore_index=True).astype(TAIL_DTYPES)
+    return features, {**state, "moments": moments, "tail": tail}
+
+
+def refresh_shock_flags(features, state, products):
+    """Re-flags ``demand_shock`` of ``products``' rows against the current thresholds, in place.
+
+    Only those products' rows are read, and only flags that flip are written.
+    """
+    rows = np.flatnonzero(features["product_id"].isin(products).to_numpy())
+    if not len(rows):
+        return features
+    thresholds = shock_thresholds(state["moments"])
+    affected   = features.iloc[rows]
+    flags      = affected["qty"].to_numpy(dtype=float) > affected["product_id"].map(thresholds).to_numpy(dtype=float)
+    flipped    = flags != affected["demand_shock"].to_numpy(dtype=bool)
+    if flipped.any():
+        # Swap in one patched column: store reads can be read-only Arrow buffers.
+        shock = features["demand_shock"].to_numpy(copy=True)
+        shock[rows[flipped]] = flags[flipped]
+        features["demand_shock"] = shock
+    return features
+
+
+def update_features(features, raw, state, notebook_features=False, compact=False):
+    """Appends a new raw slice to an engineered frame.
+
+    New rows are appended after the existing ones (each product stays in
+    chronological order); older rows of the slice's products get their
+    shock flags refreshed in place because their thresholds moved. With
+    ``compact``, only the new rows are converted (``compact_frame``) before
+    joining a compact history.
+    """
+    new_rows, state = apply_slice(raw, state, notebook_features)
+    if compact:
+        new_rows = compact_frame(new_rows)
+    if features is None or features.empty:
+        return new_rows, state
+    history = refresh_shock_flags(features, state, raw["product_id"].unique())
+    return concat_compact([history, new_rows]), state
+
+
+# ─────────────────────────────────────────────
+#  CLI
+# ─────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a new month of raw data to the saved feature state.")
+    parser.add_argument("csv", help="Raw export holding only the new rows.")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH, help="State file to read and update.")
+    parser.add_argument("--store", nargs="?", const=DEFAULT_STORE_ROOT, help="Also update this feature store.")
+    parser.add_argument("--notebook-features", action="store_true", help="Add the notebook columns.")
+    args = parser.parse_args(argv)
+
+    raw   = pd.read_csv(args.csv)
+    state = load_state(args.state)
+    new_rows, state = apply_slice(raw, state, args.notebook_features)
+
+    if args.store:
+        # Only the affected products' categories hold rows whose flags can change.
+        categories = raw["product_category_name"].unique()
+        history    = load_features(args.store, categories=categories) if store_exists(args.store) else None
+        if history is not None and not history.empty:
+            history = refresh_shock_flags(history, state, raw["product_id"].unique())
+            new_rows = pd.concat([history, new_rows], ignore_index=True)
+        write_feature_store(new_rows, args.store, overwrite=False)
+
+    save_state(state, args.state)
+    print(f"Applied {len(raw):,} raw rows for {raw['product_id'].nunique():,} products -> {args.state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Headline metrics and elasticity summaries shown on the dashboard."""
+
+from pricing_engine.backtest import replay, strategy_profits
+
+ELASTIC_BELOW   = 0.95   # price_vs_competitor under this → elastic
+UNUSUAL_ABOVE   = 1.05   # price_vs_competitor over this  → unusual
+
+
+def summary_metrics(df, surge_cap=30, discount_floor=20, replayed=None):
+    """KPI strip values: backtested strategy profits and shock counts.
+
+    ``replayed`` is ``df`` after ``backtest.replay`` (replayed here without
+    a detector or policy when not given). With detector labels, spikes and
+    drops are its ``shock_type``; otherwise shocks beating the trailing
+    30-day average are spikes and the rest drops, or an even split without
+    ``rolling_demand_30d``.
+    """
+    replayed = replay(df) if replayed is None else replayed
+    if "shock_type" in replayed.columns:
+        total_shocks = int(replayed["is_anomaly"].sum())
+        spikes       = int((replayed["shock_type"] == "Demand Spike").sum())
+        drops        = int((replayed["shock_type"] == "Demand Drop").sum())
+    else:
+        total_shocks = int(replayed["demand_shock"].sum())
+        if "rolling_demand_30d" in replayed.columns:
+            spikes = int(((replayed["demand_shock"] == 1) & (replayed["qty"] > replayed["rolling_demand_30d"])).sum())
+        else:
+            spikes = total_shocks // 2
+        drops = total_shocks - spikes
+
+    return {
+        **strategy_profits(replayed, surge_cap, discount_floor),
+        "total_shocks": total_shocks,
+        "spikes"      : spikes,
+        "drops"       : drops,
+    }
+
+
+def elasticity_counts(df):
+    """Rows classed elastic / inelastic / unusual by ``price_vs_competitor``."""
+    ratio = df["price_vs_competitor"]
+    return {
+        "Elastic"  : int((ratio < ELASTIC_BELOW).sum()),
+        "Inelastic": int(ratio.between(ELASTIC_BELOW, UNUSUAL_ABOVE).sum()),
+        "Unusual"  : int((ratio > UNUSUAL_ABOVE).sum()),
+    }
+
+
+def category_price_comparison(df):
+    """Mean own price, demand and competitor price per category."""
+    comp = "avg_competitor_price" if "avg_competitor_price" in df.columns else "unit_price"
+    return df.groupby("product_category_name", observed=True).agg(
+        avg_price=("unit_price", "mean"),
+        avg_qty=("qty", "mean"),
+        avg_comp=(comp, "mean"),
+    ).reset_index()
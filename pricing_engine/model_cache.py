@@ -0,0 +1,91 @@
+"""Content-addressed cache for fitted XGBoost regressors.
+
+Models are keyed by a hash of the training frame, the feature list and the
+hyperparameters, so a rerun on the same data reuses the fitted booster
+instead of refitting. Entries live in an in-memory LRU and, when a
+directory is given, as ``<key>.ubj`` boosters on disk across restarts.
+The disk tier keeps the same ``maxsize`` bound, evicting the least
+recently used file (by modification time, refreshed on every disk hit).
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import pandas as pd
+from xgboost import XGBRegressor
+
+DEFAULT_CACHE_DIR = os.path.join("data", "processed", "model_cache")
+DEFAULT_MAXSIZE   = 8
+
+
+def training_key(X, y, params):
+    """SHA-256 over the training values, column names/order and ``params``."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([list(map(str, X.columns)), params], sort_keys=True, default=str).encode())
+    digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(y, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ModelCache:
+    """In-memory LRU of fitted regressors with an optional, equally bounded on-disk tier."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, directory=DEFAULT_CACHE_DIR):
+        self.maxsize   = maxsize
+        self.directory = directory
+        self._models   = OrderedDict()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.ubj")
+
+    def _remember(self, key, model):
+        self._models[key] = model
+        self._models.move_to_end(key)
+        while len(self._models) > self.maxsize:
+            self._models.popitem(last=False)
+
+    def _evict_disk(self):
+        entries = [
+            entry for entry in os.scandir(self.directory)
+            if entry.name.endswith(".ubj") and ".tmp." not in entry.name
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:max(0, len(entries) - self.maxsize)]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass   # evicted concurrently
+
+    def get(self, key):
+        """Returns the cached model for ``key`` or ``None``."""
+        if key in self._models:
+            self._models.move_to_end(key)
+            return self._models[key]
+        if self.directory and os.path.exists(self._path(key)):
+            model = XGBRegressor()
+            model.load_model(self._path(key))
+            os.utime(self._path(key))   # mark as recently used
+            self._remember(key, model)
+            return model
+        return None
+
+    def put(self, key, model):
+        self._remember(key, model)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write then rename so a concurrent reader never sees half a file.
+            tmp = os.path.join(self.directory, f"{key}.{os.getpid()}.tmp.ubj")
+            model.save_model(tmp)
+            os.replace(tmp, self._path(key))
+            self._evict_disk()
+
+    def fit(self, X, y, **params):
+        """Returns ``XGBRegressor(**params)`` fitted on ``X``/``y``, reusing a cached fit."""
+        key   = training_key(X, y, params)
+        model = self.get(key)
+        if model is None:
+            model = XGBRegressor(**params).fit(X, y)
+            self.put(key, model)
+        return model
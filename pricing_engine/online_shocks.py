@@ -0,0 +1,183 @@
+"""Streaming demand-shock detection, one sales event (or micro-batch) at a time.
+
+Each product owns one row of a fixed-width, array-backed state table:
+
+* Welford ``count`` / ``mean`` / ``m2`` of ``qty``, for a running spread;
+* an EWMA of ``qty``, the expected demand for the next event;
+* the last ``LONG_WINDOW`` quantities, whose mean is the trailing demand
+  (``rolling_demand_30d``) when an event does not carry it.
+
+An event is anomalous when its ``qty`` is more than ``k`` running standard
+deviations from the EWMA, once the product has ``min_history`` events.
+Anomalies are then typed as in the notebook's ``df_clean['shock_type']``:
+a spike above the trailing demand, a drop below it. Scoring and updating
+are O(1) per event and memory grows only with the number of products.
+"""
+
+import math
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from pricing_engine.features import LONG_WINDOW, SHOCK_STD_MULTIPLIER
+from pricing_engine.shock_detector import SHOCK_DTYPE, SHOCK_TYPES
+
+DEFAULT_ONLINE_STATE_PATH = os.path.join("data", "processed", "online_shock_state.pkl")
+EWMA_ALPHA                = 0.3
+MIN_HISTORY               = 3
+INITIAL_CAPACITY          = 1_024
+
+_NORMAL, _SPIKE, _DROP = (SHOCK_TYPES.index(label) for label in ["Normal", "Demand Spike", "Demand Drop"])
+
+
+class OnlineShockDetector:
+    """Per-product running statistics with O(1) shock flags per event."""
+
+    def __init__(self, k=SHOCK_STD_MULTIPLIER, alpha=EWMA_ALPHA, min_history=MIN_HISTORY, window=LONG_WINDOW):
+        self.k           = k
+        self.alpha       = alpha
+        self.min_history = min_history
+        self.window      = window
+        self.slots       = {}   # product_id -> state row
+
+        self.count  = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self.mean   = np.zeros(INITIAL_CAPACITY)
+        self.m2     = np.zeros(INITIAL_CAPACITY)
+        self.ewma   = np.zeros(INITIAL_CAPACITY)
+        self.recent = np.zeros((INITIAL_CAPACITY, window))
+
+    # ── State table ───────────────────────────
+    def _grow(self, size):
+        capacity = len(self.count)
+        while capacity < size:
+            capacity *= 2
+        for name in ["count", "mean", "m2", "ewma", "recent"]:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _slot(self, product_id):
+        """State row of ``product_id``, registering a new product."""
+        row = self.slots.setdefault(product_id, len(self.slots))
+        if row >= len(self.count):
+            self._grow(row + 1)
+        return row
+
+    def _slots(self, product_ids):
+        """State rows for ``product_ids`` (one lookup per distinct product)."""
+        codes, uniques = pd.factorize(np.asarray(product_ids, dtype=object))
+        rows = np.fromiter((self._slot(product) for product in uniques.tolist()), dtype=np.int64, count=len(uniques))
+        return rows[codes]
+
+    def trailing_demand(self, rows):
+        """Mean of each product's last ``window`` quantities (NaN before any event)."""
+        filled = np.minimum(self.count[rows], self.window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.recent[rows].sum(axis=1) / filled
+
+    # ── Scoring ───────────────────────────────
+    def _step(self, rows, qty, trailing):
+        """Scores then absorbs one event per row; ``rows`` must be distinct."""
+        count, ewma = self.count[rows], self.ewma[rows]
+        if trailing is None:
+            trailing = self.trailing_demand(rows)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(self.m2[rows] / (count - 1))
+        ready   = (count >= self.min_history) & (std > 0)
+        z       = np.where(ready, (qty - ewma) / np.where(ready, std, 1.0), 0.0)
+        anomaly = np.abs(z) > self.k
+        shock   = np.select([anomaly & (qty > trailing), anomaly & (qty < trailing)], [_SPIKE, _DROP], _NORMAL)
+
+        new_count = count + 1
+        delta     = qty - self.mean[rows]
+        self.mean[rows] += delta / new_count
+        self.m2[rows]   += delta * (qty - self.mean[rows])
+        self.ewma[rows]  = np.where(count == 0, qty, self.alpha * qty + (1 - self.alpha) * ewma)
+        self.recent[rows, count % self.window] = qty
+        self.count[rows] = new_count
+        return shock, z
+
+    def update(self, product_id, qty, rolling_demand_30d=None):
+        """Consumes one event; returns its ``shock_type`` label.
+
+        Scalar twin of ``_step`` (NumPy call overhead dominates a 1-row
+        array update).
+        """
+        row   = self._slot(product_id)
+        qty   = float(qty)
+        count = int(self.count[row])
+        mean, m2, ewma = float(self.mean[row]), float(self.m2[row]), float(self.ewma[row])
+        if rolling_demand_30d is None:
+            filled   = min(count, self.window)
+            trailing = float(self.recent[row].sum()) / filled if filled else float("nan")
+        else:
+            trailing = float(rolling_demand_30d)
+
+        shock = _NORMAL
+        std   = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+        if count >= self.min_history and std > 0 and abs(qty - ewma) / std > self.k:
+            shock = _SPIKE if qty > trailing else _DROP if qty < trailing else _NORMAL
+
+        delta = qty - mean
+        mean += delta / (count + 1)
+        self.mean[row] = mean
+        self.m2[row]   = m2 + delta * (qty - mean)
+        self.ewma[row] = qty if count == 0 else self.alpha * qty + (1 - self.alpha) * ewma
+        self.recent[row, count % self.window] = qty
+        self.count[row] = count + 1
+        return SHOCK_TYPES[shock]
+
+    def update_batch(self, product_ids, qty, rolling_demand_30d=None):
+        """Consumes a micro-batch in order; returns ``(shock_type, z_score)`` arrays.
+
+        Events are applied in rounds: round ``r`` holds every product's
+        ``r``-th event of the batch, so each round is one array update and
+        the result equals feeding the events one by one.
+        """
+        rows     = self._slots(product_ids)
+        qty      = np.asarray(qty, dtype=float)
+        trailing = None if rolling_demand_30d is None else np.asarray(rolling_demand_30d, dtype=float)
+        rounds   = pd.Series(rows).groupby(rows).cumcount().to_numpy()
+
+        shock = np.empty(len(rows), dtype=np.int64)
+        z     = np.empty(len(rows))
+        for r in range(rounds.max() + 1 if len(rows) else 0):
+            events = np.flatnonzero(rounds == r)
+            shock[events], z[events] = self._step(
+                rows[events], qty[events], None if trailing is None else trailing[events]
+            )
+        return pd.Categorical.from_codes(shock, dtype=SHOCK_DTYPE), z
+
+    def detect(self, df, batch_rows=10_000):
+        """Replays ``df`` in ``month_year`` order as micro-batches; returns ``df`` with ``shock_type``."""
+        ordered = df.sort_values("month_year", kind="stable") if "month_year" in df.columns else df
+        trailing = ordered["rolling_demand_30d"] if "rolling_demand_30d" in ordered.columns else None
+        codes = np.empty(len(ordered), dtype=np.int64)
+        for start in range(0, len(ordered), batch_rows):
+            end = start + batch_rows
+            shock, _ = self.update_batch(
+                ordered["product_id"].to_numpy()[start:end],
+                ordered["qty"].to_numpy()[start:end],
+                None if trailing is None else trailing.to_numpy()[start:end],
+            )
+            codes[start:end] = shock.codes
+        shock_type = pd.Series(pd.Categorical.from_codes(codes, dtype=SHOCK_DTYPE), index=ordered.index)
+        return df.assign(shock_type=shock_type.reindex(df.index))
+
+    # ── Persistence ───────────────────────────
+    def save(self, path=DEFAULT_ONLINE_STATE_PATH):
+        with open(path, "wb") as fh:
+            pickle.dump(self, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+    @classmethod
+    def load(cls, path=DEFAULT_ONLINE_STATE_PATH):
+        """The saved detector, or a fresh one if ``path`` is missing."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, "rb") as fh:
+            return pickle.load(fh)
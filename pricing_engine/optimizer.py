@@ -0,0 +1,72 @@
+"""Catalog-wide optimal-price solver.
+
+Every product gets a row of candidate prices between its current price
+minus the discount floor and plus the surge cap. The whole
+products × candidates matrix is scored with ``demand.price_sweep`` in
+blocks of ``block_size`` products, so memory stays flat as the catalog
+grows.
+"""
+
+import numpy as np
+
+from pricing_engine.demand import price_sweep
+from pricing_engine.features import COST_RATIO
+
+DEFAULT_CANDIDATES = 201
+DEFAULT_BLOCK_SIZE = 20_000
+
+
+def product_snapshot(df):
+    """Latest price, competitor price and cost, plus mean demand, per product."""
+    agg = {
+        "current_price"   : ("unit_price", "last"),
+        "competitor_price": ("avg_competitor_price", "last"),
+        "base_demand"     : ("qty", "mean"),
+    }
+    if "estimated_cost" in df.columns:
+        agg["unit_cost"] = ("estimated_cost", "last")
+    if "product_category_name" in df.columns:
+        agg["product_category_name"] = ("product_category_name", "first")
+
+    snapshot = df.groupby("product_id", sort=False, observed=True).agg(**agg).reset_index()
+    if "unit_cost" not in snapshot.columns:
+        snapshot["unit_cost"] = snapshot["current_price"] * COST_RATIO
+    return snapshot
+
+
+def candidate_multipliers(surge_cap, discount_floor, n_candidates=DEFAULT_CANDIDATES):
+    """Price multipliers from ``1 - discount_floor%`` to ``1 + surge_cap%``, including 1."""
+    steps = np.linspace(1 - discount_floor / 100, 1 + surge_cap / 100, n_candidates)
+    return np.union1d(steps, [1.0])
+
+
+def optimize_prices(df, surge_cap=30, discount_floor=20, n_candidates=DEFAULT_CANDIDATES,
+                    block_size=DEFAULT_BLOCK_SIZE):
+    """Returns one row per product with its profit-maximising price.
+
+    Columns: ``product_id`` (and ``product_category_name`` if present),
+    ``current_price``, ``competitor_price``, ``optimal_price``,
+    ``price_change_pct``, ``expected_demand`` and ``expected_profit``.
+    """
+    snapshot    = product_snapshot(df)
+    multipliers = candidate_multipliers(surge_cap, discount_floor, n_candidates)
+
+    price   = snapshot["current_price"].to_numpy(dtype=float)
+    comp    = snapshot["competitor_price"].to_numpy(dtype=float)
+    base    = snapshot["base_demand"].to_numpy(dtype=float)
+    cost    = snapshot["unit_cost"].to_numpy(dtype=float)
+    best    = {name: np.empty(len(snapshot)) for name in ["optimal_price", "optimal_demand", "optimal_profit"]}
+
+    for start in range(0, len(snapshot), block_size):
+        block = slice(start, start + block_size)
+        sweep = price_sweep(np.outer(price[block], multipliers), comp[block], base[block], cost[block])
+        for name, out in best.items():
+            out[block] = sweep[name]
+
+    columns = ["product_id"] + (["product_category_name"] if "product_category_name" in snapshot.columns else [])
+    result  = snapshot[columns + ["current_price", "competitor_price"]].copy()
+    result["optimal_price"]    = best["optimal_price"]
+    result["price_change_pct"] = (best["optimal_price"] / price - 1) * 100
+    result["expected_demand"]  = best["optimal_demand"]
+    result["expected_profit"]  = best["optimal_profit"]
+    return result
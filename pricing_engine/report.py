@@ -0,0 +1,88 @@
+"""Executive pricing report: one recommended action per product.
+
+Actions are assigned with a single ``np.select`` over per-product columns
+and stored as an ordered categorical, so a million-product report costs a
+groupby plus a few array comparisons. ``action_labels`` turns the codes
+into the dashboard's display strings only at the edge.
+"""
+
+import numpy as np
+import pandas as pd
+
+MARKET_BAND = 0.05   # HOLD while within ±5% of the competitor price
+
+# Ordered as the report lists them: shock overrides first, HOLD last.
+ACTIONS      = ["SURGE", "DISCOUNT", "DECREASE", "INCREASE", "HOLD"]
+ACTION_DTYPE = pd.CategoricalDtype(ACTIONS, ordered=True)
+
+REPORT_COLUMNS = {
+    "product_id"           : "Product ID",
+    "product_category_name": "Category",
+    "unit_price"           : "Current Price ($)",
+    "avg_competitor_price" : "Competitor Price ($)",
+    "qty"                  : "Avg Demand",
+    "demand_shock"         : "Is Shock Active",
+    "action"               : "Recommended_Action",
+}
+
+
+def recommend_actions(unit_price, competitor_price, qty, demand_shock, demand_threshold):
+    """Vectorized action codes (``ACTION_DTYPE``) for aligned per-product arrays.
+
+    A shocked product surges when its demand is above ``demand_threshold``
+    and is discounted otherwise; the rest are repriced toward the market.
+    """
+    unit_price       = np.asarray(unit_price, dtype=float)
+    competitor_price = np.asarray(competitor_price, dtype=float)
+    shocked          = np.asarray(demand_shock) == 1
+    above            = np.asarray(qty, dtype=float) > demand_threshold
+
+    codes = np.select(
+        [
+            shocked & above,
+            shocked,
+            unit_price < competitor_price * (1 - MARKET_BAND),
+            unit_price > competitor_price * (1 + MARKET_BAND),
+        ],
+        [ACTIONS.index("SURGE"), ACTIONS.index("DISCOUNT"), ACTIONS.index("INCREASE"), ACTIONS.index("DECREASE")],
+        default=ACTIONS.index("HOLD"),
+    )
+    return pd.Categorical.from_codes(codes, dtype=ACTION_DTYPE)
+
+
+def build_executive_report(df):
+    """Latest snapshot and recommended ``action`` per product, action order first."""
+    agg = {
+        "unit_price"          : "last",
+        "avg_competitor_price": "last",
+        "qty"                 : "mean",
+        "demand_shock"        : "last",
+    }
+    if "product_category_name" in df.columns:
+        agg["product_category_name"] = "first"
+
+    report = df.groupby("product_id", observed=True).agg(agg).reset_index()
+    report["action"] = recommend_actions(
+        report["unit_price"], report["avg_competitor_price"], report["qty"],
+        report["demand_shock"], demand_threshold=df["qty"].mean(),
+    )
+    return report.sort_values("action", kind="stable").reset_index(drop=True)
+
+
+def action_labels(actions, surge_cap, discount_floor):
+    """Maps action codes to the dashboard's display strings (categories only)."""
+    labels = {
+        "SURGE"   : f"🚨 SURGE (+{surge_cap}%) - Demand Spike Detected",
+        "DISCOUNT": f"🚨 DISCOUNT (-{discount_floor}%) - Demand Drop Detected",
+        "DECREASE": "🔽 DECREASE (-5%) - Overpriced vs Market",
+        "INCREASE": "🔼 INCREASE (+5%) - Underpriced vs Market",
+        "HOLD"    : "⏸️ HOLD PRICE - Currently Optimal",
+    }
+    return actions.cat.rename_categories(labels)
+
+
+def executive_report_table(df, surge_cap, discount_floor):
+    """The downloadable report: display labels and executive column names."""
+    report = build_executive_report(df)
+    report["action"] = action_labels(report["action"], surge_cap, discount_floor)
+    return report.rename(columns=REPORT_COLUMNS)
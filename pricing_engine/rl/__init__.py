@@ -0,0 +1,28 @@
+"""Reinforcement-learning pricing agent: environments, training and inference.
+
+Kept out of the top-level ``pricing_engine`` imports, and each name below
+loads its submodule on first access, so pricing from NumPy policy exports
+never imports stable-baselines3 or torch.
+"""
+
+import importlib
+
+# public name -> submodule
+_EXPORTS = {
+    "DynamicPricingEnv": "env",
+    "NumpyPolicy"      : "runtime",
+    "PricingPolicy"    : "inference",
+    "ProductVecEnv"    : "vec_env",
+    "export_policy"    : "runtime",
+    "prepare_rl_frame" : "env",
+    "price_catalog"    : "inference",
+    "train_policies"   : "train",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
@@ -0,0 +1,199 @@
+"""Array-backed ``DynamicPricingEnv`` for PPO training.
+
+Same state, action and reward as the notebook environment, but every
+per-row value is extracted once at construction: the seven static state
+columns live in one contiguous float32 matrix, and the economics (price,
+demand, competitor price, cost) are held as Python floats, so ``step`` is
+plain scalar arithmetic with no pandas access.
+"""
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+
+from pricing_engine.demand import DEMAND_FACTORS, RATIO_BREAKPOINTS
+
+# ─────────────────────────────────────────────
+#  CONSTANTS
+# ─────────────────────────────────────────────
+PRICE_STEPS      = (0.95, 1.0, 1.05)   # action → price multiplier
+COST_FLOOR       = 1.05                # price >= cost * COST_FLOOR
+COMPETITOR_CAP   = 2.0                 # price <= competitor * COMPETITOR_CAP
+CHURN_RATIO      = 1.2                 # price ratio above which churn is penalised
+CHURN_PENALTY    = 0.5
+REWARD_CLIP      = 2.0
+RATIO_EPS        = 1e-5
+RATIO_OBS_SCALE  = 3.0
+N_OBS            = 8
+
+RL_COLUMNS = [
+    "product_id", "month_year", "unit_price", "qty",
+    "profit", "avg_competitor_price", "price_vs_competitor",
+    "rolling_demand_30d", "inventory_level", "product_score",
+    "demand_shock", "estimated_cost",
+]
+
+# Normalised state column ← source column
+NORM_COLUMNS = {
+    "price_norm"      : "unit_price",
+    "demand_norm"     : "qty",
+    "comp_price_norm" : "avg_competitor_price",
+    "score_norm"      : "product_score",
+    "roll_demand_norm": "rolling_demand_30d",
+}
+STATE_COLUMNS = list(NORM_COLUMNS) + ["inventory_encoded", "demand_shock"]
+
+_PRICE_STEPS = np.array(PRICE_STEPS)
+_BREAKPOINTS = RATIO_BREAKPOINTS.tolist()
+_FACTORS     = DEMAND_FACTORS.tolist()
+
+
+# ─────────────────────────────────────────────
+#  DATA PREPARATION
+# ─────────────────────────────────────────────
+def min_max(values, lo, hi):
+    """``MinMaxScaler`` on one column with a fitted range: constant ranges map to 0."""
+    return (values - lo) / (hi - lo if hi > lo else 1.0)
+
+
+def rl_scaling(df):
+    """The training statistics of the state columns, JSON-ready.
+
+    ``ranges`` holds each normalised source column's ``[min, max]`` and
+    ``inventory_edges`` the two inventory tercile cut points, both over the
+    rows ``prepare_rl_frame`` keeps.
+    """
+    rows = df[RL_COLUMNS].dropna()
+    return {
+        "ranges"         : {
+            source: [float(rows[source].min()), float(rows[source].max())]
+            for source in NORM_COLUMNS.values()
+        },
+        "inventory_edges": rows["inventory_level"].astype(float).quantile([1 / 3, 2 / 3]).tolist(),
+    }
+
+
+def prepare_rl_frame(df, extra_columns=(), scaling=None):
+    """The notebook's ``rl_df``: RL columns, tercile inventory code, min-max state columns.
+
+    ``scaling`` (see ``rl_scaling``) fixes the min-max ranges and tercile
+    edges; training fits it on ``df`` itself, inference passes the run's
+    saved one so a frame of any size gets the states the policy was
+    trained on. ``extra_columns`` (e.g. the category used to split
+    training) ride along untouched.
+    """
+    scaling = scaling or rl_scaling(df)
+    extra   = [c for c in extra_columns if c not in RL_COLUMNS]
+    rl_df   = df[RL_COLUMNS + extra].dropna(subset=RL_COLUMNS).reset_index(drop=True)
+    # Upper edges inclusive, as ``pd.qcut`` bins them; tied edges just leave a tercile empty.
+    rl_df["inventory_encoded"] = np.digitize(
+        rl_df["inventory_level"].to_numpy(dtype=float), scaling["inventory_edges"], right=True
+    )
+    for norm, source in NORM_COLUMNS.items():
+        rl_df[norm] = min_max(rl_df[source].astype(float), *scaling["ranges"][source])
+    return rl_df
+
+
+def state_matrix(data):
+    """``(n, N_OBS)`` float32 observations with the live price-ratio slot left at 0."""
+    state = np.zeros((len(data), N_OBS), dtype=np.float32)
+    state[:, :len(STATE_COLUMNS)] = data[STATE_COLUMNS].to_numpy(dtype=np.float32)
+    state[:, STATE_COLUMNS.index("inventory_encoded")] /= 2.0
+    return np.clip(state, 0.0, 1.0)
+
+
+def reprice(current_price, actions, cost, competitor_price, base_qty):
+    """Array form of one ``step``: ``(price, price_ratio, simulated_qty, profit)`` per row."""
+    price = np.clip(current_price * _PRICE_STEPS[actions], cost * COST_FLOOR, competitor_price * COMPETITOR_CAP)
+    ratio = price / (competitor_price + RATIO_EPS)
+    simulated_qty = np.maximum(1.0, base_qty * DEMAND_FACTORS[np.digitize(ratio, RATIO_BREAKPOINTS)])
+    return price, ratio, simulated_qty, (price - cost) * simulated_qty
+
+
+def tier_factor(price_ratio):
+    """Scalar tiered demand factor (same breakpoints as ``demand.demand_factor``)."""
+    for edge, factor in zip(_BREAKPOINTS, _FACTORS):
+        if price_ratio < edge:
+            return factor
+    return _FACTORS[-1]
+
+
+# ─────────────────────────────────────────────
+#  ENVIRONMENT
+# ─────────────────────────────────────────────
+class DynamicPricingEnv(gym.Env):
+    """Walks ``data`` row by row, repricing by ±5% per step.
+
+    State (8): price, demand, competitor price, score and rolling demand
+    (min-max normalised), inventory tercile / 2, shock flag, and the live
+    price / competitor ratio / 3. Actions: 0 = -5%, 1 = hold, 2 = +5%.
+    Reward is the profit gain over static pricing relative to the static
+    profit, minus ``CHURN_PENALTY`` above ``CHURN_RATIO``, clipped to ±2.
+    """
+
+    metadata = {"render_modes": []}
+
+    def __init__(self, data):
+        super().__init__()
+        data = data.reset_index(drop=True)
+        self.n_steps = len(data)
+
+        self._state  = state_matrix(data)
+        self._price  = data["unit_price"].to_numpy(dtype=float).tolist()
+        self._qty    = data["qty"].to_numpy(dtype=float).tolist()
+        self._comp   = data["avg_competitor_price"].to_numpy(dtype=float).tolist()
+        self._cost   = data["estimated_cost"].to_numpy(dtype=float).tolist()
+
+        self.current_step  = 0
+        self.current_price = self._price[0]
+
+        self.action_space      = spaces.Discrete(3)
+        self.observation_space = spaces.Box(low=0.0, high=1.0, shape=(N_OBS,), dtype=np.float32)
+
+    def _get_obs(self):
+        i   = self.current_step
+        obs = self._state[i].copy()
+        obs[-1] = min(max(self.current_price / (self._comp[i] + RATIO_EPS) / RATIO_OBS_SCALE, 0.0), 1.0)
+        return obs
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self.current_step  = 0
+        self.current_price = self._price[0]
+        return self._get_obs(), {}
+
+    def step(self, action):
+        i          = self.current_step
+        cost       = self._cost[i]
+        comp_price = self._comp[i]
+        base_qty   = self._qty[i]
+
+        price = self.current_price * PRICE_STEPS[int(action)]
+        price = min(max(price, cost * COST_FLOOR), comp_price * COMPETITOR_CAP)
+        self.current_price = price
+
+        price_ratio   = price / (comp_price + RATIO_EPS)
+        simulated_qty = max(1.0, base_qty * tier_factor(price_ratio))
+
+        profit        = (price - cost) * simulated_qty
+        static_profit = (self._price[i] - cost) * base_qty
+        reward        = (profit - static_profit) / (abs(static_profit) + RATIO_EPS)
+        if price_ratio > CHURN_RATIO:
+            reward -= CHURN_PENALTY
+        reward = min(max(reward, -REWARD_CLIP), REWARD_CLIP)
+
+        self.current_step += 1
+        terminated = self.current_step >= self.n_steps - 1
+        obs = self._get_obs() if not terminated else np.zeros(N_OBS, dtype=np.float32)
+
+        info = {
+            "price"        : price,
+            "simulated_qty": simulated_qty,
+            "profit"       : profit,
+            "churn_penalty": max(0.0, (price_ratio - CHURN_RATIO) * profit),
+            "price_ratio"  : price_ratio,
+        }
+        return obs, reward, terminated, False, info
+
+    def render(self):
+        pass
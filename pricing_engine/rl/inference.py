@@ -0,0 +1,133 @@
+"""Batched PPO inference: price the whole catalog in one forward pass.
+
+The notebook walks one trajectory calling ``model_rl.predict(obs)`` per
+row. Here every row's 8-feature observation is built at once, with the
+live price-ratio slot taken from the row's own ``unit_price``, and each
+policy sees all of its rows in a single ``predict`` call. The chosen ±5%
+moves go through the environment's repricing rules, so prices, demand and
+profit match what ``DynamicPricingEnv.step`` would report for that row.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from pricing_engine.rl.env import (
+    RATIO_EPS,
+    RATIO_OBS_SCALE,
+    RL_COLUMNS,
+    prepare_rl_frame,
+    reprice,
+    state_matrix,
+)
+from pricing_engine.rl.runtime import RUNTIME_SUFFIX, NumpyPolicy, runtime_path
+from pricing_engine.rl.train import DEFAULT_MODEL_ROOT, latest_version_dir
+
+ACTION_LABELS = ["Decrease", "Hold", "Increase"]
+ACTION_DTYPE  = pd.CategoricalDtype(ACTION_LABELS, ordered=True)
+HOLD          = ACTION_LABELS.index("Hold")
+
+
+def catalog_observations(rl_df):
+    """``(n, N_OBS)`` float32 observations for a prepared RL frame, one per row."""
+    obs = state_matrix(rl_df)
+    ratio = rl_df["unit_price"].to_numpy(dtype=float) / (rl_df["avg_competitor_price"].to_numpy(dtype=float) + RATIO_EPS)
+    obs[:, -1] = np.clip(ratio / RATIO_OBS_SCALE, 0.0, 1.0)
+    return obs
+
+
+def load_model(path):
+    """A policy ready for ``predict``: the NumPy export when one exists, else the PPO ``.zip``."""
+    if not path.endswith(RUNTIME_SUFFIX) and os.path.exists(runtime_path(path)):
+        path = runtime_path(path)
+    if path.endswith(RUNTIME_SUFFIX):
+        return NumpyPolicy.load(path)
+
+    from stable_baselines3 import PPO
+    return PPO.load(path, device="cpu")
+
+
+class PricingPolicy:
+    """Trained PPO policies, loaded once and queried in batches.
+
+    Either one catalog-wide model (``group_by`` is ``None``) or one model per
+    value of ``group_by``, as written by ``train_policies``. Rows of a group
+    without a policy hold their price. ``scaling`` is the training run's
+    state scaling; without one (a bare policy file) each frame is scaled
+    on its own.
+    """
+
+    def __init__(self, models, group_by=None, source=None, scaling=None):
+        self.models   = models
+        self.group_by = group_by
+        self.source   = source
+        self.scaling  = scaling
+
+    @classmethod
+    def load(cls, path=None, root=DEFAULT_MODEL_ROOT):
+        """Loads a policy file or a versioned training run (default: the latest).
+
+        Exported NumPy runtimes are preferred, so torch is only imported
+        for policies that were never exported.
+        """
+        path = path or latest_version_dir(root)
+        if path is None:
+            raise FileNotFoundError(f"No trained policies under {root!r}; run python -m pricing_engine.rl.train")
+        if os.path.isfile(path):
+            return cls({None: load_model(path)}, source=path)
+
+        with open(os.path.join(path, "manifest.json")) as fh:
+            manifest = json.load(fh)
+        models = {
+            run["group"]: load_model(os.path.join(path, run.get("runtime", run["policy"])))
+            for run in manifest["runs"]
+        }
+        return cls(models, group_by=manifest["group_by"], source=path, scaling=manifest.get("scaling"))
+
+    def predict(self, obs, groups=None):
+        """Deterministic action per observation row: one forward pass per policy."""
+        if self.group_by is None:
+            actions, _ = self.models[None].predict(obs, deterministic=True)
+            return np.asarray(actions, dtype=np.int64)
+
+        actions = np.full(len(obs), HOLD, dtype=np.int64)
+        groups  = np.asarray(groups).astype(str)
+        for group, model in self.models.items():
+            rows = np.flatnonzero(groups == group)
+            if len(rows):
+                actions[rows], _ = model.predict(obs[rows], deterministic=True)
+        return actions
+
+
+def price_catalog(df, policy):
+    """The policy's pricing decision for every row of ``df``.
+
+    Returns product, month and category (when present) with the action, the
+    static and RL price, the simulated demand, and static vs RL profit, on
+    ``df``'s index for the rows the agent can observe.
+    """
+    extra   = [c for c in dict.fromkeys(["product_category_name", policy.group_by]) if c in df.columns]
+    rl_df   = prepare_rl_frame(df, extra_columns=extra, scaling=policy.scaling)
+    groups  = rl_df[policy.group_by] if policy.group_by else None
+    actions = policy.predict(catalog_observations(rl_df), groups)
+
+    static_price = rl_df["unit_price"].to_numpy(dtype=float)
+    cost         = rl_df["estimated_cost"].to_numpy(dtype=float)
+    qty          = rl_df["qty"].to_numpy(dtype=float)
+    rl_price, _, rl_qty, rl_profit = reprice(
+        static_price, actions, cost, rl_df["avg_competitor_price"].to_numpy(dtype=float), qty
+    )
+
+    # ``prepare_rl_frame`` keeps the rows with every RL column; index them as in ``df``.
+    observed = df.index[df[RL_COLUMNS].notna().all(axis=1).to_numpy()]
+    keys = [c for c in ["product_id", "product_category_name", "month_year"] if c in rl_df.columns]
+    return rl_df[keys].set_axis(observed).assign(
+        action=pd.Categorical.from_codes(actions, dtype=ACTION_DTYPE),
+        static_price=static_price,
+        rl_price=rl_price,
+        rl_qty=rl_qty,
+        static_profit=(static_price - cost) * qty,
+        rl_profit=rl_profit,
+    )
@@ -0,0 +1,132 @@
+"""NumPy-only runtime for trained PPO pricing policies.
+
+The serving path needs only the actor of a stable-baselines3
+``MlpPolicy``: a few dense layers over the 8 observations and a 3-way
+action head. ``export_policy`` dumps those weights to a small ``.npz``;
+``NumpyPolicy`` replays the forward pass with NumPy, so dashboards and
+batch workers can price the catalog without importing torch.
+
+Export every policy of a training run (``train_policies`` already does
+this for new runs)::
+
+    python -m pricing_engine.rl.runtime models/ppo/v001
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+RUNTIME_SUFFIX = ".npz"
+
+
+def _relu(x):
+    return np.maximum(x, 0)
+
+
+ACTIVATIONS = {"Tanh": np.tanh, "ReLU": _relu}
+
+
+def runtime_path(policy_path):
+    """``electronics.zip`` -> ``electronics.npz``."""
+    return os.path.splitext(policy_path)[0] + RUNTIME_SUFFIX
+
+
+# ─────────────────────────────────────────────
+#  EXPORT
+# ─────────────────────────────────────────────
+def export_policy(model, path):
+    """Writes the actor weights of a PPO ``MlpPolicy`` with a discrete action space to ``path``."""
+    from gymnasium import spaces
+    from stable_baselines3.common.torch_layers import FlattenExtractor
+    from torch import nn
+
+    policy     = model.policy
+    activation = policy.activation_fn.__name__
+    if not isinstance(model.action_space, spaces.Discrete):
+        raise ValueError("Only discrete-action policies can be exported.")
+    if not isinstance(policy.pi_features_extractor, FlattenExtractor) or activation not in ACTIVATIONS:
+        raise ValueError(f"Unsupported policy architecture: {type(policy).__name__} with {activation}.")
+
+    layers  = [m for m in policy.mlp_extractor.policy_net if isinstance(m, nn.Linear)]
+    layers += [policy.action_net]
+    arrays  = {}
+    for i, layer in enumerate(layers):
+        arrays[f"weight_{i}"] = layer.weight.detach().cpu().numpy().T
+        arrays[f"bias_{i}"]   = layer.bias.detach().cpu().numpy()
+    np.savez(path, activation=np.array(activation), **arrays)
+    return path
+
+
+def export_run(version_dir):
+    """Exports every policy of a ``train_policies`` run and records them in its manifest."""
+    from stable_baselines3 import PPO
+
+    manifest_path = os.path.join(version_dir, "manifest.json")
+    with open(manifest_path) as fh:
+        manifest = json.load(fh)
+    for run in manifest["runs"]:
+        policy_path = os.path.join(version_dir, run["policy"])
+        export_policy(PPO.load(policy_path, device="cpu"), runtime_path(policy_path))
+        run["runtime"] = os.path.basename(runtime_path(policy_path))
+    with open(manifest_path, "w") as fh:
+        json.dump(manifest, fh, indent=2)
+    return [run["runtime"] for run in manifest["runs"]]
+
+
+# ─────────────────────────────────────────────
+#  RUNTIME
+# ─────────────────────────────────────────────
+class NumpyPolicy:
+    """An exported actor: ``predict`` mirrors ``PPO.predict`` on a batch of observations."""
+
+    def __init__(self, weights, biases, activation="Tanh"):
+        self.weights    = weights
+        self.biases     = biases
+        self.activation = ACTIVATIONS[activation]
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as arrays:
+            n_layers = sum(name.startswith("weight_") for name in arrays.files)
+            weights  = [arrays[f"weight_{i}"] for i in range(n_layers)]
+            biases   = [arrays[f"bias_{i}"] for i in range(n_layers)]
+            return cls(weights, biases, str(arrays["activation"]))
+
+    def logits(self, obs):
+        """Action logits for ``(n, N_OBS)`` observations, in float32 like torch."""
+        x = np.asarray(obs, dtype=np.float32)
+        for weight, bias in zip(self.weights[:-1], self.biases[:-1]):
+            x = self.activation(x @ weight + bias)
+        return x @ self.weights[-1] + self.biases[-1]
+
+    def predict(self, obs, deterministic=True, rng=None):
+        """``(actions, None)``; greedy when ``deterministic``, else sampled from the softmax."""
+        logits = self.logits(np.atleast_2d(obs))
+        if not deterministic:
+            rng = rng or np.random.default_rng()
+            logits = logits + rng.gumbel(size=logits.shape)
+        actions = logits.argmax(axis=1)
+        return (actions if np.ndim(obs) > 1 else actions[0]), None
+
+
+# ─────────────────────────────────────────────
+#  CLI
+# ─────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export trained PPO policies to the NumPy runtime.")
+    parser.add_argument("path", help="Versioned training run directory, or a single policy .zip.")
+    args = parser.parse_args(argv)
+
+    if os.path.isdir(args.path):
+        exported = [os.path.join(args.path, name) for name in export_run(args.path)]
+    else:
+        from stable_baselines3 import PPO
+        exported = [export_policy(PPO.load(args.path, device="cpu"), runtime_path(args.path))]
+    for path in exported:
+        print(f"{path} ({os.path.getsize(path) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Parallel PPO training: one policy per category (or any grouping column).
+
+Each group trains in its own worker process on a ``ProductVecEnv`` over the
+group's products, with a seed derived from the base seed and the group
+name, so reruns are reproducible regardless of scheduling. Workers run
+single-threaded torch; wall-clock time scales with the number of cores.
+
+Policies land in a new versioned directory with a manifest::
+
+    models/ppo/v003/
+        manifest.json
+        electronics.zip      # PPO checkpoint
+        electronics.npz      # NumPy runtime export
+        ...
+
+Train from the processed CSV::
+
+    python -m pricing_engine.rl.train data/processed/cleaned_features_df.csv --workers 4
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import re
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from pricing_engine.rl.env import prepare_rl_frame, rl_scaling
+
+DEFAULT_MODEL_ROOT = os.path.join("models", "ppo")
+DEFAULT_TIMESTEPS  = 150_000
+DEFAULT_GROUP_BY   = "product_category_name"
+
+# The notebook's PPO settings; ``n_steps`` is the rollout size across all lanes.
+PPO_PARAMS = {
+    "learning_rate": 3e-4,
+    "n_steps"      : 256,
+    "batch_size"   : 64,
+    "n_epochs"     : 10,
+    "gamma"        : 0.90,
+    "ent_coef"     : 0.05,
+    "clip_range"   : 0.2,
+}
+
+
+# ─────────────────────────────────────────────
+#  HELPERS
+# ─────────────────────────────────────────────
+def group_seed(base_seed, group):
+    """Stable per-group seed (``hash()`` is salted per process, CRC32 is not)."""
+    return (base_seed + zlib.crc32(str(group).encode())) % 2**31
+
+
+def lane_steps(n_steps, batch_size, num_envs):
+    """Per-lane rollout length closest to ``n_steps`` in total whose rollout
+    splits into whole ``batch_size`` minibatches."""
+    multiple = batch_size // math.gcd(batch_size, num_envs)
+    return max(multiple, round(n_steps / num_envs / multiple) * multiple)
+
+
+def policy_filename(group):
+    return re.sub(r"[^\w.-]+", "_", str(group)) + ".zip"
+
+
+def next_version_dir(root=DEFAULT_MODEL_ROOT):
+    """``root/vNNN`` one past the highest existing version."""
+    os.makedirs(root, exist_ok=True)
+    versions = [int(name[1:]) for name in os.listdir(root) if re.fullmatch(r"v\d+", name)]
+    return os.path.join(root, f"v{max(versions, default=0) + 1:03d}")
+
+
+def latest_version_dir(root=DEFAULT_MODEL_ROOT):
+    """Highest ``root/vNNN`` with a manifest, or ``None``."""
+    if not os.path.isdir(root):
+        return None
+    versions = sorted(
+        (int(name[1:]), name) for name in os.listdir(root)
+        if re.fullmatch(r"v\d+", name) and os.path.exists(os.path.join(root, name, "manifest.json"))
+    )
+    return os.path.join(root, versions[-1][1]) if versions else None
+
+
+# ─────────────────────────────────────────────
+#  WORKER
+# ─────────────────────────────────────────────
+def train_group(group, data, out_dir, timesteps, seed, ppo_params=None):
+    """Trains one PPO policy on ``data`` and saves it; returns run metrics."""
+    import torch
+    from stable_baselines3 import PPO
+    from stable_baselines3.common.vec_env import VecMonitor
+
+    from pricing_engine.rl.runtime import export_policy, runtime_path
+    from pricing_engine.rl.vec_env import ProductVecEnv
+
+    # One core per worker: parallelism comes from the process pool.
+    torch.set_num_threads(1)
+    start = time.perf_counter()
+
+    env    = VecMonitor(ProductVecEnv(data))
+    params = {**PPO_PARAMS, **(ppo_params or {})}
+    params["n_steps"] = lane_steps(params["n_steps"], params["batch_size"], env.num_envs)
+    model  = PPO("MlpPolicy", env, seed=seed, verbose=0, **params)
+    model.learn(total_timesteps=timesteps)
+
+    path = os.path.join(out_dir, policy_filename(group))
+    model.save(path)
+    export_policy(model, runtime_path(path))
+    episodes = [info["r"] for info in model.ep_info_buffer]
+    seconds  = time.perf_counter() - start
+    return {
+        "group"           : str(group),
+        "policy"          : os.path.basename(path),
+        "runtime"         : os.path.basename(runtime_path(path)),
+        "seed"            : seed,
+        "products"        : env.num_envs,
+        "rows"            : len(data),
+        "timesteps"       : int(model.num_timesteps),
+        "seconds"         : round(seconds, 3),
+        "steps_per_second": round(model.num_timesteps / seconds, 1),
+        "mean_ep_reward"  : float(sum(episodes) / len(episodes)) if episodes else None,
+    }
+
+
+# ─────────────────────────────────────────────
+#  ORCHESTRATOR
+# ─────────────────────────────────────────────
+def train_policies(rl_df, group_by=DEFAULT_GROUP_BY, timesteps=DEFAULT_TIMESTEPS, workers=None,
+                   seed=0, root=DEFAULT_MODEL_ROOT, ppo_params=None, log=print):
+    """Trains one policy per ``group_by`` value in a process pool.
+
+    ``rl_df`` is a prepared RL frame (``prepare_rl_frame`` with ``group_by``
+    among its ``extra_columns``), normalised over the whole catalog so every
+    policy sees the same state scale. Returns the version directory; its
+    ``manifest.json`` records settings, that scaling (``rl_scaling``) for
+    inference, and per-run metrics.
+    """
+    groups  = {group: frame for group, frame in rl_df.groupby(group_by, sort=True)}
+    workers = workers or os.cpu_count() or 1
+    out_dir = next_version_dir(root)
+    os.makedirs(out_dir)
+
+    start, runs = time.perf_counter(), []
+    # spawn: torch does not survive fork reliably.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(groups)), mp_context=context) as pool:
+        futures = {
+            pool.submit(train_group, group, frame, out_dir, timesteps, group_seed(seed, group), ppo_params): group
+            for group, frame in groups.items()
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            run = future.result()
+            runs.append(run)
+            log(f"[{done}/{len(groups)}] {run['group']}: {run['timesteps']:,} steps "
+                f"in {run['seconds']:.1f}s ({run['steps_per_second']:,.0f}/s)")
+
+    manifest = {
+        "created"     : time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "group_by"    : group_by,
+        "timesteps"   : timesteps,
+        "base_seed"   : seed,
+        "workers"     : workers,
+        "ppo_params"  : {**PPO_PARAMS, **(ppo_params or {})},
+        "scaling"     : rl_scaling(rl_df),
+        "wall_seconds": round(time.perf_counter() - start, 3),
+        "runs"        : sorted(runs, key=lambda run: run["group"]),
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w") as fh:
+        json.dump(manifest, fh, indent=2)
+    log(f"Trained {len(runs)} policies in {manifest['wall_seconds']:.1f}s -> {out_dir}")
+    return out_dir
+
+
+# ─────────────────────────────────────────────
+#  CLI
+# ─────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train one PPO pricing policy per group in parallel.")
+    parser.add_argument("csv", help="Processed features CSV.")
+    parser.add_argument("--group-by", default=DEFAULT_GROUP_BY, help="Column defining one policy per value.")
+    parser.add_argument("--timesteps", type=int, default=DEFAULT_TIMESTEPS, help="Timesteps per policy.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed; each group derives its own.")
+    parser.add_argument("--root", default=DEFAULT_MODEL_ROOT, help="Directory holding versioned runs.")
+    args = parser.parse_args(argv)
+
+    rl_df = prepare_rl_frame(pd.read_csv(args.csv), extra_columns=[args.group_by])
+    train_policies(rl_df, args.group_by, args.timesteps, args.workers, args.seed, args.root)
+
+
+if __name__ == "__main__":
+    main()
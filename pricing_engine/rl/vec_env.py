@@ -0,0 +1,120 @@
+"""Natively vectorized pricing simulator: one lane per product.
+
+``ProductVecEnv`` walks every product's own monthly trajectory in parallel.
+Each lane follows ``DynamicPricingEnv`` semantics on its product's rows
+alone, so ``current_price`` never carries across products. One ``step``
+applies the ±5% actions, the cost / competitor clipping, the tiered demand
+and the churn penalty to all lanes as array operations. Lanes that finish
+reset on their own, stable-baselines3 style.
+"""
+
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import VecEnv
+
+from pricing_engine.rl.env import (
+    CHURN_PENALTY,
+    CHURN_RATIO,
+    N_OBS,
+    RATIO_EPS,
+    RATIO_OBS_SCALE,
+    REWARD_CLIP,
+    reprice,
+    state_matrix,
+)
+
+
+class ProductVecEnv(VecEnv):
+    """``DynamicPricingEnv`` dynamics for every product at once.
+
+    ``data`` is a prepared RL frame (``prepare_rl_frame``); it is grouped by
+    ``product_id`` and ordered by ``month_year`` within each lane. After each
+    step the per-lane ``last_price``, ``last_profit``, ``last_qty`` and
+    ``last_ratio`` arrays hold what the single env reports in ``info``.
+    """
+
+    def __init__(self, data):
+        data    = data.sort_values(["product_id", "month_year"], kind="stable").reset_index(drop=True)
+        keys    = data["product_id"].to_numpy()
+        starts  = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        lengths = np.diff(np.r_[starts, len(data)])
+
+        self.render_mode = None
+        super().__init__(
+            num_envs=len(starts),
+            observation_space=spaces.Box(low=0.0, high=1.0, shape=(N_OBS,), dtype=np.float32),
+            action_space=spaces.Discrete(3),
+        )
+        self.product_ids = keys[starts]
+        self._start      = starts
+        self._last_step  = lengths - 1
+
+        self._state = state_matrix(data)
+        self._price = data["unit_price"].to_numpy(dtype=float)
+        self._qty   = data["qty"].to_numpy(dtype=float)
+        self._comp  = data["avg_competitor_price"].to_numpy(dtype=float)
+        self._cost  = data["estimated_cost"].to_numpy(dtype=float)
+
+        self.current_step  = np.zeros(self.num_envs, dtype=np.int64)
+        self.current_price = self._price[self._start].copy()
+        self._actions      = np.ones(self.num_envs, dtype=np.int64)
+
+    # ── Core dynamics ─────────────────────────
+    def _obs(self):
+        rows = self._start + self.current_step
+        obs  = self._state[rows]
+        obs[:, -1] = np.clip(self.current_price / (self._comp[rows] + RATIO_EPS) / RATIO_OBS_SCALE, 0.0, 1.0)
+        return obs
+
+    def reset(self):
+        self.current_step[:] = 0
+        self.current_price   = self._price[self._start].copy()
+        return self._obs()
+
+    def step_async(self, actions):
+        self._actions = np.asarray(actions, dtype=np.int64).reshape(self.num_envs)
+
+    def step_wait(self):
+        rows = self._start + self.current_step
+        cost = self._cost[rows]
+        comp = self._comp[rows]
+        qty  = self._qty[rows]
+
+        price, ratio, simulated_qty, profit = reprice(self.current_price, self._actions, cost, comp, qty)
+        static_profit = (self._price[rows] - cost) * qty
+        reward        = (profit - static_profit) / (np.abs(static_profit) + RATIO_EPS)
+        reward        = np.clip(reward - CHURN_PENALTY * (ratio > CHURN_RATIO), -REWARD_CLIP, REWARD_CLIP)
+
+        self.current_price = price.copy()
+        self.current_step += 1
+        self.last_price, self.last_profit, self.last_qty, self.last_ratio = price, profit, simulated_qty, ratio
+
+        done  = self.current_step >= self._last_step
+        infos = [{} for _ in range(self.num_envs)]
+        if done.any():
+            finished = np.flatnonzero(done)
+            # The single env returns zeros as its terminal observation.
+            for lane in finished:
+                infos[lane]["terminal_observation"] = np.zeros(N_OBS, dtype=np.float32)
+            self.current_step[finished]  = 0
+            self.current_price[finished] = self._price[self._start[finished]]
+
+        return self._obs(), reward.astype(np.float32), done, infos
+
+    # ── VecEnv plumbing (no wrapped sub-envs) ─
+    def close(self):
+        pass
+
+    def get_attr(self, attr_name, indices=None):
+        value = getattr(self, attr_name)
+        return [value] * len(self._get_indices(indices))
+
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        result = getattr(self, method_name)(*method_args, **method_kwargs)
+        return [result] * len(self._get_indices(indices))
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False] * len(self._get_indices(indices))
@@ -0,0 +1,281 @@
+"""IsolationForest demand-shock detector, fitted once and scored incrementally.
+
+The notebook's ``IsolationForest(n_estimators=200, contamination=0.05)``
+over demand, trailing demand, its deviation and the own / competitor
+prices. The fitted forest is pickled on its own, written only when it is
+fitted. Next to it an append-only log (``scores_path``) caches the
+``decision_function`` scores keyed by a hash of each row's feature values,
+so a rerun or a new monthly slice only scores rows the detector has not
+seen, in batches of ``SCORE_BATCH_ROWS``, and only appends those. The
+cache keeps at most ``MAX_CACHED_SCORES`` rows, dropping the oldest
+first; the log is rewritten once it holds ``SCORE_LOG_COMPACTION`` times
+that many entries.
+
+Fitting is always explicit. Each saved detector is named after the
+training set it was fitted on (``detector_path``) and records that set's
+content key, so scoring another dataset never refits or overwrites it.
+Fit (or refit) the detector of a processed features CSV::
+
+    python -m pricing_engine.shock_detector data/processed/cleaned_features_df.csv
+"""
+
+import argparse
+import os
+import pickle
+import threading
+import time
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import IsolationForest
+
+from pricing_engine.backtest import dataset_key
+
+DETECTOR_DIR          = os.path.join("data", "processed", "shock_detectors")
+DEFAULT_TRAINING_SET  = "cleaned_features_df"
+DETECTOR_VERSION      = 3
+SCORE_BATCH_ROWS      = 50_000
+MAX_CACHED_SCORES     = 1_000_000
+SCORE_LOG_COMPACTION  = 2
+
+SHOCK_FEATURES = ["qty", "rolling_demand_30d", "demand_deviation", "unit_price", "avg_competitor_price"]
+FOREST_PARAMS  = {"n_estimators": 200, "contamination": 0.05, "random_state": 42}
+
+SHOCK_TYPES = ["Normal", "Demand Spike", "Demand Drop"]
+SHOCK_DTYPE = pd.CategoricalDtype(SHOCK_TYPES)
+
+
+def shock_features(df):
+    """The detector's input columns; ``demand_deviation`` is derived when absent."""
+    if "demand_deviation" not in df.columns:
+        df = df.assign(demand_deviation=df["qty"] - df["rolling_demand_30d"])
+    return df[SHOCK_FEATURES].astype(float)
+
+
+def detector_path(dataset, directory=DETECTOR_DIR):
+    """Where the detector fitted on training set ``dataset`` is saved."""
+    return os.path.join(directory, f"{dataset}.pkl")
+
+
+def scores_path(path):
+    """The score log kept next to the detector saved at ``path``."""
+    return os.path.splitext(path)[0] + ".scores"
+
+
+DEFAULT_DETECTOR_PATH = detector_path(DEFAULT_TRAINING_SET)
+
+
+def row_hashes(X):
+    """One uint64 per row over its feature values (index and order ignored)."""
+    return pd.util.hash_pandas_object(X, index=False).to_numpy()
+
+
+class ShockDetector:
+    """A persisted ``IsolationForest`` with a bounded per-row score cache.
+
+    ``fit`` must run (here or via the CLI) before ``score`` / ``detect``;
+    ``save`` persists the forest after a fit, while ``score`` only appends
+    its new scores to the log. Scoring and saving hold a lock, so one
+    instance can be shared by concurrent Streamlit sessions.
+    """
+
+    def __init__(self, path=DEFAULT_DETECTOR_PATH, params=None, max_scores=MAX_CACHED_SCORES):
+        self.path       = path
+        self.params     = {**FOREST_PARAMS, **(params or {})}
+        self.max_scores = max_scores
+        self.forest     = None
+        self.trained_on = None   # {"name", "key", "fitted_at"} of the training set
+        self.scores     = {}     # row hash -> score, oldest first
+        self._logged    = 0      # entries in the score log, evicted ones included
+        self._lock      = threading.Lock()
+
+    @property
+    def fitted(self):
+        return self.forest is not None
+
+    @property
+    def stamp(self):
+        """Identifies the fitted forest (training set key and fit time), for cache keys."""
+        if self.trained_on is None:
+            return None
+        return f"{self.trained_on['key']}@{self.trained_on['fitted_at']}"
+
+    @classmethod
+    def load(cls, path=DEFAULT_DETECTOR_PATH):
+        """The detector saved at ``path``, or an unfitted one if there is none."""
+        if not path or not os.path.exists(path):
+            return cls(path)
+        with open(path, "rb") as fh:
+            state = pickle.load(fh)
+        if state.get("version") != DETECTOR_VERSION:
+            raise ValueError(f"Shock detector at {path} has version {state.get('version')}, expected {DETECTOR_VERSION}")
+        detector = cls(path, state["params"])
+        detector.forest     = state["forest"]
+        detector.trained_on = state["trained_on"]
+        detector._load_scores()
+        return detector
+
+    def save(self):
+        """Persists the fitted forest and restarts the score log from the current cache."""
+        with self._lock:
+            if not self.path:
+                return None
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            state = {
+                "version"   : DETECTOR_VERSION,
+                "params"    : self.params,
+                "forest"    : self.forest,
+                "trained_on": self.trained_on,
+            }
+            # Write then rename so a concurrent reader never sees half a file.
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as fh:
+                pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+            self._rewrite_log()
+            return self.path
+
+    # ── Score log ─────────────────────────────
+    # A header record (the forest's ``stamp``) followed by ``(keys, scores)``
+    # array pairs, one per scoring pass that met new rows.
+    def _load_scores(self):
+        log = scores_path(self.path)
+        if not os.path.exists(log):
+            return
+        with open(log, "rb") as fh:
+            if pickle.load(fh) != self.stamp:
+                return   # scores of an earlier fit
+            while True:
+                try:
+                    keys, values = pickle.load(fh)
+                except (EOFError, pickle.UnpicklingError):
+                    break   # end of log, or a record cut short by a crash
+                self.scores.update(zip(keys.tolist(), values.tolist()))
+                self._logged += len(keys)
+        self._evict()
+
+    def _rewrite_log(self):
+        log  = scores_path(self.path)
+        keys = np.fromiter(self.scores, dtype=np.uint64, count=len(self.scores))
+        tmp  = f"{log}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            pickle.dump(self.stamp, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump((keys, np.fromiter(self.scores.values(), dtype=float, count=len(keys))), fh,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, log)
+        self._logged = len(keys)
+
+    def _log_scores(self, keys, values):
+        if not self.path or not os.path.exists(self.path):
+            return   # the forest itself was never saved
+        log = scores_path(self.path)
+        if not os.path.exists(log) or self._logged + len(keys) > SCORE_LOG_COMPACTION * self.max_scores:
+            self._rewrite_log()
+            return
+        with open(log, "ab") as fh:
+            pickle.dump((keys, values), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        self._logged += len(keys)
+
+    # ── Fitting and scoring ───────────────────
+    def fit(self, df, dataset=None):
+        """Fits a fresh forest on the complete rows of training set ``df`` and drops cached scores.
+
+        ``dataset`` names the training set (its content key when omitted).
+        """
+        X   = shock_features(df).dropna()
+        key = dataset_key(X)
+        forest = IsolationForest(**self.params).fit(X.to_numpy())
+        with self._lock:
+            self.forest     = forest
+            self.trained_on = {"name": dataset or key, "key": key, "fitted_at": time.time()}
+            self.scores     = {}
+        return self
+
+    def _evict(self):
+        excess = len(self.scores) - self.max_scores
+        if excess > 0:
+            for key in list(islice(self.scores, excess)):
+                del self.scores[key]
+
+    def score(self, df):
+        """``decision_function`` per row (NaN where a feature is missing).
+
+        Only rows whose feature hash is not cached yet reach the forest, and
+        only their scores are appended to the log.
+        """
+        if not self.fitted:
+            raise RuntimeError(
+                "Shock detector is not fitted: call fit() on a training set or run "
+                "`python -m pricing_engine.shock_detector <processed csv>`."
+            )
+        X      = shock_features(df)
+        scores = np.full(len(X), np.nan)
+        valid  = np.flatnonzero(X.notna().all(axis=1).to_numpy())
+        if not len(valid):
+            return scores
+
+        keys = row_hashes(X.iloc[valid])
+        with self._lock:
+            cached = np.array([self.scores.get(key, np.nan) for key in keys.tolist()])
+            todo   = np.flatnonzero(np.isnan(cached))
+            if len(todo):
+                # Duplicate feature rows share one score; score each once.
+                new_keys, first = np.unique(keys[todo], return_index=True)
+                rows = X.to_numpy()[valid[todo[first]]]
+                new_scores = np.concatenate([
+                    self.forest.decision_function(rows[start:start + SCORE_BATCH_ROWS])
+                    for start in range(0, len(rows), SCORE_BATCH_ROWS)
+                ])
+                fresh = dict(zip(new_keys.tolist(), new_scores.tolist()))
+                cached[todo] = [fresh[key] for key in keys[todo].tolist()]
+                self.scores.update(fresh)
+                self._evict()
+                self._log_scores(new_keys, new_scores)
+
+        scores[valid] = cached
+        return scores
+
+    def detect(self, df):
+        """``df`` with ``anomaly_score``, ``is_anomaly`` and ``shock_type`` columns.
+
+        Anomalies are rows with a negative score (``IsolationForest.predict``
+        == -1); they are spikes above the trailing 30-day demand and drops
+        below it.
+        """
+        scores     = self.score(df)
+        is_anomaly = scores < 0
+        qty, trailing = df["qty"].to_numpy(), df["rolling_demand_30d"].to_numpy()
+        shock_type = np.select(
+            [is_anomaly & (qty > trailing), is_anomaly & (qty < trailing)],
+            [SHOCK_TYPES.index("Demand Spike"), SHOCK_TYPES.index("Demand Drop")],
+            default=SHOCK_TYPES.index("Normal"),
+        )
+        return df.assign(
+            anomaly_score=scores,
+            is_anomaly=is_anomaly.astype(int),
+            shock_type=pd.Categorical.from_codes(shock_type, dtype=SHOCK_DTYPE),
+        )
+
+
+# ─────────────────────────────────────────────
+#  CLI
+# ─────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit and persist the IsolationForest shock detector.")
+    parser.add_argument("csv", help="Processed features CSV (the training set).")
+    parser.add_argument("--dataset", help="Training set name; defaults to the CSV's file name.")
+    parser.add_argument("--out", help="Where to save the detector; defaults to detector_path(dataset).")
+    args = parser.parse_args(argv)
+
+    dataset  = args.dataset or os.path.splitext(os.path.basename(args.csv))[0]
+    args.out = args.out or detector_path(dataset)
+    df       = pd.read_csv(args.csv)
+    detector = ShockDetector(args.out).fit(df, dataset=dataset)
+    detector.save()
+    counts   = detector.detect(df)["shock_type"].value_counts()
+    print(f"Saved {args.out}: " + ", ".join(f"{label} {counts[label]:,}" for label in SHOCK_TYPES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Hybrid override log for detected demand shocks."""
+
+import numpy as np
+
+from pricing_engine.hybrid import override_masks, override_prices
+
+OVERRIDE_COLUMNS = {
+    "month_year": "Date",
+    "product_id": "Product",
+    "qty"       : "Qty Sold",
+    "unit_price": "Price ($)",
+}
+
+
+def shock_mask(df):
+    """Model-based ``is_anomaly`` when the frame has been through the detector, else ``demand_shock``."""
+    flag = "is_anomaly" if "is_anomaly" in df.columns else "demand_shock"
+    return (df[flag] == 1).to_numpy()
+
+
+def split_shocks(df):
+    """``(normal, shocked)`` rows in date order, for the timeline chart."""
+    ordered = df.sort_values("month_year")
+    shocked = shock_mask(ordered)
+    return ordered[~shocked], ordered[shocked]
+
+
+def shock_override_table(df, surge_cap, discount_floor):
+    """One row per shocked observation with the override the hybrid system applies.
+
+    Spikes (or, without detector output, shocks priced below the
+    competitor) surge; the rest get the discount floor. ``Est. Profit
+    Impact`` is the hybrid profit minus the profit at the row's own price.
+    """
+    surge, discount = override_masks(df)
+    shocked  = surge | discount
+    shock_df = df[shocked]
+    surge, discount = surge[shocked], discount[shocked]
+
+    price = shock_df["unit_price"].to_numpy(dtype=float)
+    cost  = shock_df["estimated_cost"].to_numpy(dtype=float)
+    qty   = shock_df["qty"].to_numpy(dtype=float)
+    final = override_prices(price, shock_df["avg_competitor_price"], cost, surge, discount, surge_cap, discount_floor)
+
+    if "shock_type" in shock_df.columns:
+        event = shock_df["shock_type"].astype(str).to_numpy()
+    else:
+        event = "Demand Anomaly"
+    table = shock_df[[c for c in OVERRIDE_COLUMNS if c in shock_df.columns]].rename(columns=OVERRIDE_COLUMNS)
+    table = table.assign(**{
+        "Detected Event"    : event,
+        "Override Action"   : np.where(surge, f"SURGE PRICE  (+{surge_cap}%)", f"DISCOUNT FLOOR  (-{discount_floor}%)"),
+        "Override Price ($)": final.round(2),
+        "Est. Profit Impact": ((final - price) * qty).round(2),
+    })
+    return table.reset_index(drop=True)
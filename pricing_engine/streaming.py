@@ -0,0 +1,184 @@
+"""Chunked, bounded-memory ingestion of the raw Retail Price Optimization CSV.
+
+The file is read twice in ``chunksize`` slices:
+
+1. ``scan_demand_stats`` reads only ``product_id`` / ``qty`` and merges
+   per-chunk group moments (count, mean, M2) into running per-product
+   statistics, so the ``mean + 2*std`` shock threshold sees the full history.
+2. ``stream_features`` engineers each chunk, carrying the last
+   ``LONG_WINDOW`` rows of every product across chunk boundaries so the
+   lagged rolling windows and ``pct_change`` columns continue seamlessly.
+
+Memory is bounded by one chunk plus a small per-product state table. Rows of
+a product must arrive in chronological order across chunks (as they do in
+the monthly exports); within a chunk any order is fine.
+"""
+
+import numpy as np
+import pandas as pd
+
+from pricing_engine.features import (
+    COST_RATIO,
+    INVENTORY_SEED,
+    LONG_WINDOW,
+    PRICE_EPS,
+    SHOCK_STD_MULTIPLIER,
+    SHORT_WINDOW,
+    group_pct_change,
+    lagged_rolling_mean,
+    segment_starts,
+)
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# Raw columns a carried tail row needs to continue the windows.
+TAIL_COLUMNS = ["product_id", "month_year", "qty", "unit_price"]
+TAIL_DTYPES  = {"product_id": "str", "month_year": "datetime64[ns]", "qty": "float64", "unit_price": "float64"}
+
+
+# ─────────────────────────────────────────────
+#  SOURCE HANDLING
+# ─────────────────────────────────────────────
+def _read_chunks(source, chunksize, **kwargs):
+    """Yields CSV chunks from a path or a seekable file-like object."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    with pd.read_csv(source, chunksize=chunksize, **kwargs) as reader:
+        yield from reader
+
+
+# ─────────────────────────────────────────────
+#  PASS 1 — RUNNING DEMAND MOMENTS
+# ─────────────────────────────────────────────
+def merge_moments(left, right):
+    """Merges two per-product (count, mean, m2) tables with Chan's update."""
+    if left is None:
+        return right
+    left, right = left.align(right, join="outer", fill_value=0.0)
+    n     = left["count"] + right["count"]
+    safe  = n.where(n > 0, 1.0)
+    delta = right["mean"] - left["mean"]
+    return pd.DataFrame({
+        "count": n,
+        "mean" : left["mean"] + delta * right["count"] / safe,
+        "m2"   : left["m2"] + right["m2"] + delta ** 2 * left["count"] * right["count"] / safe,
+    })
+
+
+def chunk_moments(qty, keys):
+    """Per-product (count, mean, m2) of one chunk."""
+    grouped = qty.groupby(keys, sort=False)
+    count   = grouped.count().astype(float)
+    return pd.DataFrame({
+        "count": count,
+        "mean" : grouped.mean().fillna(0.0),
+        "m2"   : (grouped.var(ddof=0) * count).fillna(0.0),
+    })
+
+
+def shock_thresholds(moments, k=SHOCK_STD_MULTIPLIER):
+    """``mean + k * std`` (sample std) per product; NaN below two observations."""
+    std = np.sqrt(moments["m2"] / (moments["count"] - 1).where(moments["count"] > 1))
+    return moments["mean"] + k * std
+
+
+def scan_demand_stats(source, chunksize=DEFAULT_CHUNKSIZE):
+    """Reads ``product_id`` / ``qty`` only and returns per-product moments."""
+    moments = None
+    for chunk in _read_chunks(source, chunksize, usecols=["product_id", "qty"]):
+        moments = merge_moments(moments, chunk_moments(chunk["qty"], chunk["product_id"]))
+    return moments
+
+
+# ─────────────────────────────────────────────
+#  PASS 2 — CHUNKED FEATURE ENGINEERING
+# ─────────────────────────────────────────────
+def _check_chronological(chunk, tail):
+    """Raises if a product's rows go back in time across a chunk boundary."""
+    first_new = chunk.groupby("product_id", sort=False)["month_year"].min()
+    last_seen = tail.groupby("product_id", sort=False)["month_year"].max()
+    first_new, last_seen = first_new.align(last_seen, join="inner")
+    late = first_new < last_seen
+    if late.any():
+        raise ValueError(
+            "Streaming ingestion needs each product's rows in chronological order; "
+            f"out-of-order rows for: {', '.join(map(str, late[late].index[:5]))}"
+        )
+
+
+def stream_features(source, chunksize=DEFAULT_CHUNKSIZE, notebook_features=False, moments=None):
+    """Yields engineered chunks of the raw CSV at ``source``.
+
+    Columns match ``engineer_features``. Shock flags use the full-history
+    thresholds from ``scan_demand_stats`` (computed here unless ``moments``
+    is given). ``inventory_level`` is drawn in stream order, so it is not
+    the same draw as the batch path.
+    """
+    if moments is None:
+        moments = scan_demand_stats(source, chunksize)
+    thresholds = shock_thresholds(moments)
+    rng        = np.random.RandomState(INVENTORY_SEED)
+    tail       = None
+
+    for chunk in _read_chunks(source, chunksize):
+        features, tail = engineer_chunk(chunk, tail, thresholds, rng, notebook_features)
+        yield features
+
+
+def engineer_chunk(chunk, tail, thresholds, rng, notebook_features=False):
+    """Engineers one raw chunk, continuing windows from the carried ``tail``.
+
+    Returns the engineered rows and the new tail: the last ``LONG_WINDOW``
+    raw rows of every product in ``tail`` or ``chunk``.
+    """
+    chunk = chunk.assign(month_year=pd.to_datetime(chunk["month_year"], format='%d-%m-%Y', errors='coerce'))
+    # Undated rows sort last within their product in the batch path, so
+    # they never feed another row's window and are dropped at the end.
+    chunk = chunk[chunk["month_year"].notna()]
+    chunk = chunk.sort_values(['product_id', 'month_year']).reset_index(drop=True)
+
+    # Windows run over a narrow frame of carried tail + new rows; a stable
+    # sort keeps carried rows first and new rows in chunk order.
+    window = chunk[TAIL_COLUMNS].assign(_carried=False)
+    if tail is not None:
+        _check_chronological(chunk, tail)
+        window = pd.concat([tail.assign(_carried=True), window], ignore_index=True)
+    window = window.sort_values('product_id', kind='stable').reset_index(drop=True)
+    keys   = window['product_id']
+    starts = segment_starts(keys)
+
+    windowed = {'rolling_demand_30d': lagged_rolling_mean(window['qty'], keys, LONG_WINDOW, starts)}
+    if notebook_features:
+        windowed['rolling_demand_7d'] = lagged_rolling_mean(window['qty'], keys, SHORT_WINDOW, starts)
+        windowed['price_change']      = group_pct_change(window['unit_price'], keys)
+        windowed['demand_change']     = group_pct_change(window['qty'], keys)
+
+    fresh    = ~window['_carried'].to_numpy(dtype=bool)
+    windowed = {name: values.to_numpy()[fresh] for name, values in windowed.items()}
+    tail     = window.groupby('product_id', sort=False).tail(LONG_WINDOW)[TAIL_COLUMNS]
+    return _finish_chunk(chunk, windowed, thresholds, rng, notebook_features), tail.reset_index(drop=True)
+
+
+def _finish_chunk(df, windowed, thresholds, rng, notebook_features):
+    """Adds the row-local columns and drops incomplete rows, like the batch path."""
+    if 'comp_1' in df.columns:
+        df['avg_competitor_price'] = (df['comp_1'] + df['comp_2'] + df['comp_3']) / 3
+    else:
+        df['avg_competitor_price'] = df['unit_price'] * 1.05
+
+    df['rolling_demand_30d']  = windowed['rolling_demand_30d']
+    df['estimated_cost']      = df['unit_price'] * COST_RATIO
+    df['profit']              = (df['unit_price'] - df['estimated_cost']) * df['qty']
+    df['price_vs_competitor'] = df['unit_price'] / (df['avg_competitor_price'] + PRICE_EPS)
+    df['demand_shock']        = (df['qty'] > df['product_id'].map(thresholds)).astype(int)
+    df['inventory_level']     = (df['qty'] * rng.uniform(1.5, 4.0, len(df))).astype(int)
+
+    required = list(df.columns)
+    if notebook_features:
+        df['rolling_demand_7d'] = windowed['rolling_demand_7d']
+        df['demand_deviation']  = df['qty'] - df['rolling_demand_30d']
+        df['price_change']      = windowed['price_change']
+        df['demand_change']     = windowed['demand_change']
+        df['elasticity_score']  = df['demand_change'] / df['price_change']
+
+    return df.dropna(subset=required).reset_index(drop=True)
@@ -0,0 +1,103 @@
+"""Guardrail sweep: hybrid profit over every surge cap × discount floor.
+
+The overrides are separable: a surge cap only moves spike rows and a
+discount floor only drop rows, so the profit of a grid cell is
+
+    untouched rows + spike rows(cap) + drop rows(floor)
+
+Each term is one broadcast over the shocked rows only, and the grid is
+assembled from the outer sum instead of re-running ``strategy_profits``
+per cell. ``rl_steps`` adds the RL price step as a third axis: the
+agent's replayed actions are kept and re-priced with the new step.
+"""
+
+import numpy as np
+import pandas as pd
+
+from pricing_engine.hybrid import DROP_COST_FLOOR, SPIKE_COMPETITOR_CAP, override_masks
+
+SURGE_CAPS      = tuple(range(10, 55, 5))   # sidebar slider range, %
+DISCOUNT_FLOORS = tuple(range(10, 45, 5))   # sidebar slider range, %
+RL_STEPS        = (0.025, 0.05, 0.075, 0.10)
+
+
+def base_prices(replayed, rl_steps=None):
+    """``(n_steps, n_rows)`` prices the hybrid starts from.
+
+    Without ``rl_steps`` that is ``rl_price`` (the static price where there
+    is none). Otherwise each row's replayed action moves the static price
+    by each step size, clipped as in the RL environment.
+    """
+    unit_price = replayed["unit_price"].to_numpy(dtype=float)
+    if "action" not in replayed.columns:
+        return unit_price[None, :]
+    if rl_steps is None:
+        return np.where(replayed["rl_price"].isna(), unit_price, replayed["rl_price"].to_numpy(dtype=float))[None, :]
+
+    from pricing_engine.rl.env import COMPETITOR_CAP, COST_FLOOR
+    from pricing_engine.rl.inference import HOLD
+
+    codes     = replayed["action"].cat.codes.to_numpy()
+    direction = np.where(codes < 0, 0, codes - HOLD)
+    moved     = unit_price * (1 + np.outer(rl_steps, direction))
+    repriced  = np.clip(
+        moved,
+        replayed["estimated_cost"].to_numpy(dtype=float) * COST_FLOOR,
+        replayed["avg_competitor_price"].to_numpy(dtype=float) * COMPETITOR_CAP,
+    )
+    return np.where(codes < 0, unit_price, repriced)
+
+
+def sweep_guardrails(replayed, surge_caps=SURGE_CAPS, discount_floors=DISCOUNT_FLOORS, rl_steps=None):
+    """Hybrid outcome for every grid cell of a ``backtest.replay`` frame.
+
+    One row per ``(rl_step, surge_cap, discount_floor)`` with the total
+    hybrid profit, its change vs static pricing, and how many overridden
+    rows hit the competitor cap or the cost floor instead of the
+    percentage. ``rl_step`` is NaN when the replayed RL prices are used.
+    """
+    caps   = np.asarray(surge_caps, dtype=float)
+    floors = np.asarray(discount_floors, dtype=float)
+    base   = base_prices(replayed, rl_steps)
+
+    cost            = replayed["estimated_cost"].to_numpy(dtype=float)
+    qty             = replayed["qty"].to_numpy(dtype=float)
+    competitor      = replayed["avg_competitor_price"].to_numpy(dtype=float)
+    surge, discount = override_masks(replayed)
+    untouched       = ~(surge | discount)
+
+    # (steps,) + (steps, caps) + (steps, floors), each over its own rows.
+    kept_profit = ((base[:, untouched] - cost[untouched]) * qty[untouched]).sum(axis=1)
+
+    surged  = base[:, None, surge] * (1 + caps[None, :, None] / 100)
+    ceiling = competitor[surge] * SPIKE_COMPETITOR_CAP
+    surge_profit = ((np.minimum(surged, ceiling) - cost[surge]) * qty[surge]).sum(axis=2)
+    capped       = (surged > ceiling).sum(axis=2)
+
+    discounted = base[:, None, discount] * (1 - floors[None, :, None] / 100)
+    floor      = cost[discount] * DROP_COST_FLOOR
+    drop_profit = ((np.maximum(discounted, floor) - cost[discount]) * qty[discount]).sum(axis=2)
+    floored     = (discounted < floor).sum(axis=2)
+
+    profit = kept_profit[:, None, None] + surge_profit[:, :, None] + drop_profit[:, None, :]
+    shape  = profit.shape
+    static_profit = float(replayed["static_profit"].sum())
+    steps  = np.full(len(base), np.nan) if rl_steps is None else np.asarray(rl_steps, dtype=float)
+
+    grid = pd.DataFrame({
+        "rl_step"         : np.repeat(steps, len(caps) * len(floors)),
+        "surge_cap"       : np.tile(np.repeat(caps, len(floors)), len(steps)).astype(int),
+        "discount_floor"  : np.tile(floors, len(steps) * len(caps)).astype(int),
+        "hybrid_profit"   : profit.ravel(),
+        "surged"          : int(surge.sum()),
+        "discounted"      : int(discount.sum()),
+        "surge_capped"    : np.broadcast_to(capped[:, :, None], shape).ravel(),
+        "discount_floored": np.broadcast_to(floored[:, None, :], shape).ravel(),
+    })
+    grid["improvement"] = ((grid["hybrid_profit"] / static_profit - 1) * 100).round(2) if static_profit else np.nan
+    return grid
+
+
+def best_guardrails(grid):
+    """The grid row with the highest hybrid profit."""
+    return grid.loc[grid["hybrid_profit"].idxmax()]
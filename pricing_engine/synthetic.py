@@ -0,0 +1,38 @@
+"""Synthetic engineered frame for the dashboard's demo mode."""
+
+import numpy as np
+import pandas as pd
+
+
+def generate_synthetic_data():
+    """624 seeded rows in the engineered schema (fixed seed)."""
+    np.random.seed(42)
+    n = 624
+    products    = [f"prod_{i}" for i in range(1, 21)]
+    categories  = ["electronics", "furniture", "health", "computers", "watches", "perfumery"]
+    # One extra month so 20 copies of the range cover all ``n`` rows.
+    dates       = pd.date_range("2017-05-01", periods=n // 20 + 1, freq="MS").tolist() * 20
+    dates       = sorted(dates[:n])
+
+    df = pd.DataFrame({
+        "product_id"           : np.random.choice(products, n),
+        "product_category_name": np.random.choice(categories, n),
+        "month_year"           : dates,
+        "unit_price"           : np.random.uniform(20, 360, n).round(2),
+        "qty"                  : np.random.randint(1, 60, n),
+        "avg_competitor_price" : np.random.uniform(18, 340, n).round(2),
+        "product_score"        : np.random.uniform(3.0, 5.0, n).round(1),
+        "freight_price"        : np.random.uniform(5, 30, n).round(2),
+        "rolling_demand_30d"   : np.random.uniform(5, 40, n).round(2),
+        "demand_deviation"     : np.random.uniform(-20, 20, n).round(2),
+        "is_holiday_season"    : np.random.randint(0, 2, n),
+    })
+    df["estimated_cost"]       = (df["unit_price"] * 0.60).round(2)
+    df["profit"]               = ((df["unit_price"] - df["estimated_cost"]) * df["qty"]).round(2)
+    df["price_vs_competitor"]  = (df["unit_price"] / df["avg_competitor_price"]).round(3)
+    df["demand_shock"]         = (
+        (df["qty"] > df["qty"].mean() + 2 * df["qty"].std()) |
+        (df["qty"] < df["qty"].mean() - 2 * df["qty"].std())
+    ).astype(int)
+    df["inventory_level"]      = (df["qty"] * np.random.uniform(1.5, 4.0, n)).astype(int)
+    return df